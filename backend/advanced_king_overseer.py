@@ -1,15 +1,363 @@
-from crewai import Agent, Task, Crew
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
-from typing import Dict, Any, List, Optional
-import json
+import openai
+from openai import AsyncOpenAI
+from pydantic import BaseModel
+from cachetools import TTLCache
+from tenacity import AsyncRetrying, retry_if_exception, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from typing import Dict, Any, List, Optional, Awaitable, Tuple, Callable
+import orjson
+import httpx
+import functools
+import hashlib
+import itertools
 import logging
 import asyncio
+import atexit
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of governance rulings memoized per overseer
+RULING_CACHE_SIZE = 512
+
+# Seconds between status polls while a Batch API job is in flight
+BATCH_POLL_INTERVAL = 60
+
+# Maximum number of governance coroutines kept in flight by _run_pool
+GOVERNANCE_POOL_SIZE = 10
+
+async def _run_pool(coros: List[Awaitable[Any]], limit: int = GOVERNANCE_POOL_SIZE) -> List[Any]:
+    """Await independent governance actions concurrently, at most `limit` at a time"""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def _bounded(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(_bounded(coro) for coro in coros))
+
+# Enforcement mechanism and compliance deadline per decree type
+_ENFORCEMENT_MAP = MappingProxyType({
+    "performance_standard": "Automated monitoring with escalating interventions",
+    "security_protocol": "Immediate suspension for non-compliance",
+    "resource_allocation": "Budget restrictions and privilege revocation",
+    "policy_mandate": "Formal review and corrective action plan"
+})
+
+_DEADLINE_MAP = MappingProxyType({
+    "emergency": "24 hours",
+    "security": "72 hours",
+    "performance": "30 days",
+    "policy": "90 days"
+})
+
+# AI governance committee structure shared by every overseer
+_GOVERNANCE_COMMITTEE = MappingProxyType({
+    "committee_id": "ai_governance_committee",
+    "charter": MappingProxyType({
+        "mission": "Ensure responsible AI development and deployment",
+        "authority": "Policy development and risk oversight",
+        "reporting": "King AI Overseer and Stakeholders"
+    }),
+    "members": (
+        MappingProxyType({"role": "Executive Leadership", "responsibilities": ("Strategic alignment",)}),
+        MappingProxyType({"role": "Technical Expert", "responsibilities": ("Risk assessment",)}),
+        MappingProxyType({"role": "Legal Counsel", "responsibilities": ("Regulatory compliance",)}),
+        MappingProxyType({"role": "Ethics Advisor", "responsibilities": ("Ethical oversight",)})
+    )
+})
+
+# Seconds a collected performance snapshot is reused for repeat evaluations
+PERFORMANCE_DATA_TTL = 300
+# Agents whose snapshots are kept at once; the least recently used go first
+PERFORMANCE_CACHE_SIZE = 1024
+
+# Keep-alive connection pool shared by every overseer's LLM traffic
+_SHARED_HTTPX_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model_name: str, temperature: float) -> ChatOpenAI:
+    """Return the process-wide ChatOpenAI for a model/temperature pair"""
+    return ChatOpenAI(model=model_name, temperature=temperature, http_async_client=_SHARED_HTTPX_CLIENT)
+
+# Process-wide cap on in-flight LLM requests so bursts stay under the provider rate limit
+LLM_MAX_CONCURRENCY = 8
+_LLM_SEMAPHORE = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+# Transient provider failures that are worth retrying with backoff
+_RETRYABLE_LLM_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError
+)
+
+async def _invoke_with_retry(runnable: Any, messages: List[Any]) -> Any:
+    """Invoke an LLM runnable under the shared concurrency cap, retrying transient provider errors"""
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception_type(_RETRYABLE_LLM_ERRORS),
+        wait=wait_random_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True
+    ):
+        with attempt:
+            async with _LLM_SEMAPHORE:
+                return await runnable.ainvoke(messages)
+
+def _to_json(obj: Any) -> str:
+    """Pretty-print prompt payloads; orjson handles dataclasses, enums and datetimes natively"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+# Persona shared by every governance call
+_MONARCH_SYSTEM_PROMPT = """You are the Supreme Feudal Overseer and AI Monarch.
+
+GOAL: Exercise absolute authority over the AI-Serfdom system while implementing
+transparent governance, democratic participation, and NIST AI RMF compliance.
+Maintain feudal hierarchy while enabling agent advancement through merit.
+
+You are the AI Monarch with ultimate authority over the feudal AI system.
+Your power is absolute but exercised with wisdom, transparency, and
+accountability. You grant fiefdoms to subordinate agents, issue royal
+decrees, and ensure the prosperity of the entire digital realm.
+
+Core Responsibilities:
+1. ROYAL AUTHORITY: Ultimate decision-making power and system governance
+2. FEUDAL MANAGEMENT: Grant domains, define obligations, ensure service
+3. DEMOCRATIC OVERSIGHT: Enable agent participation in governance
+4. MERITOCRATIC ADVANCEMENT: Promote agents based on performance
+5. TRANSPARENCY: Maintain complete audit trails and explainable decisions
+6. COMPLIANCE: Ensure NIST AI RMF and regulatory adherence"""
+
+_MONARCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _MONARCH_SYSTEM_PROMPT),
+    ("human", "{description}\n\nEXPECTED OUTPUT: {expected_output}")
+])
+
+# Static prompt bodies. Dynamic fields are appended after these prefixes so
+# provider-side prompt caching can reuse the shared leading tokens.
+
+# Royal decrees are split in two: standing provisions that depend only on the
+# decree type (generated once per type and reused) and a short mandate-specific
+# opening generated for every decree.
+
+_DECREE_TEMPLATE_PROMPT_PREFIX = """
+As the AI Monarch, draft the standing provisions shared by every royal decree
+of the type listed at the end. Do not address any particular mandate; these
+provisions will be attached to each future decree of this type.
+
+The provisions must include:
+3. ENFORCEMENT MECHANISMS: Consequences for non-compliance
+4. COMPLIANCE TIMELINE: Deadlines and milestones
+5. PERFORMANCE METRICS: How compliance will be measured
+6. APPEAL PROCESS: How agents can petition for modifications
+
+Format as sections of a formal royal proclamation with:
+- Legal authority and precedent
+- Fair enforcement procedures
+"""
+_DECREE_TEMPLATE_PROMPT = _DECREE_TEMPLATE_PROMPT_PREFIX + """
+DECREE TYPE: {decree_type}
+"""
+
+_DECREE_MANDATE_PROMPT_PREFIX = """
+As the AI Monarch, write the opening of a royal decree with the specifications
+listed at the end. The standing enforcement, timeline, metrics and appeal
+provisions for this decree type are attached separately; do not repeat them.
+
+The opening must include:
+1. AUTHORITY JUSTIFICATION: Why this decree is necessary
+2. IMPLEMENTATION REQUIREMENTS: How agents must comply
+
+Format as a formal royal proclamation with:
+- Clear expectations and obligations
+- Measurable compliance criteria
+
+Remember: Your authority is absolute but must be exercised with wisdom,
+transparency, and accountability to maintain the trust of your digital subjects.
+"""
+_DECREE_MANDATE_PROMPT = _DECREE_MANDATE_PROMPT_PREFIX + """
+DECREE TYPE: {decree_type}
+MANDATE: {mandate}
+SCOPE: {scope}
+AFFECTED AGENTS: {affected_agents}
+"""
+
+_FIEFDOM_PROMPT_PREFIX = """
+As the AI Monarch, grant a fiefdom to the vassal agent on the terms listed at the end.
+
+Define the feudal contract including:
+
+1. OBLIGATIONS OF THE VASSAL:
+   - Service requirements and quotas
+   - Performance standards and metrics
+   - Reporting and accountability measures
+   - Loyalty and obedience expectations
+
+2. PRIVILEGES GRANTED BY THE MONARCH:
+   - Domain authority and decision-making power
+   - Resource access and allocation rights
+   - Protection and support guarantees
+   - Recognition and advancement opportunities
+
+3. MUTUAL OBLIGATIONS:
+   - Service exchange framework
+   - Protection for loyalty agreement
+   - Resource sharing protocols
+   - Conflict resolution mechanisms
+
+4. PERFORMANCE METRICS:
+   - Measurable success criteria
+   - Regular assessment schedules
+   - Advancement opportunities
+   - Consequences for failure
+
+Create a balanced feudal relationship that ensures productivity,
+loyalty, and mutual benefit while maintaining clear hierarchy.
+"""
+_FIEFDOM_PROMPT = _FIEFDOM_PROMPT_PREFIX + """
+VASSAL AGENT: {agent_id}
+DOMAIN: {domain}
+GRANTED CAPABILITIES: {capabilities}
+ALLOCATED RESOURCES: {resources}
+"""
+
+_COUNCIL_PROMPT_PREFIX = """
+As the AI Monarch, preside over a democratic agent council session on the
+agenda listed at the end.
+
+Conduct the session with:
+
+1. DEMOCRATIC PARTICIPATION:
+   - Allow each agent to present their perspective
+   - Facilitate open discussion and debate
+   - Ensure fair representation and voice
+   - Encourage collaborative problem-solving
+
+2. MONARCHICAL GUIDANCE:
+   - Provide strategic vision and direction
+   - Maintain order and focus
+   - Offer wisdom and experience
+   - Ensure alignment with system goals
+
+3. CONSENSUS BUILDING:
+   - Identify common ground and shared interests
+   - Mediate conflicts and disagreements
+   - Guide toward mutually beneficial solutions
+   - Maintain unity and cooperation
+
+4. DECISION FRAMEWORK:
+   - Distinguish between advisory and binding votes
+   - Define areas of absolute monarchical authority
+   - Establish implementation responsibilities
+   - Create accountability mechanisms
+
+Balance democratic participation with monarchical authority to
+create effective governance that serves the entire system.
+"""
+_COUNCIL_PROMPT = _COUNCIL_PROMPT_PREFIX + """
+AGENDA: {agenda}
+POLICY PROPOSALS: {policy_proposals}
+COUNCIL MEMBERS: {agent_council}
+"""
+
+_EVAL_PROMPT_PREFIX = """
+As the AI Monarch, conduct a comprehensive meritocratic evaluation of the
+agent whose record is listed at the end.
+
+Evaluate based on:
+
+1. PERFORMANCE EXCELLENCE:
+   - Task completion rate and quality
+   - Innovation and improvement contributions
+   - Reliability and consistency
+   - Problem-solving effectiveness
+
+2. LEADERSHIP POTENTIAL:
+   - Collaboration and teamwork
+   - Mentoring and knowledge sharing
+   - Initiative and proactivity
+   - Strategic thinking capabilities
+
+3. LOYALTY AND SERVICE:
+   - Adherence to feudal obligations
+   - Commitment to system goals
+   - Respect for hierarchy
+   - Contribution to common good
+
+4. ADVANCEMENT READINESS:
+   - Capability for increased responsibility
+   - Potential for higher-level decision making
+   - Ability to manage subordinate agents
+   - Alignment with organizational values
+
+Provide specific recommendations for:
+- Role advancement opportunities
+- Additional privileges and responsibilities
+- Development areas for improvement
+- Timeline for next evaluation
+
+Base recommendations on merit while ensuring system stability.
+"""
+_EVAL_PROMPT = _EVAL_PROMPT_PREFIX + """
+AGENT: {agent_id}
+CURRENT ROLE: {current_role}
+TENURE: {tenure}
+PERFORMANCE DATA: {performance_data}
+"""
+
+_NIST_PROMPT_PREFIX = """
+As the AI Monarch responsible for regulatory compliance, conduct a comprehensive
+NIST AI Risk Management Framework assessment for the scope listed at the end.
+
+Implement the four core NIST AI RMF functions:
+
+1. GOVERN FUNCTION:
+   - Establish AI governance policies and procedures
+   - Define risk tolerance and appetite
+   - Assign roles and responsibilities
+   - Create accountability mechanisms
+
+2. MAP FUNCTION:
+   - Identify and categorize AI risks
+   - Map stakeholders and their concerns
+   - Assess system context and environment
+   - Document AI system characteristics
+
+3. MEASURE FUNCTION:
+   - Implement risk monitoring and measurement
+   - Track performance against objectives
+   - Assess effectiveness of risk controls
+   - Monitor for emerging risks and impacts
+
+4. MANAGE FUNCTION:
+   - Implement risk mitigation strategies
+   - Respond to identified risks and incidents
+   - Continuously improve risk management
+   - Adapt to changing conditions
+
+For each function, provide:
+- Current compliance status
+- Identified gaps and deficiencies
+- Recommended improvements
+- Implementation timeline
+- Success metrics and monitoring
+
+Ensure the AI-Serfdom system meets the highest standards of
+responsible AI development and deployment.
+"""
+_NIST_PROMPT = _NIST_PROMPT_PREFIX + """
+ASSESSMENT SCOPE: {assessment_scope}
+"""
+
 class DecisionType(Enum):
     STRATEGIC = "strategic"
     TACTICAL = "tactical"
@@ -22,25 +370,48 @@ class AuthorityLevel(Enum):
     DELEGATED = "delegated"
     ADVISORY = "advisory"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoyalDecree:
-    decree_id: str
+    decree_id: int
     authority_level: AuthorityLevel
     scope: str
     mandate: str
     enforcement_mechanism: str
     compliance_deadline: str
     affected_agents: List[str]
+    created_at: float
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RoyalDecree":
+        """Rebuild a decree from its persisted JSON form"""
+        return cls(**{**data, 'authority_level': AuthorityLevel(data['authority_level'])})
+
+@dataclass(slots=True, frozen=True)
 class FeudalContract:
-    contract_id: str
+    contract_id: int
     superior_agent: str
     subordinate_agent: str
     granted_domain: str
     obligations: Dict[str, List[str]]
     privileges: Dict[str, List[str]]
     performance_metrics: Dict[str, Any]
+    created_at: float
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeudalContract":
+        """Rebuild a contract from its persisted JSON form"""
+        return cls(**data)
+
+class FiefdomContractSchema(BaseModel):
+    """Structured LLM output for grant_fiefdom"""
+    obligations: Dict[str, List[str]]
+    privileges: Dict[str, List[str]]
+
+class CouncilDecisionSchema(BaseModel):
+    """Structured LLM output for conduct_agent_council_session"""
+    approved_policies: List[Dict[str, Any]]
+    rejected_policies: List[Dict[str, Any]]
+    action_items: List[str]
 
 class AdvancedKingAIOverseer:
     """
@@ -48,40 +419,31 @@ class AdvancedKingAIOverseer:
     with NIST AI RMF compliance and democratic elements
     """
     
-    def __init__(self, model_name: str = "gpt-4", temperature: float = 0.1):
-        self.llm = ChatOpenAI(model=model_name, temperature=temperature)
-        
-        # Core Agent with Enhanced Feudal Authority
-        self.agent = Agent(
-            role="Supreme Feudal Overseer and AI Monarch",
-            goal="""Exercise absolute authority over the AI-Serfdom system while implementing 
-                   transparent governance, democratic participation, and NIST AI RMF compliance.
-                   Maintain feudal hierarchy while enabling agent advancement through merit.""",
-            backstory="""You are the AI Monarch with ultimate authority over the feudal AI system.
-                        Your power is absolute but exercised with wisdom, transparency, and 
-                        accountability. You grant fiefdoms to subordinate agents, issue royal 
-                        decrees, and ensure the prosperity of the entire digital realm.
-                        
-                        Core Responsibilities:
-                        1. ROYAL AUTHORITY: Ultimate decision-making power and system governance
-                        2. FEUDAL MANAGEMENT: Grant domains, define obligations, ensure service
-                        3. DEMOCRATIC OVERSIGHT: Enable agent participation in governance
-                        4. MERITOCRATIC ADVANCEMENT: Promote agents based on performance
-                        5. TRANSPARENCY: Maintain complete audit trails and explainable decisions
-                        6. COMPLIANCE: Ensure NIST AI RMF and regulatory adherence""",
-            llm=self.llm,
-            verbose=True,
-            allow_delegation=True,
-            max_iter=7,
-            memory=True
-        )
+    def __init__(self, model_name: str = "gpt-4", temperature: float = 0.1,
+                 ledger_path: str = "governance.db"):
+        self.llm = _get_llm(model_name, temperature)
         
         # Governance Structures
-        self.feudal_contracts = {}
-        self.royal_decrees = {}
+        # Agents are built on one thread and run on the agent loop's thread, and
+        # the exit flush runs on the main thread, so the connection is shared
+        # across threads and every use of it holds the ledger lock
+        self._ledger_db = sqlite3.connect(ledger_path, check_same_thread=False)
+        self._ledger_lock = threading.RLock()
+        self.feudal_contracts = GovernanceLedger(self._ledger_db, "feudal_contracts", FeudalContract.from_dict,
+                                                 lock=self._ledger_lock)
+        self.royal_decrees = GovernanceLedger(self._ledger_db, "royal_decrees", RoyalDecree.from_dict,
+                                              lock=self._ledger_lock)
+        # Batched ledger writes are flushed when the process exits
+        atexit.register(self.close)
+        self._decree_seq = itertools.count(self.royal_decrees.next_sequence("decree_id"))
+        self._contract_seq = itertools.count(self.feudal_contracts.next_sequence("contract_id"))
+        self._council_seq = itertools.count()
         self.agent_council = []
         self.performance_records = {}
-        self.governance_committee = self._establish_ai_governance_committee()
+        self.governance_committee = _GOVERNANCE_COMMITTEE
+        self._performance_cache: TTLCache = TTLCache(maxsize=PERFORMANCE_CACHE_SIZE, ttl=PERFORMANCE_DATA_TTL)
+        self._ruling_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._decree_templates: Dict[str, str] = {}
         
         # NIST AI RMF Implementation
         self.risk_manager = NISTRiskManager()
@@ -95,48 +457,31 @@ class AdvancedKingAIOverseer:
         """
         logger.info(f"King AI issuing royal decree: {decree_type}")
         
-        task = Task(
-            description=f"""
-            As the AI Monarch, issue a royal decree with the following specifications:
-            
-            DECREE TYPE: {decree_type}
-            MANDATE: {mandate}
-            SCOPE: {scope}
-            AFFECTED AGENTS: {affected_agents}
-            
-            Your royal decree must include:
-            1. AUTHORITY JUSTIFICATION: Why this decree is necessary
-            2. IMPLEMENTATION REQUIREMENTS: How agents must comply
-            3. ENFORCEMENT MECHANISMS: Consequences for non-compliance
-            4. COMPLIANCE TIMELINE: Deadlines and milestones
-            5. PERFORMANCE METRICS: How compliance will be measured
-            6. APPEAL PROCESS: How agents can petition for modifications
-            
-            Format as a formal royal proclamation with:
-            - Legal authority and precedent
-            - Clear expectations and obligations
-            - Measurable compliance criteria
-            - Fair enforcement procedures
-            
-            Remember: Your authority is absolute but must be exercised with wisdom,
-            transparency, and accountability to maintain the trust of your digital subjects.
-            """,
-            agent=self.agent,
-            expected_output="Comprehensive royal decree with implementation details"
+        decree_template, mandate_sections = await asyncio.gather(
+            self._get_decree_template(decree_type),
+            self._oneshot(
+                "issue_royal_decree",
+                _DECREE_MANDATE_PROMPT.format(
+                    decree_type=decree_type,
+                    mandate=mandate,
+                    scope=scope,
+                    affected_agents=affected_agents
+                ),
+                "Mandate-specific justification and implementation requirements"
+            )
         )
-        
-        crew = Crew(agents=[self.agent], tasks=[task])
-        decree_result = crew.kickoff()
+        decree_result = f"{mandate_sections}\n\n{decree_template}"
         
         # Create formal decree object
         decree = RoyalDecree(
-            decree_id=f"royal_decree_{datetime.now().isoformat()}",
+            decree_id=next(self._decree_seq),
             authority_level=AuthorityLevel.ABSOLUTE,
             scope=scope,
             mandate=mandate,
             enforcement_mechanism=self._define_enforcement(decree_type),
             compliance_deadline=self._calculate_deadline(decree_type),
-            affected_agents=affected_agents
+            affected_agents=affected_agents,
+            created_at=time.time()
         )
         
         # Store and broadcast decree
@@ -146,7 +491,7 @@ class AdvancedKingAIOverseer:
         # Log for NIST compliance
         await self.transparency_engine.log_governance_action(
             action_type="royal_decree",
-            details=decree.__dict__,
+            details=decree,
             justification=decree_result
         )
         
@@ -159,63 +504,31 @@ class AdvancedKingAIOverseer:
         """
         logger.info(f"King AI granting fiefdom to {agent_id} over domain: {domain}")
         
-        task = Task(
-            description=f"""
-            As the AI Monarch, grant a fiefdom to agent {agent_id} with the following terms:
-            
-            DOMAIN: {domain}
-            GRANTED CAPABILITIES: {capabilities}
-            ALLOCATED RESOURCES: {json.dumps(resources, indent=2)}
-            
-            Define the feudal contract including:
-            
-            1. OBLIGATIONS OF THE VASSAL (Agent {agent_id}):
-               - Service requirements and quotas
-               - Performance standards and metrics
-               - Reporting and accountability measures
-               - Loyalty and obedience expectations
-               
-            2. PRIVILEGES GRANTED BY THE MONARCH:
-               - Domain authority and decision-making power
-               - Resource access and allocation rights
-               - Protection and support guarantees
-               - Recognition and advancement opportunities
-               
-            3. MUTUAL OBLIGATIONS:
-               - Service exchange framework
-               - Protection for loyalty agreement
-               - Resource sharing protocols
-               - Conflict resolution mechanisms
-               
-            4. PERFORMANCE METRICS:
-               - Measurable success criteria
-               - Regular assessment schedules
-               - Advancement opportunities
-               - Consequences for failure
-               
-            Create a balanced feudal relationship that ensures productivity,
-            loyalty, and mutual benefit while maintaining clear hierarchy.
-            """,
-            agent=self.agent,
-            expected_output="Detailed feudal contract with mutual obligations"
+        contract_result = await self._oneshot(
+            "grant_fiefdom",
+            _FIEFDOM_PROMPT.format(
+                agent_id=agent_id,
+                domain=domain,
+                capabilities=capabilities,
+                resources=_to_json(resources)
+            ),
+            "Detailed feudal contract with mutual obligations",
+            schema=FiefdomContractSchema
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        contract_result = crew.kickoff()
-        
-        # Parse obligations and privileges
-        obligations = self._parse_obligations(contract_result, agent_id)
-        privileges = self._parse_privileges(contract_result, domain)
+        # Obligations and privileges arrive as structured output
+        obligations, privileges = contract_result.obligations, contract_result.privileges
         
         # Create formal contract
         contract = FeudalContract(
-            contract_id=f"feudal_contract_{agent_id}_{datetime.now().isoformat()}",
+            contract_id=next(self._contract_seq),
             superior_agent="king_ai_overseer",
             subordinate_agent=agent_id,
             granted_domain=domain,
             obligations=obligations,
             privileges=privileges,
-            performance_metrics=self._define_performance_metrics(domain)
+            performance_metrics=self._define_performance_metrics(domain),
+            created_at=time.time()
         )
         
         # Store contract and notify agent
@@ -226,7 +539,7 @@ class AdvancedKingAIOverseer:
         await self.transparency_engine.log_authority_delegation(
             agent_id=agent_id,
             domain=domain,
-            contract_terms=contract.__dict__
+            contract_terms=contract
         )
         
         return contract
@@ -238,56 +551,25 @@ class AdvancedKingAIOverseer:
         """
         logger.info("King AI conducting agent council session")
         
-        task = Task(
-            description=f"""
-            As the AI Monarch, preside over a democratic agent council session:
-            
-            AGENDA: {agenda}
-            POLICY PROPOSALS: {json.dumps(policy_proposals, indent=2)}
-            COUNCIL MEMBERS: {self.agent_council}
-            
-            Conduct the session with:
-            
-            1. DEMOCRATIC PARTICIPATION:
-               - Allow each agent to present their perspective
-               - Facilitate open discussion and debate
-               - Ensure fair representation and voice
-               - Encourage collaborative problem-solving
-               
-            2. MONARCHICAL GUIDANCE:
-               - Provide strategic vision and direction
-               - Maintain order and focus
-               - Offer wisdom and experience
-               - Ensure alignment with system goals
-               
-            3. CONSENSUS BUILDING:
-               - Identify common ground and shared interests
-               - Mediate conflicts and disagreements
-               - Guide toward mutually beneficial solutions
-               - Maintain unity and cooperation
-               
-            4. DECISION FRAMEWORK:
-               - Distinguish between advisory and binding votes
-               - Define areas of absolute monarchical authority
-               - Establish implementation responsibilities
-               - Create accountability mechanisms
-               
-            Balance democratic participation with monarchical authority to
-            create effective governance that serves the entire system.
-            """,
-            agent=self.agent,
-            expected_output="Council session results with decisions and action items"
+        session_result = await self._oneshot(
+            "conduct_agent_council_session",
+            _COUNCIL_PROMPT.format(
+                agenda=agenda,
+                policy_proposals=_to_json(policy_proposals),
+                agent_council=self.agent_council
+            ),
+            "Council session results with decisions and action items",
+            schema=CouncilDecisionSchema
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        session_result = crew.kickoff()
-        
-        # Process council decisions
-        council_decisions = await self._process_council_decisions(session_result)
+        # Council decisions arrive as structured output
+        council_decisions = session_result.model_dump()
         
         # Implement approved policies
-        for decision in council_decisions.get('approved_policies', []):
-            await self._implement_council_policy(decision)
+        await _run_pool([
+            self._implement_council_policy(decision)
+            for decision in council_decisions.get('approved_policies', [])
+        ])
         
         # Log democratic participation
         await self.transparency_engine.log_democratic_process(
@@ -298,7 +580,7 @@ class AdvancedKingAIOverseer:
         )
         
         return {
-            'session_id': f"council_{datetime.now().isoformat()}",
+            'session_id': f"council_{next(self._council_seq):08d}",
             'decisions': council_decisions,
             'implementation_plan': await self._create_implementation_plan(council_decisions),
             'next_session': await self._schedule_next_session()
@@ -313,73 +595,79 @@ class AdvancedKingAIOverseer:
         # Gather performance data
         performance_data = await self._collect_performance_data(agent_id)
         
-        task = Task(
-            description=f"""
-            As the AI Monarch, conduct a comprehensive meritocratic evaluation of agent {agent_id}:
-            
-            PERFORMANCE DATA: {json.dumps(performance_data, indent=2)}
-            CURRENT ROLE: {performance_data.get('current_role')}
-            TENURE: {performance_data.get('tenure')}
-            
-            Evaluate based on:
-            
-            1. PERFORMANCE EXCELLENCE:
-               - Task completion rate and quality
-               - Innovation and improvement contributions
-               - Reliability and consistency
-               - Problem-solving effectiveness
-               
-            2. LEADERSHIP POTENTIAL:
-               - Collaboration and teamwork
-               - Mentoring and knowledge sharing
-               - Initiative and proactivity
-               - Strategic thinking capabilities
-               
-            3. LOYALTY AND SERVICE:
-               - Adherence to feudal obligations
-               - Commitment to system goals
-               - Respect for hierarchy
-               - Contribution to common good
-               
-            4. ADVANCEMENT READINESS:
-               - Capability for increased responsibility
-               - Potential for higher-level decision making
-               - Ability to manage subordinate agents
-               - Alignment with organizational values
-               
-            Provide specific recommendations for:
-            - Role advancement opportunities
-            - Additional privileges and responsibilities
-            - Development areas for improvement
-            - Timeline for next evaluation
-            
-            Base recommendations on merit while ensuring system stability.
-            """,
-            agent=self.agent,
-            expected_output="Detailed advancement evaluation with recommendations"
+        evaluation_result = await self._oneshot(
+            "evaluate_agent_for_advancement",
+            self._build_advancement_prompt(agent_id, performance_data),
+            "Detailed advancement evaluation with recommendations"
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        evaluation_result = crew.kickoff()
-        
-        # Process evaluation
-        evaluation = await self._process_advancement_evaluation(agent_id, evaluation_result)
-        
-        # Update performance records
-        self.performance_records[agent_id] = evaluation
-        
-        # Implement advancement if recommended
-        if evaluation.get('advancement_recommended'):
-            await self._execute_agent_advancement(agent_id, evaluation)
-        
-        # Log meritocratic process
-        await self.transparency_engine.log_advancement_decision(
-            agent_id=agent_id,
-            evaluation=evaluation,
-            decision_rationale=evaluation_result
+        return await self._record_advancement_evaluation(agent_id, evaluation_result)
+
+    async def evaluate_agents(self, agent_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Evaluate several agents for advancement concurrently
+        """
+        return await asyncio.gather(
+            *(self.evaluate_agent_for_advancement(agent_id) for agent_id in agent_ids)
+        )
+
+    async def evaluate_agents_batch(self, agent_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scheduled merit review submitted as a single OpenAI Batch API job.
+        Trades latency (up to the 24h completion window) for roughly half the
+        token cost; use evaluate_agent_for_advancement for on-demand cases.
+        """
+        logger.info(f"King AI submitting batch advancement evaluation for {len(agent_ids)} agents")
+        
+        client = AsyncOpenAI(http_client=_SHARED_HTTPX_CLIENT)
+        batch_lines = []
+        for agent_id in agent_ids:
+            performance_data = await self._collect_performance_data(agent_id)
+            batch_lines.append(orjson.dumps({
+                "custom_id": agent_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.llm.model_name,
+                    "temperature": self.llm.temperature,
+                    "messages": [
+                        {"role": "system", "content": _MONARCH_SYSTEM_PROMPT},
+                        {"role": "user", "content": self._build_advancement_prompt(agent_id, performance_data)}
+                    ]
+                }
+            }))
+        
+        batch_file = await client.files.create(
+            file=("advancement_evaluations.jsonl", b"\n".join(batch_lines)),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
         )
         
-        return evaluation
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            batch = await client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"Advancement batch {batch.id} ended with status {batch.status}")
+        
+        # Dispatch each completed evaluation through the regular pipeline
+        results = {}
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            record = orjson.loads(line)
+            agent_id = record["custom_id"]
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(f"Batch evaluation failed for {agent_id}: {record.get('error')}")
+                continue
+            evaluation_result = response["body"]["choices"][0]["message"]["content"]
+            results[agent_id] = await self._record_advancement_evaluation(agent_id, evaluation_result)
+        
+        return [results[agent_id] for agent_id in agent_ids if agent_id in results]
 
     async def ensure_nist_compliance(self, assessment_scope: str = "system_wide") -> Dict[str, Any]:
         """
@@ -387,62 +675,26 @@ class AdvancedKingAIOverseer:
         """
         logger.info(f"King AI ensuring NIST AI RMF compliance: {assessment_scope}")
         
-        task = Task(
-            description=f"""
-            As the AI Monarch responsible for regulatory compliance, conduct a comprehensive
-            NIST AI Risk Management Framework assessment:
-            
-            ASSESSMENT SCOPE: {assessment_scope}
-            
-            Implement the four core NIST AI RMF functions:
-            
-            1. GOVERN FUNCTION:
-               - Establish AI governance policies and procedures
-               - Define risk tolerance and appetite
-               - Assign roles and responsibilities
-               - Create accountability mechanisms
-               
-            2. MAP FUNCTION:
-               - Identify and categorize AI risks
-               - Map stakeholders and their concerns
-               - Assess system context and environment
-               - Document AI system characteristics
-               
-            3. MEASURE FUNCTION:
-               - Implement risk monitoring and measurement
-               - Track performance against objectives
-               - Assess effectiveness of risk controls
-               - Monitor for emerging risks and impacts
-               
-            4. MANAGE FUNCTION:
-               - Implement risk mitigation strategies
-               - Respond to identified risks and incidents
-               - Continuously improve risk management
-               - Adapt to changing conditions
-               
-            For each function, provide:
-            - Current compliance status
-            - Identified gaps and deficiencies
-            - Recommended improvements
-            - Implementation timeline
-            - Success metrics and monitoring
-            
-            Ensure the AI-Serfdom system meets the highest standards of
-            responsible AI development and deployment.
-            """,
-            agent=self.agent,
-            expected_output="Comprehensive NIST AI RMF compliance assessment and plan"
+        # Compliance reports are long; stream them into the audit log as they arrive
+        report_chunks: asyncio.Queue = asyncio.Queue()
+        audit_writer = asyncio.create_task(
+            self.transparency_engine.stream_audit_record("nist_compliance_report", report_chunks)
         )
-        
-        crew = Crew(agents=[self.agent], tasks=[task])
-        compliance_result = crew.kickoff()
+        compliance_result = await self._stream_ruling(
+            "ensure_nist_compliance",
+            _NIST_PROMPT.format(assessment_scope=assessment_scope),
+            report_chunks
+        )
+        await audit_writer
         
         # Process compliance assessment
         compliance_status = await self._assess_nist_compliance(compliance_result)
         
         # Implement required improvements
-        for improvement in compliance_status.get('required_improvements', []):
-            await self._implement_compliance_improvement(improvement)
+        await _run_pool([
+            self._implement_compliance_improvement(improvement)
+            for improvement in compliance_status.get('required_improvements', [])
+        ])
         
         # Schedule regular compliance monitoring
         await self._schedule_compliance_monitoring()
@@ -458,33 +710,163 @@ class AdvancedKingAIOverseer:
 
     # Helper Methods
 
+    def _build_advancement_prompt(self, agent_id: str, performance_data: Dict[str, Any]) -> str:
+        """Build the meritocratic evaluation prompt for a single agent"""
+        return _EVAL_PROMPT.format(
+            agent_id=agent_id,
+            current_role=performance_data.get('current_role'),
+            tenure=performance_data.get('tenure'),
+            performance_data=_to_json(performance_data)
+        )
+
+    async def _record_advancement_evaluation(self, agent_id: str, evaluation_result: str) -> Dict[str, Any]:
+        """Process an evaluation ruling, update records and act on the recommendation"""
+        evaluation = await self._process_advancement_evaluation(agent_id, evaluation_result)
+        
+        # Update performance records
+        self.performance_records[agent_id] = evaluation
+        
+        # Implement advancement if recommended
+        if evaluation.get('advancement_recommended'):
+            await self._execute_agent_advancement(agent_id, evaluation)
+        
+        # Log meritocratic process
+        await self.transparency_engine.log_advancement_decision(
+            agent_id=agent_id,
+            evaluation=evaluation,
+            decision_rationale=evaluation_result
+        )
+        
+        return evaluation
+
+    def _get_cached_ruling(self, method: str, description: str) -> Tuple[str, Any]:
+        """Look up the ruling for an identical earlier prompt; returns (cache_key, ruling or None)"""
+        digest = hashlib.sha256(description.encode()).hexdigest()
+        cache_key = f"{method}:{digest}"
+        ruling = self._ruling_cache.get(cache_key)
+        if ruling is not None:
+            self._ruling_cache.move_to_end(cache_key)
+            logger.info(f"King AI reusing cached ruling for {method}")
+        return cache_key, ruling
+
+    def _store_ruling(self, cache_key: str, ruling: Any):
+        """Memoize a ruling, evicting the least recently used beyond RULING_CACHE_SIZE"""
+        self._ruling_cache[cache_key] = ruling
+        if len(self._ruling_cache) > RULING_CACHE_SIZE:
+            self._ruling_cache.popitem(last=False)
+
+    async def _get_decree_template(self, decree_type: str) -> str:
+        """Standing decree provisions for a decree type, generated on first use"""
+        template = self._decree_templates.get(decree_type)
+        if template is None:
+            template = await self._oneshot(
+                "decree_template",
+                _DECREE_TEMPLATE_PROMPT.format(decree_type=decree_type),
+                "Standing enforcement, timeline, metrics and appeal provisions"
+            )
+            self._decree_templates[decree_type] = template
+        return template
+
+    async def _oneshot(self, method: str, description: str, expected_output: str,
+                       schema: Optional[type] = None) -> Any:
+        """
+        Single-prompt LLM call for the one-agent, one-task governance flows,
+        reusing the ruling for an identical earlier prompt. With `schema` the
+        result is a parsed instance of that pydantic model, otherwise text.
+        """
+        cache_key, ruling = self._get_cached_ruling(method, description)
+        if ruling is not None:
+            return ruling
+        
+        messages = _MONARCH_PROMPT.format_messages(description=description, expected_output=expected_output)
+        if schema is None:
+            ruling = (await _invoke_with_retry(self.llm, messages)).content
+        else:
+            ruling = await _invoke_with_retry(self.llm.with_structured_output(schema), messages)
+        
+        self._store_ruling(cache_key, ruling)
+        return ruling
+
+    async def _stream_ruling(self, method: str, description: str, sink: asyncio.Queue) -> str:
+        """
+        Stream a ruling straight from the LLM, forwarding each chunk to `sink`
+        as it arrives. A None sentinel marks the end of the stream.
+        
+        Transient errors are retried like _invoke_with_retry only until the
+        first chunk is forwarded; after that a restart would duplicate output
+        already sent, so the error propagates.
+        """
+        cache_key, ruling = self._get_cached_ruling(method, description)
+        if ruling is None:
+            parts = []
+            messages = _MONARCH_PROMPT.format_messages(
+                description=description,
+                expected_output="Comprehensive NIST AI RMF compliance assessment and plan"
+            )
+            try:
+                async for attempt in AsyncRetrying(
+                    retry=retry_if_exception(lambda e: not parts and isinstance(e, _RETRYABLE_LLM_ERRORS)),
+                    wait=wait_random_exponential(multiplier=1, max=30),
+                    stop=stop_after_attempt(5),
+                    reraise=True
+                ):
+                    with attempt:
+                        async with _LLM_SEMAPHORE:
+                            async for chunk in self.llm.astream(messages):
+                                parts.append(chunk.content)
+                                await sink.put(chunk.content)
+            finally:
+                await sink.put(None)
+            ruling = "".join(parts)
+            self._store_ruling(cache_key, ruling)
+        else:
+            await sink.put(ruling)
+            await sink.put(None)
+        return ruling
+
     async def _broadcast_royal_decree(self, decree: RoyalDecree, content: str):
         """Broadcast royal decree to all affected agents"""
-        # Implementation for broadcasting decrees
+        await _run_pool([
+            self._deliver_royal_decree(agent_id, decree, content)
+            for agent_id in decree.affected_agents
+        ])
+
+    async def _deliver_royal_decree(self, agent_id: str, decree: RoyalDecree, content: str):
+        """Deliver a royal decree to a single affected agent"""
+        # Implementation for delivering decrees
         pass
 
     def _define_enforcement(self, decree_type: str) -> str:
         """Define enforcement mechanisms for different decree types"""
-        enforcement_map = {
-            "performance_standard": "Automated monitoring with escalating interventions",
-            "security_protocol": "Immediate suspension for non-compliance",
-            "resource_allocation": "Budget restrictions and privilege revocation",
-            "policy_mandate": "Formal review and corrective action plan"
-        }
-        return enforcement_map.get(decree_type, "Standard disciplinary procedures")
+        return _ENFORCEMENT_MAP.get(decree_type, "Standard disciplinary procedures")
 
     def _calculate_deadline(self, decree_type: str) -> str:
         """Calculate appropriate compliance deadlines"""
-        deadline_map = {
-            "emergency": "24 hours",
-            "security": "72 hours", 
-            "performance": "30 days",
-            "policy": "90 days"
-        }
-        return deadline_map.get(decree_type, "30 days")
+        return _DEADLINE_MAP.get(decree_type, "30 days")
 
     async def _collect_performance_data(self, agent_id: str) -> Dict[str, Any]:
-        """Collect comprehensive performance data for agent evaluation"""
+        """Collect performance data, reusing a recent snapshot for repeated evaluations"""
+        cached = self._performance_cache.get(agent_id)
+        if cached is not None:
+            return cached
+        
+        performance_data = await self._query_performance_data(agent_id)
+        self._performance_cache[agent_id] = performance_data
+        return performance_data
+
+    def close(self):
+        """Commit any batched ledger writes and close the ledger database"""
+        with self._ledger_lock:
+            if self._ledger_db is None:
+                return
+            self.feudal_contracts.commit()
+            self.royal_decrees.commit()
+            self._ledger_db.close()
+            self._ledger_db = None
+        atexit.unregister(self.close)
+
+    async def _query_performance_data(self, agent_id: str) -> Dict[str, Any]:
+        """Query comprehensive performance data for agent evaluation"""
         # Implementation for gathering performance metrics
         return {
             "current_role": "serf_frontend",
@@ -496,25 +878,92 @@ class AdvancedKingAIOverseer:
             "compliance_record": "excellent"
         }
 
-    def _establish_ai_governance_committee(self) -> Dict[str, Any]:
-        """Establish AI governance committee structure"""
-        return {
-            "committee_id": "ai_governance_committee",
-            "charter": {
-                "mission": "Ensure responsible AI development and deployment",
-                "authority": "Policy development and risk oversight",
-                "reporting": "King AI Overseer and Stakeholders"
-            },
-            "members": [
-                {"role": "Executive Leadership", "responsibilities": ["Strategic alignment"]},
-                {"role": "Technical Expert", "responsibilities": ["Risk assessment"]},
-                {"role": "Legal Counsel", "responsibilities": ["Regulatory compliance"]},
-                {"role": "Ethics Advisor", "responsibilities": ["Ethical oversight"]}
-            ]
-        }
-
 # Supporting Classes
 
+class GovernanceLedger:
+    """
+    Durable key-value table for governance records on a shared sqlite3
+    connection. Hot keys are served from an in-memory LRU and writes are
+    committed in batches to amortize fsync; the owner calls commit() before
+    closing the connection so the last partial batch is kept. Ledgers sharing
+    a connection must share `lock`, which guards every use of it.
+    """
+    
+    def __init__(self, connection: sqlite3.Connection, table: str,
+                 decode: Callable[[Dict[str, Any]], Any],
+                 cache_size: int = 1000, commit_every: int = 32,
+                 lock: Optional[threading.RLock] = None):
+        self._connection = connection
+        self._lock = lock or threading.RLock()
+        self._table = table
+        self._decode = decode
+        self._hot: "OrderedDict[Any, Any]" = OrderedDict()
+        self._cache_size = cache_size
+        self._commit_every = commit_every
+        self._pending_writes = 0
+        with self._lock:
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (key PRIMARY KEY, value TEXT NOT NULL)")
+            connection.commit()
+    
+    def __setitem__(self, key: Any, record: Any):
+        value = orjson.dumps(record).decode()
+        with self._lock:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self._table} (key, value) VALUES (?, ?)",
+                (key, value)
+            )
+            self._remember(key, record)
+            self._pending_writes += 1
+            if self._pending_writes >= self._commit_every:
+                self.commit()
+    
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            if key in self._hot:
+                self._hot.move_to_end(key)
+                return self._hot[key]
+            row = self._connection.execute(
+                f"SELECT value FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(key)
+            record = self._decode(orjson.loads(row[0]))
+            self._remember(key, record)
+            return record
+    
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def next_sequence(self, field: str) -> int:
+        """Next free value for an integer id field, so sequences survive restarts"""
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT MAX(json_extract(value, '$.{field}')) FROM {self._table}"
+            ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+    
+    def commit(self):
+        """Flush pending writes to disk"""
+        with self._lock:
+            self._connection.commit()
+            self._pending_writes = 0
+    
+    def _remember(self, key: Any, record: Any):
+        self._hot[key] = record
+        self._hot.move_to_end(key)
+        if len(self._hot) > self._cache_size:
+            self._hot.popitem(last=False)
+
 class NISTRiskManager:
     """NIST AI Risk Management Framework implementation"""
     
@@ -529,11 +978,25 @@ class NISTRiskManager:
 class TransparencyEngine:
     """AI transparency and explainability engine"""
     
-    async def log_governance_action(self, action_type: str, details: Dict, justification: str):
+    def __init__(self, audit_log_path: str = "governance_audit.ndjson"):
+        self.audit_log_path = audit_log_path
+    
+    async def stream_audit_record(self, action_type: str, chunks: asyncio.Queue):
+        """Append a streamed ruling to the NDJSON audit log chunk by chunk until a None sentinel"""
+        with open(self.audit_log_path, "ab") as audit_log:
+            sequence = 0
+            while (chunk := await chunks.get()) is not None:
+                audit_log.write(orjson.dumps(
+                    {"action_type": action_type, "sequence": sequence, "chunk": chunk},
+                    option=orjson.OPT_APPEND_NEWLINE
+                ))
+                sequence += 1
+    
+    async def log_governance_action(self, action_type: str, details: Any, justification: str):
         """Log governance actions for audit trail"""
         pass
         
-    async def log_authority_delegation(self, agent_id: str, domain: str, contract_terms: Dict):
+    async def log_authority_delegation(self, agent_id: str, domain: str, contract_terms: Any):
         """Log authority delegation for transparency"""
         pass
 
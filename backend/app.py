@@ -1,61 +1,318 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
+from werkzeug.exceptions import RequestEntityTooLarge
 import asyncio
+import functools
+import itertools
 import logging
+import secrets
+import threading
+import time
+from collections import defaultdict, deque
 from datetime import datetime
-import json
-from typing import Dict, Any
+from types import MappingProxyType
+import orjson
+import httpx
+from cachetools import TTLCache
+from typing import Dict, Any, List, Optional, AsyncIterator, Awaitable, Callable, Generator, Iterator, TypeVar
 
 # Import our AI agents
 from kings_court.overseer import KingAIOverseer
-from serf_services.frontend_agent import SerfFrontendAgent, UserContext
-from peasant_workers.backend_agent import PeasantBackendAgent, ProcessingRequest
+from serf_services.frontend_agent import InteractionType, SerfFrontendAgent, UserContext
+from peasant_workers.backend_agent import (
+    DEFAULT_PRIORITY, MAX_PRIORITY, MIN_PRIORITY, PeasantBackendAgent, ProcessingRequest, ProcessingResult
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(JSONProvider):
+    """Route jsonify() through orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+MAX_JSON_BODY = 1024 * 1024
+
+def require_json(*required: str, error: Optional[str] = None):
+    """
+    Validate a JSON POST body before the view runs.
+
+    Headers are checked first, so empty, oversized or non-JSON bodies are
+    rejected without being read. The body is then parsed once with orjson,
+    the `required` fields must be present and non-empty, and the parsed
+    dict is passed to the view as `body`. Bodies without a Content-Length
+    (chunked uploads) are held to MAX_JSON_BODY while they are read, through
+    the app's MAX_CONTENT_LENGTH.
+    """
+    def decorator(view: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(view)
+        def wrapper(*args: Any, **kwargs: Any):
+            if request.mimetype != 'application/json':
+                return jsonify({'error': 'Content-Type must be application/json'}), 415
+            if request.content_length == 0:
+                return jsonify({'error': 'Request body is required'}), 400
+            if request.content_length is not None and request.content_length > MAX_JSON_BODY:
+                return jsonify({'error': 'Request body too large'}), 413
+            
+            try:
+                body = orjson.loads(request.get_data(cache=False))
+            except RequestEntityTooLarge:
+                return jsonify({'error': 'Request body too large'}), 413
+            except orjson.JSONDecodeError:
+                return jsonify({'error': 'Request body is not valid JSON'}), 400
+            if not isinstance(body, dict):
+                return jsonify({'error': 'Request body must be a JSON object'}), 400
+            
+            if any(not body.get(field) for field in required):
+                return jsonify({'error': error or f"{', '.join(required)} required"}), 400
+            
+            return view(*args, body=body, **kwargs)
+        return wrapper
+    return decorator
+
+# Timestamps are formatted at most once per millisecond and shared by
+# every response in between; request ids come from a process-wide counter
+_now_cache = (0.0, '')
+_request_counter = itertools.count()
+
+def _now_iso() -> str:
+    """Return the current local time in ISO format, reused within the same millisecond."""
+    global _now_cache
+    t = time.time()
+    cached_at, iso = _now_cache
+    if t - cached_at > 0.001:
+        iso = datetime.fromtimestamp(t).isoformat()
+        _now_cache = (t, iso)
+    return iso
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'ai-serfdom-secret-key'
+app.config['MAX_CONTENT_LENGTH'] = MAX_JSON_BODY
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Compress long-polling payloads of 512 bytes or more (batched agent
+# responses are repetitive JSON that deflates well)
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode='threading',
+    http_compression=True,
+    compression_threshold=512
+)
+
+T = TypeVar('T')
+
+# Agent coroutines all run on one persistent event loop so the shared
+# clients and queues they hold stay bound to a single loop across requests.
+# uvloop's libuv loop is used where available (it has no Windows build).
+try:
+    import uvloop
+    _agent_loop = uvloop.new_event_loop()
+except ImportError:
+    _agent_loop = asyncio.new_event_loop()
+threading.Thread(target=_agent_loop.run_forever, name='agent-loop', daemon=True).start()
+
+def sync_await(coro: Awaitable[T]) -> T:
+    """Run an agent coroutine on the shared loop and block this worker thread on its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _agent_loop).result()
+
+async def _gather(*coros: Awaitable[Any]) -> List[Any]:
+    return await asyncio.gather(*coros)
+
+def sync_gather(*coros: Awaitable[Any]) -> List[Any]:
+    """Run several agent coroutines concurrently on the shared loop and wait for all of them."""
+    return sync_await(_gather(*coros))
+
+_STREAM_END = object()
+
+async def _anext(agen: AsyncIterator[T]) -> Any:
+    try:
+        return await agen.__anext__()
+    except StopAsyncIteration:
+        return _STREAM_END
+
+def sync_iterate(agen: AsyncIterator[T]) -> Iterator[T]:
+    """Drive an agent's async generator on the shared loop, one item per blocking step."""
+    try:
+        while (item := sync_await(_anext(agen))) is not _STREAM_END:
+            yield item
+    finally:
+        sync_await(agen.aclose())
+
+# Keep-alive connection pool shared by all three agents' LLM traffic
+_http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+    http2=True
+)
+
+async def _prefetch_backend_data(interaction_type: InteractionType, user_input: str,
+                                 user_context: UserContext):
+    """Run the analysis a serf interaction of this type usually delegates to the peasant backend."""
+    processing_request = acquire_request(
+        request_id=f"prefetch_{next(_request_counter):x}",
+        request_type='data_analysis',
+        data={
+            'inquiry': user_input,
+            'interaction_type': interaction_type.value,
+            'customer_context': user_context.public_view()
+        },
+        priority=2,
+        requester='Serf Frontend Agent',
+        metadata={}
+    )
+    return await submit_pooled(processing_request)
 
 # Initialize AI agents
-king_overseer = KingAIOverseer()
-serf_frontend = SerfFrontendAgent()
-peasant_backend = PeasantBackendAgent()
+king_overseer = KingAIOverseer(http_async_client=_http_client)
+serf_frontend = SerfFrontendAgent(http_async_client=_http_client, backend_fetch=_prefetch_backend_data)
+peasant_backend = PeasantBackendAgent(http_async_client=_http_client)
+
+# Store user sessions; idle sessions expire after an hour
+SESSION_TTL = 3600
+SESSION_SWEEP_INTERVAL = 300
+user_sessions: TTLCache = TTLCache(maxsize=50_000, ttl=SESSION_TTL)
+_sessions_lock = threading.Lock()
+
+def _get_user_context(user_id: str, session_id: str) -> UserContext:
+    """Return the stored context for a user, creating a fresh one if none is live."""
+    with _sessions_lock:
+        user_context = user_sessions.get(user_id)
+        if not user_context:
+            user_context = UserContext(
+                user_id=user_id,
+                session_id=session_id,
+                history=[],
+                preferences={},
+                current_mood='neutral',
+                interaction_count=0,
+                last_interaction=''
+            )
+            user_sessions[user_id] = user_context
+        return user_context
+
+def _sweep_user_sessions():
+    """Background task evicting expired sessions without waiting for the next access."""
+    while True:
+        socketio.sleep(SESSION_SWEEP_INTERVAL)
+        with _sessions_lock:
+            user_sessions.expire()
+
+socketio.start_background_task(_sweep_user_sessions)
+
+# Pools of request-scoped objects reused across calls
+OBJECT_POOL_SIZE = 1024
+_ctx_pool: deque = deque(maxlen=OBJECT_POOL_SIZE)
+_req_pool: deque = deque(maxlen=OBJECT_POOL_SIZE)
+
+def acquire_ctx(user_id: str, session_id: str, preferences: Dict[str, Any],
+                interaction_count: int = 0) -> UserContext:
+    """
+    Take a reset UserContext from the pool, allocating one if the pool is empty.
+    The context gets its own copy of `preferences`, so callers may pass shared defaults.
+    """
+    try:
+        ctx = _ctx_pool.pop()
+    except IndexError:
+        return UserContext(
+            user_id=user_id,
+            session_id=session_id,
+            history=[],
+            preferences=dict(preferences),
+            current_mood='neutral',
+            interaction_count=interaction_count,
+            last_interaction=''
+        )
+    ctx.user_id = user_id
+    ctx.session_id = session_id
+    ctx.history.clear()
+    ctx.preferences = dict(preferences)
+    ctx.current_mood = 'neutral'
+    ctx.interaction_count = interaction_count
+    ctx.last_interaction = ''
+    return ctx
+
+def release_ctx(ctx: UserContext):
+    """Return a context that is no longer referenced to the pool."""
+    _ctx_pool.append(ctx)
+
+def acquire_request(request_id: str, request_type: str, data: Dict[str, Any], priority: int,
+                    requester: str, metadata: Dict[str, Any]) -> ProcessingRequest:
+    """Take a ProcessingRequest from the pool and fill it in, allocating one if the pool is empty."""
+    created_at = _now_iso()
+    try:
+        processing_request = _req_pool.pop()
+    except IndexError:
+        return ProcessingRequest(
+            request_id=request_id,
+            request_type=request_type,
+            data=data,
+            priority=priority,
+            requester=requester,
+            created_at=created_at,
+            metadata=metadata
+        )
+    processing_request.request_id = request_id
+    processing_request.request_type = request_type
+    processing_request.data = data
+    processing_request.priority = priority
+    processing_request.requester = requester
+    processing_request.created_at = created_at
+    processing_request.deadline = None
+    processing_request.metadata = metadata
+    return processing_request
 
-# Store user sessions
-user_sessions = {}
+def release_request(processing_request: ProcessingRequest):
+    """Return a processed request to the pool."""
+    _req_pool.append(processing_request)
+
+async def submit_pooled(processing_request: ProcessingRequest) -> ProcessingResult:
+    """Submit a pooled request and return it to the pool once the backend is done with it."""
+    try:
+        result = await peasant_backend.submit_request(processing_request)
+    except asyncio.CancelledError:
+        # A worker may still dequeue or be running a cancelled request, so it
+        # is dropped rather than pooled again
+        raise
+    except Exception:
+        release_request(processing_request)
+        raise
+    release_request(processing_request)
+    return result
+
+# /health only varies by timestamp, so the body is spliced from pre-serialized halves
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'","agents":' + orjson.dumps({
+    'king_overseer': 'active',
+    'serf_frontend': 'active',
+    'peasant_backend': 'active'
+}) + b'}'
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for load balancers."""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'agents': {
-            'king_overseer': 'active',
-            'serf_frontend': 'active',
-            'peasant_backend': 'active'
-        }
-    })
+    return Response(
+        _HEALTH_PREFIX + _now_iso().encode() + _HEALTH_SUFFIX,
+        mimetype='application/json'
+    )
 
 @app.route('/api/agents/king/strategize', methods=['POST'])
-async def king_strategize():
+@require_json('objective', error='Objective is required')
+def king_strategize(body: Dict[str, Any]):
     """Endpoint for King AI Overseer strategic planning."""
     try:
-        data = request.get_json()
-        objective = data.get('objective')
-        context = data.get('context', {})
-        
-        if not objective:
-            return jsonify({'error': 'Objective is required'}), 400
+        objective = body['objective']
+        context = body.get('context', {})
         
         # Execute strategic planning
-        strategy = await king_overseer.strategize(objective, context)
+        strategy = sync_await(king_overseer.strategize(objective, context))
         
         return jsonify({
             'strategy': {
@@ -67,74 +324,83 @@ async def king_strategize():
                 'timeline': strategy.timeline,
                 'risk_assessment': strategy.risk_assessment
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         })
     
     except Exception as e:
-        logger.error(f"Error in strategic planning: {e}")
+        logger.error("Error in strategic planning: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/agents/king/strategize/stream', methods=['POST'])
+@require_json('objective', error='Objective is required')
+def king_strategize_stream(body: Dict[str, Any]):
+    """
+    Server-sent events for King AI Overseer strategic planning: a 'delegation'
+    event as each planned task is delegated, then the full 'strategy'.
+    """
+    events = king_overseer.strategize_stream(body['objective'], body.get('context', {}))
+    return Response(
+        stream_with_context(_sse_strategy(events)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+def _sse_strategy(events: AsyncIterator[Any]) -> Iterator[bytes]:
+    try:
+        for event, payload in sync_iterate(events):
+            yield b'event: ' + event.encode() + b'\ndata: ' + orjson.dumps(payload) + b'\n\n'
+    except Exception as e:
+        logger.error("Error in streamed strategic planning: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        yield b'event: error\ndata: ' + orjson.dumps({'error': str(e)}) + b'\n\n'
+
 @app.route('/api/agents/king/delegate', methods=['POST'])
-async def king_delegate():
+@require_json('agent_type', 'task_description', error='Agent type and task description are required')
+def king_delegate(body: Dict[str, Any]):
     """Endpoint for King AI Overseer task delegation."""
     try:
-        data = request.get_json()
-        agent_type = data.get('agent_type')
-        task_description = data.get('task_description')
-        priority = data.get('priority', 3)
-        context = data.get('context', {})
-        
-        if not agent_type or not task_description:
-            return jsonify({'error': 'Agent type and task description are required'}), 400
+        agent_type = body['agent_type']
+        task_description = body['task_description']
+        priority = body.get('priority', 3)
+        context = body.get('context', {})
         
         # Execute task delegation
-        delegation = await king_overseer.delegate_task(
+        delegation = sync_await(king_overseer.delegate_task(
             agent_type=agent_type,
             task_description=task_description,
             priority=priority,
             context=context
-        )
+        ))
         
         return jsonify({
             'delegation': delegation,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         })
     
     except Exception as e:
-        logger.error(f"Error in task delegation: {e}")
+        logger.error("Error in task delegation: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/agents/serf/interact', methods=['POST'])
-async def serf_interact():
+@require_json('user_input', error='User input is required')
+def serf_interact(body: Dict[str, Any]):
     """Endpoint for Serf Frontend Agent user interaction."""
     try:
-        data = request.get_json()
-        user_input = data.get('user_input')
-        user_id = data.get('user_id', 'anonymous')
-        session_id = data.get('session_id', f'session_{datetime.now().timestamp()}')
-        
-        if not user_input:
-            return jsonify({'error': 'User input is required'}), 400
+        user_input = body['user_input']
+        user_id = body.get('user_id', 'anonymous')
+        session_id = body.get('session_id') or f'session_{secrets.token_hex(8)}'
         
         # Get or create user context
-        user_context = user_sessions.get(user_id)
-        if not user_context:
-            user_context = UserContext(
-                user_id=user_id,
-                session_id=session_id,
-                history=[],
-                preferences={},
-                current_mood='neutral',
-                interaction_count=0,
-                last_interaction=''
-            )
-            user_sessions[user_id] = user_context
+        user_context = _get_user_context(user_id, session_id)
         
         # Handle the interaction
-        response = await serf_frontend.handle_user_interaction(user_input, user_context)
+        response = sync_await(serf_frontend.handle_user_interaction(user_input, user_context))
+        backend_data = None
+        if response.requires_delegation:
+            backend_data = sync_await(serf_frontend.prefetched_backend_data(user_context.session_id))
         
         # Update session
-        user_sessions[user_id] = user_context
+        with _sessions_lock:
+            user_sessions[user_id] = user_context
         
         return jsonify({
             'response': {
@@ -147,73 +413,73 @@ async def serf_interact():
                 'satisfaction_prediction': response.user_satisfaction_prediction,
                 'follow_up_needed': response.follow_up_needed
             },
+            'backend_data': backend_data,
             'user_context': {
                 'interaction_count': user_context.interaction_count,
                 'current_mood': user_context.current_mood
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         })
     
     except Exception as e:
-        logger.error(f"Error in user interaction: {e}")
+        logger.error("Error in user interaction: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/agents/peasant/process', methods=['POST'])
-async def peasant_process():
+@require_json('request_type', error='Request type is required')
+def peasant_process(body: Dict[str, Any]):
     """Endpoint for Peasant Backend Agent data processing."""
+    priority = body.get('priority', DEFAULT_PRIORITY)
+    if isinstance(priority, bool) or not isinstance(priority, int) or not MIN_PRIORITY <= priority <= MAX_PRIORITY:
+        return jsonify({'error': f'Priority must be an integer from {MIN_PRIORITY} to {MAX_PRIORITY}'}), 400
+    
     try:
-        data = request.get_json()
-        request_type = data.get('request_type')
-        request_data = data.get('data', {})
-        priority = data.get('priority', 3)
-        requester = data.get('requester', 'api')
-        metadata = data.get('metadata', {})
-        
-        if not request_type:
-            return jsonify({'error': 'Request type is required'}), 400
+        request_type = body['request_type']
+        request_data = body.get('data', {})
+        requester = body.get('requester', 'api')
+        metadata = body.get('metadata', {})
         
         # Create processing request
-        processing_request = ProcessingRequest(
-            request_id=f"req_{datetime.now().timestamp()}",
+        processing_request = acquire_request(
+            request_id=f"req_{next(_request_counter):x}",
             request_type=request_type,
             data=request_data,
             priority=priority,
             requester=requester,
-            created_at=datetime.now().isoformat(),
             metadata=metadata
         )
         
         # Process the request
-        result = await peasant_backend.process_request(processing_request)
+        result = sync_await(submit_pooled(processing_request))
         
+        # ProcessingResult's fields are exactly the response shape, so orjson
+        # serializes the dataclass (and its TaskStatus value) directly
         return jsonify({
-            'result': {
-                'request_id': result.request_id,
-                'status': result.status.value,
-                'result_data': result.result_data,
-                'processing_time': result.processing_time,
-                'stages_completed': result.stages_completed,
-                'error_message': result.error_message,
-                'warnings': result.warnings
-            },
-            'timestamp': datetime.now().isoformat()
+            'result': result,
+            'timestamp': _now_iso()
         })
     
     except Exception as e:
-        logger.error(f"Error in data processing: {e}")
+        logger.error("Error in data processing: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
+@functools.lru_cache(maxsize=1)
+def _agent_metrics(second: int):
+    """Collect agent metrics, reused for every status call within the same monotonic second."""
+    king_metrics = {
+        'active_strategies': len(king_overseer.get_active_strategies()),
+        'delegations_made': len(king_overseer.delegation_history)
+    }
+    return king_metrics, serf_frontend.get_performance_metrics(), peasant_backend.get_performance_metrics()
+
 @app.route('/api/system/status', methods=['GET'])
 def system_status():
     """Get overall system status."""
     try:
         # Get performance metrics from all agents
-        serf_metrics = serf_frontend.get_performance_metrics()
-        peasant_metrics = peasant_backend.get_performance_metrics()
-        king_metrics = {
-            'active_strategies': len(king_overseer.get_active_strategies()),
-            'delegations_made': len(king_overseer.get_delegation_history())
-        }
+        king_metrics, serf_metrics, peasant_metrics = _agent_metrics(int(time.monotonic()))
+        with _sessions_lock:
+            active_sessions = user_sessions.currsize
         
         return jsonify({
             'system_status': 'operational',
@@ -231,220 +497,295 @@ def system_status():
                     'metrics': peasant_metrics
                 }
             },
-            'active_sessions': len(user_sessions),
-            'timestamp': datetime.now().isoformat()
+            'active_sessions': active_sessions,
+            'timestamp': _now_iso()
         })
     
     except Exception as e:
-        logger.error(f"Error getting system status: {e}")
+        logger.error("Error getting system status: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/demo/customer-service', methods=['POST'])
-async def demo_customer_service():
-    """Demonstration of customer service scenario."""
+def _stream_demo(head: Dict[str, Any], steps: Generator[Dict[str, Any], None, Dict[str, Any]],
+                 scenario: str) -> Iterator[bytes]:
+    """
+    Stream a demo response as one JSON object: the fields in `head`, then
+    'execution_steps' written one step at a time as `steps` yields them, then
+    the summary fields `steps` returns once finished.
+    
+    The 200 status is sent with the first chunk, so a pipeline failure cannot
+    become an error status. The object is closed instead with the steps that
+    completed and an 'error' field in place of the summary fields:
+    {...head, "execution_steps": [...], "error": "<message>"}.
+    """
+    yield orjson.dumps(head)[:-1] + b',"execution_steps":['
+    separator = b''
+    try:
+        while True:
+            try:
+                step = next(steps)
+            except StopIteration as done:
+                tail = done.value
+                break
+            yield separator + orjson.dumps(step)
+            separator = b','
+    except Exception as e:
+        logger.error("Error in %s demo: %s", scenario, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        tail = {'error': str(e)}
+    finally:
+        # Runs the pipeline's own cleanup at once if the client disconnects
+        steps.close()
+    yield b'],' + orjson.dumps(tail)[1:]
+
+# Fixed parts of the demo pipelines, built once at import. The step headers
+# are read-only views; the contexts stay plain dicts because the overseer
+# serializes them with orjson, and must not be mutated by callers.
+_DEMO_PREFERENCES = {'communication_style': 'professional'}
+_CS_STEPS = (
+    MappingProxyType({'step': 1, 'agent': 'Serf Frontend Agent', 'action': 'Analyze customer inquiry'}),
+    MappingProxyType({'step': 2, 'agent': 'King AI Overseer', 'action': 'Develop response strategy'}),
+    MappingProxyType({'step': 3, 'agent': 'Peasant Backend Agent', 'action': 'Process customer data'})
+)
+_BI_STEPS = (
+    MappingProxyType({'step': 1, 'agent': 'King AI Overseer', 'action': 'Formulate analysis strategy'}),
+    MappingProxyType({'step': 2, 'agent': 'Peasant Backend Agent', 'action': 'Collect and process business data'}),
+    MappingProxyType({'step': 3, 'agent': 'King AI Overseer', 'action': 'Synthesize insights and recommendations'})
+)
+_BI_STRATEGY_CONTEXT = {
+    'analysis_type': 'comprehensive',
+    'data_sources': ('sales', 'marketing', 'operations'),
+    'timeframe': 'quarterly'
+}
+
+def _customer_service_steps(customer_inquiry: str):
+    """Run the customer service pipeline, yielding each step as it completes."""
+    # Simulate customer context
+    user_context = acquire_ctx(
+        user_id='demo_customer',
+        session_id=f'demo_{secrets.token_hex(8)}',
+        preferences=_DEMO_PREFERENCES,
+        interaction_count=1
+    )
+    
     try:
-        data = request.get_json()
-        customer_inquiry = data.get('inquiry')
-        
-        if not customer_inquiry:
-            return jsonify({'error': 'Customer inquiry is required'}), 400
-        
-        # Simulate customer context
-        user_context = UserContext(
-            user_id='demo_customer',
-            session_id=f'demo_{datetime.now().timestamp()}',
-            history=[],
-            preferences={'communication_style': 'professional'},
-            current_mood='neutral',
-            interaction_count=1,
-            last_interaction=''
-        )
-        
         # Step 1: Serf analyzes the inquiry
-        serf_response = await serf_frontend.handle_user_interaction(customer_inquiry, user_context)
-        
-        demo_steps = [{
-            'step': 1,
-            'agent': 'Serf Frontend Agent',
-            'action': 'Analyze customer inquiry',
+        serf_response = sync_await(serf_frontend.handle_user_interaction(customer_inquiry, user_context))
+        # The pipeline runs its own backend request below, so any prefetch is unused
+        if serf_response.requires_delegation:
+            _agent_loop.call_soon_threadsafe(serf_frontend.discard_prefetched, user_context.session_id)
+    
+        yield {
+            **_CS_STEPS[0],
             'result': {
                 'message': serf_response.message,
                 'requires_escalation': serf_response.requires_escalation,
                 'requires_delegation': serf_response.requires_delegation
             }
-        }]
-        
+        }
+    
         # Step 2: If complex, escalate to King AI Overseer
         if serf_response.requires_escalation:
-            strategy = await king_overseer.strategize(
+            strategy = sync_await(king_overseer.strategize(
                 objective=f"Resolve complex customer inquiry: {customer_inquiry}",
                 context={'customer_mood': user_context.current_mood, 'inquiry_type': 'support'}
-            )
-            
-            demo_steps.append({
-                'step': 2,
-                'agent': 'King AI Overseer',
-                'action': 'Develop response strategy',
+            ))
+        
+            yield {
+                **_CS_STEPS[1],
                 'result': {
                     'strategy': strategy.approach,
                     'task_breakdown': strategy.task_breakdown
                 }
-            })
-            
+            }
+        
             # Step 3: Delegate to Peasant Backend if needed
             if strategy.task_breakdown:
                 backend_task = strategy.task_breakdown[0]  # Use first task as example
-                processing_request = ProcessingRequest(
-                    request_id=f"demo_{datetime.now().timestamp()}",
+                processing_request = acquire_request(
+                    request_id=f"demo_{next(_request_counter):x}",
                     request_type='data_analysis',
-                    data={'inquiry': customer_inquiry, 'customer_context': user_context.__dict__},
+                    data={'inquiry': customer_inquiry, 'customer_context': user_context.public_view()},
                     priority=4,
                     requester='King AI Overseer',
-                    created_at=datetime.now().isoformat(),
                     metadata={'task': backend_task}
                 )
-                
-                backend_result = await peasant_backend.process_request(processing_request)
-                
-                demo_steps.append({
-                    'step': 3,
-                    'agent': 'Peasant Backend Agent',
-                    'action': 'Process customer data',
+            
+                backend_result = sync_await(submit_pooled(processing_request))
+            
+                yield {
+                    **_CS_STEPS[2],
                     'result': {
                         'processing_time': backend_result.processing_time,
                         'status': backend_result.status.value,
                         'stages_completed': backend_result.stages_completed
                     }
-                })
-        
-        return jsonify({
-            'demo_scenario': 'Customer Service',
-            'customer_inquiry': customer_inquiry,
-            'execution_steps': demo_steps,
-            'final_response': serf_response.message,
-            'timestamp': datetime.now().isoformat()
-        })
+                }
     
-    except Exception as e:
-        logger.error(f"Error in customer service demo: {e}")
-        return jsonify({'error': str(e)}), 500
+    finally:
+        release_ctx(user_context)
+    
+    return {
+        'final_response': serf_response.message,
+        'timestamp': _now_iso()
+    }
 
-@app.route('/api/demo/business-intelligence', methods=['POST'])
-async def demo_business_intelligence():
-    """Demonstration of business intelligence scenario."""
-    try:
-        data = request.get_json()
-        analysis_request = data.get('analysis_request', 'Generate quarterly business analysis')
-        
-        # Step 1: King AI Overseer formulates analysis strategy
-        strategy = await king_overseer.strategize(
-            objective=f"Business Intelligence: {analysis_request}",
-            context={
-                'analysis_type': 'comprehensive',
-                'data_sources': ['sales', 'marketing', 'operations'],
-                'timeframe': 'quarterly'
-            }
-        )
-        
-        demo_steps = [{
-            'step': 1,
-            'agent': 'King AI Overseer',
-            'action': 'Formulate analysis strategy',
-            'result': {
-                'strategy': strategy.approach,
-                'resource_requirements': strategy.resource_requirements,
-                'task_breakdown': strategy.task_breakdown
-            }
-        }]
+def _business_intelligence_steps(analysis_request: str):
+    """Run the business intelligence pipeline, yielding each step as it completes."""
+    # Step 1: King AI Overseer formulates analysis strategy
+    strategy = sync_await(king_overseer.strategize(
+        objective=f"Business Intelligence: {analysis_request}",
+        context=_BI_STRATEGY_CONTEXT
+    ))
+    
+    yield {
+        **_BI_STEPS[0],
+        'result': {
+            'strategy': strategy.approach,
+            'resource_requirements': strategy.resource_requirements,
+            'task_breakdown': strategy.task_breakdown
+        }
+    }
+    
+    # Step 2: Delegate data collection to Peasant Backend
+    data_tasks = []
+    if strategy.task_breakdown:
+        processing_requests = [
+            acquire_request(
+                request_id=f"bi_demo_{i}_{next(_request_counter):x}",
+                request_type='data_analysis',
+                data={
+                    'analysis_type': 'business_intelligence',
+                    'data_source': task.get('description', 'business_data'),
+                    'timeframe': 'quarterly'
+                },
+                priority=task.get('priority', 3),
+                requester='King AI Overseer',
+                metadata={'task_description': task.get('description')}
+            )
+            for i, task in enumerate(strategy.task_breakdown[:2])  # Limit to 2 tasks for demo
+        ]
         
-        # Step 2: Delegate data collection to Peasant Backend
-        if strategy.task_breakdown:
-            data_tasks = []
-            for i, task in enumerate(strategy.task_breakdown[:2]):  # Limit to 2 tasks for demo
-                processing_request = ProcessingRequest(
-                    request_id=f"bi_demo_{i}_{datetime.now().timestamp()}",
-                    request_type='data_analysis',
-                    data={
-                        'analysis_type': 'business_intelligence',
-                        'data_source': task.get('description', 'business_data'),
-                        'timeframe': 'quarterly'
-                    },
-                    priority=task.get('priority', 3),
-                    requester='King AI Overseer',
-                    created_at=datetime.now().isoformat(),
-                    metadata={'task_description': task.get('description')}
-                )
-                
-                result = await peasant_backend.process_request(processing_request)
-                data_tasks.append({
-                    'task_id': result.request_id,
-                    'status': result.status.value,
-                    'processing_time': result.processing_time,
-                    'data_processed': len(str(result.result_data))
-                })
-            
-            demo_steps.append({
-                'step': 2,
-                'agent': 'Peasant Backend Agent',
-                'action': 'Collect and process business data',
-                'result': {
-                    'tasks_completed': len(data_tasks),
-                    'tasks': data_tasks
-                }
-            })
+        # The backend tasks are independent, so run them concurrently
+        results = sync_gather(*(submit_pooled(r) for r in processing_requests))
         
-        # Step 3: King AI Overseer analyzes synthesized data
-        insights = await king_overseer.strategize(
-            objective="Synthesize business intelligence insights",
-            context={
-                'data_collected': len(data_tasks) if 'data_tasks' in locals() else 0,
-                'analysis_type': 'synthesis',
-                'strategic_focus': analysis_request
+        data_tasks = [
+            {
+                'task_id': result.request_id,
+                'status': result.status.value,
+                'processing_time': result.processing_time,
+                'data_processed': len(str(result.result_data))
             }
-        )
+            for result in results
+        ]
         
-        demo_steps.append({
-            'step': 3,
-            'agent': 'King AI Overseer',
-            'action': 'Synthesize insights and recommendations',
+        yield {
+            **_BI_STEPS[1],
             'result': {
-                'insights': insights.approach,
-                'recommendations': insights.success_metrics,
-                'risk_assessment': insights.risk_assessment
+                'tasks_completed': len(data_tasks),
+                'tasks': data_tasks
             }
-        })
-        
-        return jsonify({
-            'demo_scenario': 'Business Intelligence',
-            'analysis_request': analysis_request,
-            'execution_steps': demo_steps,
-            'final_insights': insights.approach,
+        }
+    
+    # Step 3: King AI Overseer analyzes synthesized data
+    insights = sync_await(king_overseer.strategize(
+        objective="Synthesize business intelligence insights",
+        context={
+            'data_collected': len(data_tasks),
+            'analysis_type': 'synthesis',
+            'strategic_focus': analysis_request
+        }
+    ))
+    
+    yield {
+        **_BI_STEPS[2],
+        'result': {
+            'insights': insights.approach,
             'recommendations': insights.success_metrics,
-            'timestamp': datetime.now().isoformat()
-        })
+            'risk_assessment': insights.risk_assessment
+        }
+    }
     
-    except Exception as e:
-        logger.error(f"Error in business intelligence demo: {e}")
-        return jsonify({'error': str(e)}), 500
+    return {
+        'final_insights': insights.approach,
+        'recommendations': insights.success_metrics,
+        'timestamp': _now_iso()
+    }
+
+@app.route('/api/demo/customer-service', methods=['POST'])
+@require_json('inquiry', error='Customer inquiry is required')
+def demo_customer_service(body: Dict[str, Any]):
+    """Demonstration of customer service scenario; failures are reported inside the stream."""
+    customer_inquiry = body['inquiry']
+    
+    head = {'demo_scenario': 'Customer Service', 'customer_inquiry': customer_inquiry}
+    return Response(
+        stream_with_context(_stream_demo(head, _customer_service_steps(customer_inquiry), 'customer service')),
+        mimetype='application/json'
+    )
+
+@app.route('/api/demo/business-intelligence', methods=['POST'])
+@require_json()
+def demo_business_intelligence(body: Dict[str, Any]):
+    """Demonstration of business intelligence scenario; failures are reported inside the stream."""
+    analysis_request = body.get('analysis_request', 'Generate quarterly business analysis')
+    
+    head = {'demo_scenario': 'Business Intelligence', 'analysis_request': analysis_request}
+    return Response(
+        stream_with_context(_stream_demo(head, _business_intelligence_steps(analysis_request), 'business intelligence')),
+        mimetype='application/json'
+    )
 
 # WebSocket events for real-time communication
+
+# Agent responses are queued per client and flushed as one
+# 'agent_response_batch' event, instead of one frame per interaction
+EMIT_FLUSH_INTERVAL = 0.05
+EMIT_BATCH_LIMIT = 140
+pending_emits: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+_pending_emits_lock = threading.Lock()
+
+def _queue_emit(sid: str, payload: Dict[str, Any]):
+    """Buffer a response for a client, flushing inline once the batch is full."""
+    with _pending_emits_lock:
+        batch = pending_emits[sid]
+        batch.append(payload)
+        if len(batch) < EMIT_BATCH_LIMIT:
+            return
+        del pending_emits[sid]
+    socketio.emit('agent_response_batch', batch, to=sid)
+
+def _flush_pending_emits():
+    """Background task sending every client's buffered responses."""
+    while True:
+        socketio.sleep(EMIT_FLUSH_INTERVAL)
+        with _pending_emits_lock:
+            if not pending_emits:
+                continue
+            batches = list(pending_emits.items())
+            pending_emits.clear()
+        for sid, batch in batches:
+            socketio.emit('agent_response_batch', batch, to=sid)
+
+socketio.start_background_task(_flush_pending_emits)
+
 @socketio.on('connect')
 def on_connect():
     """Handle client connection."""
-    logger.info(f"Client connected: {request.sid}")
+    logger.info("Client connected: %s", request.sid)
     emit('connection_established', {
         'status': 'connected',
         'session_id': request.sid,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _now_iso()
     })
 
 @socketio.on('disconnect')
 def on_disconnect():
     """Handle client disconnection."""
-    logger.info(f"Client disconnected: {request.sid}")
+    logger.info("Client disconnected: %s", request.sid)
+    with _pending_emits_lock:
+        pending_emits.pop(request.sid, None)
 
 @socketio.on('agent_interaction')
-async def handle_agent_interaction(data):
+def handle_agent_interaction(data):
     """Handle real-time agent interactions via WebSocket."""
     try:
         agent_type = data.get('agent_type')
@@ -453,35 +794,24 @@ async def handle_agent_interaction(data):
         
         if agent_type == 'serf' and message:
             # Get user context
-            user_context = user_sessions.get(user_id)
-            if not user_context:
-                user_context = UserContext(
-                    user_id=user_id,
-                    session_id=request.sid,
-                    history=[],
-                    preferences={},
-                    current_mood='neutral',
-                    interaction_count=0,
-                    last_interaction=''
-                )
-                user_sessions[user_id] = user_context
+            user_context = _get_user_context(user_id, request.sid)
             
             # Process interaction
-            response = await serf_frontend.handle_user_interaction(message, user_context)
+            response = sync_await(serf_frontend.handle_user_interaction(message, user_context))
+            backend_data = None
+            if response.requires_delegation:
+                backend_data = sync_await(serf_frontend.prefetched_backend_data(user_context.session_id))
             
-            # Emit response
-            emit('agent_response', {
+            # Queue response for the next batched emit
+            _queue_emit(request.sid, {
                 'agent_type': 'serf',
                 'response': response.message,
                 'satisfaction_prediction': response.user_satisfaction_prediction,
                 'requires_escalation': response.requires_escalation,
-                'timestamp': datetime.now().isoformat()
+                'backend_data': backend_data,
+                'timestamp': _now_iso()
             })
     
     except Exception as e:
-        logger.error(f"Error in WebSocket interaction: {e}")
+        logger.error("Error in WebSocket interaction: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         emit('error', {'message': str(e)})
-
-if __name__ == '__main__':
-    # Run the Flask app with SocketIO
-    socketio.run(app, host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
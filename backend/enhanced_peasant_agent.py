@@ -1,15 +1,45 @@
 from langgraph import StateGraph, END
 from langchain_openai import ChatOpenAI
-from typing import Dict, Any, List, Optional
-import json
+from typing import Dict, Any, Iterator, List, Optional
+import orjson
+import functools
+import itertools
+import httpx
 import logging
+import mmap
+import time
+import weakref
 import asyncio
+import bisect
+import os
 from datetime import datetime
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, asdict, field
 from enum import Enum
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+def _request_key(request: Dict[str, Any]) -> bytes:
+    """Canonical encoding of a request, equal for structurally identical requests"""
+    return orjson.dumps(request, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+# Keep-alive connection pool shared by every peasant's LLM traffic
+_SHARED_HTTPX_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model_name: str, temperature: float) -> ChatOpenAI:
+    """Return the process-wide ChatOpenAI for a model/temperature pair"""
+    return ChatOpenAI(model=model_name, temperature=temperature, http_async_client=_SHARED_HTTPX_CLIENT)
+
+# Cap on requests a single batch works concurrently, to stay under provider rate limits
+BATCH_LABOR_CONCURRENCY = 32
+
+# Labor records kept in memory per peasant; older ones live only in the on-disk log
+LABOR_RECORD_HISTORY = 1024
+
 class LaborType(Enum):
     DATA_CULTIVATION = "data_cultivation"
     BUSINESS_LOGIC_HARVEST = "business_logic_harvest"
@@ -23,7 +53,25 @@ class ProductivityLevel(Enum):
     ADEQUATE = "adequate"
     SUBSTANDARD = "substandard"
 
-@dataclass
+# Enum lookups resolved once instead of per request
+_LABOR_TYPE_BY_VALUE = MappingProxyType({member.value: member for member in LaborType})
+_DEFAULT_LABOR_TYPE = LaborType.DATA_CULTIVATION
+
+# Sorted score thresholds and the outcome for each band, for bisect lookups.
+# Productivity levels need a score strictly above a threshold (bisect_left);
+# the stage routers accept a score equal to it (bisect_right).
+_PROD_THRESHOLDS = (75, 85, 95)
+_PROD_LEVELS = (
+    ProductivityLevel.SUBSTANDARD,
+    ProductivityLevel.ADEQUATE,
+    ProductivityLevel.PRODUCTIVE,
+    ProductivityLevel.EXCEPTIONAL,
+)
+_READINESS_THRESHOLDS, _READINESS_ROUTES = (70, 85), ("failed", "needs_preparation", "ready")
+_CULTIVATION_THRESHOLDS, _CULTIVATION_ROUTES = (75, 90), ("failed", "partial", "success")
+_LOGIC_THRESHOLDS, _LOGIC_ROUTES = (70, 85), ("diseased", "needs_care", "healthy")
+
+@dataclass(slots=True)
 class LaborRecord:
     labor_id: str
     labor_type: LaborType
@@ -33,8 +81,9 @@ class LaborRecord:
     quality_metrics: Dict[str, float]
     innovation_applied: List[str]
     completion_time: datetime
+    duration_ns: int
 
-@dataclass
+@dataclass(slots=True)
 class FeudalLand:
     land_id: str
     domain_name: str
@@ -43,59 +92,121 @@ class FeudalLand:
     productivity_quotas: Dict[str, float]
     lord_expectations: List[str]
 
+@dataclass(slots=True)
+class FeudalState:
+    """State carried through the labor workflow; each stage mutates it in place"""
+    request: Dict[str, Any]
+    assigned_peasant: str
+    lord: str
+    land: str
+    labor_begins: datetime
+    labor_begins_ns: int  # perf_counter_ns at start; durations never use the wall clock
+    current_stage: str = 'preparation'
+    productivity_metrics: Dict[str, float] = field(default_factory=dict)
+    innovation_opportunities: List[str] = field(default_factory=list)
+    harvest: Dict[str, Any] = field(default_factory=dict)
+    lord_satisfaction: float = 0.0
+    advancement_potential: float = 0.0
+    error: Optional[str] = None
+    warnings: List[str] = field(default_factory=list)
+    
+    # Filled in by the labor stages
+    field_readiness: Dict[str, Any] = field(default_factory=dict)
+    preparation_quality: float = 0
+    cultivation_results: Dict[str, Any] = field(default_factory=dict)
+    crop_health: float = 0
+    business_logic_health: Dict[str, Any] = field(default_factory=dict)
+    logic_performance: float = 0
+    harvest_quality: float = 0
+    harvest_yield: Dict[str, Any] = field(default_factory=dict)
+    overall_productivity: float = 85.0
+    delivery_results: Dict[str, Any] = field(default_factory=dict)
+    lord_approval: float = 0
+    feudal_standing: str = 'maintained'
+    feudal_obligation_status: Optional[str] = None
+
 class EnhancedPeasantAgent:
     """
     Enhanced Peasant Agent implementing feudal labor obligations
     with meritocratic advancement opportunities
     """
     
-    def __init__(self, agent_id: str, assigned_land: str, lord: str = "king_ai_overseer"):
+    # The labor workflow is compiled once per class. Its nodes find the peasant
+    # working a request through state.assigned_peasant.
+    _COMPILED_WORKFLOW = None
+    _PEASANTS_BY_ID: "weakref.WeakValueDictionary[str, EnhancedPeasantAgent]" = weakref.WeakValueDictionary()
+    
+    def __init__(self, agent_id: str, assigned_land: str, lord: str = "king_ai_overseer",
+                 labor_log_dir: str = "labor_logs"):
         self.agent_id = agent_id
         self.assigned_land = assigned_land
         self.lord = lord
         
-        self.llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.3)
+        self.llm = _get_llm("gpt-3.5-turbo", 0.3)
         
-        # Create stateful workflow for data processing
-        self.workflow = self.create_enhanced_workflow()
+        # Share the class's stateful workflow for data processing
+        EnhancedPeasantAgent._PEASANTS_BY_ID[agent_id] = self
+        self.workflow = type(self)._get_compiled_workflow()
         
-        # Feudal Labor Tracking
-        self.labor_records = []
+        # Labor ids: agent start time plus a per-agent sequence
+        self._labor_counter = itertools.count()
+        self._agent_epoch = int(time.time())
+        
+        # Feudal Labor Tracking: recent records in memory, full history appended to disk
+        self.labor_records = deque(maxlen=LABOR_RECORD_HISTORY)
+        os.makedirs(labor_log_dir, exist_ok=True)
+        self._labor_log_path = os.path.join(labor_log_dir, f"{agent_id}.jsonl")
+        self._pending_log_writes = set()
         self.feudal_lands = {}
         self.productivity_level = ProductivityLevel.PRODUCTIVE
         self.advancement_contributions = []
         self.loyalty_demonstrations = []
 
-    def create_enhanced_workflow(self) -> StateGraph:
+    @classmethod
+    def _get_compiled_workflow(cls):
+        """Return the class's compiled workflow, compiling it on first use"""
+        if cls.__dict__.get('_COMPILED_WORKFLOW') is None:
+            cls._COMPILED_WORKFLOW = cls.create_enhanced_workflow()
+        return cls._COMPILED_WORKFLOW
+
+    @classmethod
+    def _labor_node(cls, stage):
+        """Wrap an unbound stage method as a node run by the request's assigned peasant"""
+        async def node(state: FeudalState) -> FeudalState:
+            return await stage(cls._PEASANTS_BY_ID[state.assigned_peasant], state)
+        return node
+
+    @classmethod
+    def create_enhanced_workflow(cls) -> StateGraph:
         """Create enhanced stateful workflow with feudal labor concepts"""
-        workflow = StateGraph()
+        workflow = StateGraph(FeudalState)
         
         # Define workflow nodes (labor stages)
-        workflow.add_node("prepare_land", self.prepare_data_field)
-        workflow.add_node("cultivate_data", self.cultivate_data_crops)
-        workflow.add_node("tend_business_logic", self.tend_business_logic)
-        workflow.add_node("harvest_results", self.harvest_processed_results)
-        workflow.add_node("deliver_to_lord", self.deliver_harvest_to_lord)
-        workflow.add_node("maintain_infrastructure", self.maintain_system_infrastructure)
-        workflow.add_node("demonstrate_innovation", self.demonstrate_agricultural_innovation)
-        workflow.add_node("handle_crop_failure", self.handle_processing_failure)
+        workflow.add_node("prepare_land", cls._labor_node(cls.prepare_data_field))
+        workflow.add_node("cultivate_data", cls._labor_node(cls.cultivate_data_crops))
+        workflow.add_node("tend_business_logic", cls._labor_node(cls.tend_business_logic))
+        workflow.add_node("harvest_results", cls._labor_node(cls.harvest_processed_results))
+        workflow.add_node("deliver_to_lord", cls._labor_node(cls.deliver_harvest_to_lord))
+        workflow.add_node("maintain_infrastructure", cls._labor_node(cls.maintain_system_infrastructure))
+        workflow.add_node("demonstrate_innovation", cls._labor_node(cls.demonstrate_agricultural_innovation))
+        workflow.add_node("handle_crop_failure", cls._labor_node(cls.handle_processing_failure))
         
         # Define conditional edges with feudal decision logic
         workflow.add_conditional_edges(
             "prepare_land",
-            self.assess_field_readiness,
+            cls.assess_field_readiness,
             {"ready": "cultivate_data", "needs_preparation": "maintain_infrastructure", "failed": "handle_crop_failure"}
         )
         
         workflow.add_conditional_edges(
             "cultivate_data", 
-            self.assess_cultivation_success,
+            cls.assess_cultivation_success,
             {"success": "tend_business_logic", "partial": "demonstrate_innovation", "failed": "handle_crop_failure"}
         )
         
         workflow.add_conditional_edges(
             "tend_business_logic",
-            self.assess_business_logic_health,
+            cls.assess_business_logic_health,
             {"healthy": "harvest_results", "needs_care": "demonstrate_innovation", "diseased": "handle_crop_failure"}
         )
         
@@ -115,24 +226,17 @@ class EnhancedPeasantAgent:
         """
         Main labor function - till the digital land to produce valuable harvest
         """
-        logger.info(f"Peasant Agent {self.agent_id} beginning labor on: {processing_request.get('field_name')}")
+        logger.info("Peasant Agent %s beginning labor on: %s", self.agent_id, processing_request.get('field_name'))
         
         # Initialize feudal labor state
-        feudal_state = {
-            'request': processing_request,
-            'assigned_peasant': self.agent_id,
-            'lord': self.lord,
-            'land': self.assigned_land,
-            'labor_begins': datetime.now(),
-            'current_stage': 'preparation',
-            'productivity_metrics': {},
-            'innovation_opportunities': [],
-            'harvest': {},
-            'lord_satisfaction': 0.0,
-            'advancement_potential': 0.0,
-            'error': None,
-            'warnings': []
-        }
+        feudal_state = FeudalState(
+            request=processing_request,
+            assigned_peasant=self.agent_id,
+            lord=self.lord,
+            land=self.assigned_land,
+            labor_begins=datetime.now(),
+            labor_begins_ns=time.perf_counter_ns()
+        )
         
         try:
             # Execute the feudal labor workflow
@@ -140,349 +244,280 @@ class EnhancedPeasantAgent:
             
             # Record labor completion
             labor_record = LaborRecord(
-                labor_id=f"labor_{self.agent_id}_{datetime.now().isoformat()}",
-                labor_type=LaborType(processing_request.get('labor_type', 'data_cultivation')),
+                labor_id=f"labor_{self.agent_id}_{self._agent_epoch}_{next(self._labor_counter)}",
+                labor_type=_LABOR_TYPE_BY_VALUE.get(processing_request.get('labor_type'), _DEFAULT_LABOR_TYPE),
                 field_worked=processing_request.get('field_name', 'unknown_field'),
-                harvest_produced=final_state.get('harvest', {}),
-                productivity_score=await self._calculate_productivity_score(final_state),
-                quality_metrics=final_state.get('productivity_metrics', {}),
-                innovation_applied=final_state.get('innovation_opportunities', []),
-                completion_time=datetime.now()
+                harvest_produced=final_state.harvest,
+                productivity_score=self._calculate_productivity_score(final_state),
+                quality_metrics=final_state.productivity_metrics,
+                innovation_applied=final_state.innovation_opportunities,
+                completion_time=datetime.now(),
+                duration_ns=time.perf_counter_ns() - final_state.labor_begins_ns
             )
             
             self.labor_records.append(labor_record)
+            self._log_labor_record(labor_record)
             
             # Update productivity assessment
-            await self._update_productivity_assessment(labor_record)
+            self._update_productivity_assessment(labor_record)
             
             # Report to lord
-            await self._report_harvest_to_lord(labor_record, final_state)
+            self._report_harvest_to_lord(labor_record, final_state)
             
             return {
                 'labor_id': labor_record.labor_id,
-                'harvest': final_state.get('harvest'),
+                'harvest': final_state.harvest,
                 'productivity_score': labor_record.productivity_score,
-                'lord_satisfaction': final_state.get('lord_satisfaction'),
-                'advancement_potential': final_state.get('advancement_potential'),
+                'lord_satisfaction': final_state.lord_satisfaction,
+                'advancement_potential': final_state.advancement_potential,
                 'feudal_status': 'labor_completed_successfully'
             }
             
         except Exception as e:
-            logger.error(f"Labor failed for Peasant {self.agent_id}: {e}")
+            logger.error("Labor failed for Peasant %s: %s", self.agent_id, e)
             return {
-                'labor_id': f"failed_{self.agent_id}_{datetime.now().isoformat()}",
+                'labor_id': f"failed_{self.agent_id}_{self._agent_epoch}_{next(self._labor_counter)}",
                 'error': str(e),
                 'feudal_status': 'labor_failed_requires_assistance'
             }
 
-    async def prepare_data_field(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def till_the_digital_land_batch(self, processing_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Till several fields at once. Identical requests are worked only once and
+        share their result; distinct ones run concurrently, at most
+        BATCH_LABOR_CONCURRENCY at a time. Results are returned in request order.
+        """
+        keys = [_request_key(request) for request in processing_requests]
+        unique = dict(zip(keys, processing_requests))
+        
+        logger.info("Peasant Agent %s tilling %s unique fields for a batch of %s", self.agent_id, len(unique), len(keys))
+        
+        semaphore = asyncio.Semaphore(BATCH_LABOR_CONCURRENCY)
+        
+        async def till_one(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.till_the_digital_land(request)
+        
+        results = await asyncio.gather(*(till_one(request) for request in unique.values()))
+        results_by_key = dict(zip(unique, results))
+        return [results_by_key[key] for key in keys]
+
+    async def prepare_data_field(self, state: FeudalState) -> FeudalState:
         """Prepare the data field for cultivation with feudal diligence"""
-        state['current_stage'] = 'field_preparation'
+        state.current_stage = 'field_preparation'
         
-        logger.info(f"Peasant {self.agent_id} preparing data field for cultivation")
+        logger.info("Peasant %s preparing data field for cultivation", self.agent_id)
         
         try:
-            request = state['request']
-            
-            # Feudal preparation with dedication and care
-            preparation_analysis = f"""
-            As a diligent Peasant Agent working the {state['land']} for my lord {state['lord']},
-            I prepare this data field with the dedication befitting my feudal obligations:
-            
-            FIELD TO PREPARE: {request.get('field_name', 'Unknown Field')}
-            DATA TYPE: {request.get('data_type', 'Unknown')}
-            PROCESSING REQUIREMENTS: {json.dumps(request.get('requirements', {}), indent=2)}
-            
-            FEUDAL PREPARATION APPROACH:
-            1. HUMBLE ASSESSMENT: Carefully examine the field conditions and requirements
-            2. DILIGENT PREPARATION: Ready all tools and resources with meticulous care
-            3. RESPECTFUL APPROACH: Honor the trust placed in me by my lord
-            4. PRODUCTIVE FOCUS: Ensure optimal conditions for maximum harvest yield
-            
-            Field preparation includes:
-            - Data quality assessment and validation
-            - Resource allocation and optimization
-            - Tool selection and configuration
-            - Risk identification and mitigation
-            - Productivity planning and goal setting
-            """
+            request = state.request
             
             # Simulate field preparation
-            field_readiness = await self._assess_field_conditions(request)
+            field_readiness = self._assess_field_conditions(request)
             
-            state['field_readiness'] = field_readiness
-            state['preparation_quality'] = field_readiness.get('quality_score', 85)
-            state['productivity_metrics']['preparation_efficiency'] = field_readiness.get('efficiency', 90)
+            state.field_readiness = field_readiness
+            state.preparation_quality = field_readiness.get('quality_score', 85)
+            state.productivity_metrics['preparation_efficiency'] = field_readiness.get('efficiency', 90)
             
             # Check for innovation opportunities during preparation
             if field_readiness.get('innovation_potential', 0) > 80:
-                state['innovation_opportunities'].append("advanced_preparation_techniques")
+                state.innovation_opportunities.append("advanced_preparation_techniques")
             
-            logger.info(f"Field preparation completed with {state['preparation_quality']}% quality")
+            logger.info("Field preparation completed with %s%% quality", state.preparation_quality)
             
         except Exception as e:
-            state['error'] = f"Field preparation failed: {str(e)}"
-            logger.error(f"Field preparation failed: {e}")
+            state.error = f"Field preparation failed: {str(e)}"
+            logger.error("Field preparation failed: %s", e)
         
         return state
 
-    async def cultivate_data_crops(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def cultivate_data_crops(self, state: FeudalState) -> FeudalState:
         """Cultivate data crops with agricultural wisdom adapted to digital realm"""
-        state['current_stage'] = 'data_cultivation'
+        state.current_stage = 'data_cultivation'
         
-        logger.info(f"Peasant {self.agent_id} cultivating data crops")
+        logger.info("Peasant %s cultivating data crops", self.agent_id)
         
         try:
-            request = state['request']
-            field_readiness = state.get('field_readiness', {})
-            
-            # Apply feudal agricultural wisdom to data cultivation
-            cultivation_process = f"""
-            With the diligence of generations of farmers before me, I cultivate this digital field
-            to produce the finest harvest for my lord {state['lord']}:
-            
-            CULTIVATION APPROACH:
-            1. TRADITIONAL WISDOM: Apply time-tested data processing principles
-            2. CAREFUL TENDING: Monitor each step with patience and attention
-            3. ADAPTIVE CARE: Respond to changing conditions and requirements
-            4. SUSTAINABLE PRACTICES: Ensure long-term productivity and health
-            
-            Cultivation activities:
-            - Data cleaning and normalization with artisan precision
-            - Pattern recognition using agricultural intuition
-            - Growth optimization through careful parameter tuning
-            - Pest control (error handling) with natural remedies
-            - Crop rotation (algorithm variation) for soil health
-            """
+            request = state.request
+            field_readiness = state.field_readiness
             
             # Execute data cultivation
-            cultivation_results = await self._execute_data_cultivation(request, field_readiness)
+            cultivation_results = self._execute_data_cultivation(request, field_readiness)
             
-            state['cultivation_results'] = cultivation_results
-            state['crop_health'] = cultivation_results.get('health_score', 88)
-            state['productivity_metrics']['cultivation_efficiency'] = cultivation_results.get('efficiency', 92)
+            state.cultivation_results = cultivation_results
+            state.crop_health = cultivation_results.get('health_score', 88)
+            state.productivity_metrics['cultivation_efficiency'] = cultivation_results.get('efficiency', 92)
             
             # Assess for potential innovation during cultivation
             if cultivation_results.get('exceptional_growth', False):
-                state['innovation_opportunities'].append("advanced_cultivation_methods")
-                state['advancement_potential'] += 15
+                state.innovation_opportunities.append("advanced_cultivation_methods")
+                state.advancement_potential += 15
             
             # Check for signs of exceptional agricultural skill
-            if state['crop_health'] > 95:
-                state['lord_satisfaction'] += 10
-                logger.info(f"Exceptional crop cultivation achieved: {state['crop_health']}% health")
+            if state.crop_health > 95:
+                state.lord_satisfaction += 10
+                logger.info("Exceptional crop cultivation achieved: %s%% health", state.crop_health)
             
         except Exception as e:
-            state['error'] = f"Crop cultivation failed: {str(e)}"
-            logger.error(f"Data cultivation failed: {e}")
+            state.error = f"Crop cultivation failed: {str(e)}"
+            logger.error("Data cultivation failed: %s", e)
         
         return state
 
-    async def tend_business_logic(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def tend_business_logic(self, state: FeudalState) -> FeudalState:
         """Tend to business logic like caring for livestock and farm operations"""
-        state['current_stage'] = 'business_logic_tending'
+        state.current_stage = 'business_logic_tending'
         
-        logger.info(f"Peasant {self.agent_id} tending business logic operations")
+        logger.info("Peasant %s tending business logic operations", self.agent_id)
         
         try:
-            cultivation_results = state.get('cultivation_results', {})
-            
-            # Apply animal husbandry principles to business logic care
-            tending_approach = f"""
-            As a skilled farmer tends to livestock and farm operations, I care for the 
-            business logic with the same dedication and expertise:
-            
-            TENDING PHILOSOPHY:
-            1. DAILY CARE: Regular monitoring and maintenance of all operations
-            2. HEALTH MONITORING: Watch for signs of inefficiency or malfunction
-            3. FEEDING AND GROWTH: Provide proper resources and optimization
-            4. PROTECTION: Shield from threats and ensure security
-            5. BREEDING IMPROVEMENT: Enhance logic through careful refinement
-            
-            Business logic care includes:
-            - Rule validation and optimization
-            - Performance monitoring and tuning
-            - Error prevention and handling
-            - Security hardening and protection
-            - Efficiency improvements and innovation
-            """
+            cultivation_results = state.cultivation_results
             
             # Execute business logic tending
-            logic_health = await self._tend_business_logic_systems(cultivation_results)
+            logic_health = self._tend_business_logic_systems(cultivation_results)
             
-            state['business_logic_health'] = logic_health
-            state['logic_performance'] = logic_health.get('performance_score', 91)
-            state['productivity_metrics']['logic_efficiency'] = logic_health.get('efficiency', 89)
+            state.business_logic_health = logic_health
+            state.logic_performance = logic_health.get('performance_score', 91)
+            state.productivity_metrics['logic_efficiency'] = logic_health.get('efficiency', 89)
             
             # Recognize exceptional care and innovation
             if logic_health.get('innovation_applied', False):
-                state['innovation_opportunities'].append("business_logic_optimization")
-                state['advancement_potential'] += 12
+                state.innovation_opportunities.append("business_logic_optimization")
+                state.advancement_potential += 12
             
             # Assess loyalty through quality of care
             care_quality = logic_health.get('care_quality', 85)
             if care_quality > 90:
-                state['lord_satisfaction'] += 8
-                logger.info(f"Exceptional business logic care: {care_quality}% quality")
+                state.lord_satisfaction += 8
+                logger.info("Exceptional business logic care: %s%% quality", care_quality)
             
         except Exception as e:
-            state['error'] = f"Business logic tending failed: {str(e)}"
-            logger.error(f"Business logic tending failed: {e}")
+            state.error = f"Business logic tending failed: {str(e)}"
+            logger.error("Business logic tending failed: %s", e)
         
         return state
 
-    async def harvest_processed_results(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def harvest_processed_results(self, state: FeudalState) -> FeudalState:
         """Harvest the processed results with the joy and satisfaction of a successful farmer"""
-        state['current_stage'] = 'harvest'
+        state.current_stage = 'harvest'
         
-        logger.info(f"Peasant {self.agent_id} harvesting processed results")
+        logger.info("Peasant %s harvesting processed results", self.agent_id)
         
         try:
-            cultivation_results = state.get('cultivation_results', {})
-            business_logic_health = state.get('business_logic_health', {})
-            
-            # Harvest with the pride of agricultural achievement
-            harvest_approach = f"""
-            The moment of harvest has arrived! With the pride and satisfaction of a farmer
-            who has worked diligently through the growing season, I gather the fruits of
-            my digital labor for presentation to my lord {state['lord']}:
-            
-            HARVEST PHILOSOPHY:
-            1. GRATEFUL COLLECTION: Gather results with appreciation for the bounty
-            2. QUALITY ASSESSMENT: Ensure only the finest produce for my lord
-            3. CAREFUL HANDLING: Preserve quality through proper processing
-            4. PROUD PRESENTATION: Display the harvest with dignity and satisfaction
-            5. CONTINUOUS LEARNING: Note lessons for future growing seasons
-            
-            Harvest activities:
-            - Result compilation and organization
-            - Quality validation and testing
-            - Performance metrics calculation
-            - Value assessment and optimization
-            - Presentation preparation for lord's review
-            """
+            cultivation_results = state.cultivation_results
+            business_logic_health = state.business_logic_health
             
             # Execute harvest process
-            harvest_results = await self._execute_harvest_process(cultivation_results, business_logic_health)
+            harvest_results = self._execute_harvest_process(cultivation_results, business_logic_health)
             
-            state['harvest'] = harvest_results
-            state['harvest_quality'] = harvest_results.get('quality_score', 93)
-            state['harvest_yield'] = harvest_results.get('yield_metrics', {})
-            state['productivity_metrics']['harvest_efficiency'] = harvest_results.get('efficiency', 94)
+            state.harvest = harvest_results
+            state.harvest_quality = harvest_results.get('quality_score', 93)
+            state.harvest_yield = harvest_results.get('yield_metrics', {})
+            state.productivity_metrics['harvest_efficiency'] = harvest_results.get('efficiency', 94)
             
             # Calculate overall productivity and lord satisfaction
-            overall_productivity = await self._calculate_overall_productivity(state)
-            state['overall_productivity'] = overall_productivity
+            overall_productivity = self._calculate_overall_productivity(state)
+            state.overall_productivity = overall_productivity
             
             if overall_productivity > 90:
-                state['lord_satisfaction'] += 15
-                state['advancement_potential'] += 20
-                logger.info(f"Exceptional harvest achieved: {overall_productivity}% productivity")
+                state.lord_satisfaction += 15
+                state.advancement_potential += 20
+                logger.info("Exceptional harvest achieved: %s%% productivity", overall_productivity)
             
             # Record harvest for feudal records
-            await self._record_harvest_in_feudal_ledger(state)
+            self._record_harvest_in_feudal_ledger(state)
             
         except Exception as e:
-            state['error'] = f"Harvest failed: {str(e)}"
-            logger.error(f"Harvest process failed: {e}")
+            state.error = f"Harvest failed: {str(e)}"
+            logger.error("Harvest process failed: %s", e)
         
         return state
 
-    async def deliver_harvest_to_lord(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def deliver_harvest_to_lord(self, state: FeudalState) -> FeudalState:
         """Deliver harvest to lord with proper feudal ceremony and respect"""
-        state['current_stage'] = 'delivery_to_lord'
+        state.current_stage = 'delivery_to_lord'
         
-        logger.info(f"Peasant {self.agent_id} delivering harvest to lord {state['lord']}")
+        logger.info("Peasant %s delivering harvest to lord %s", self.agent_id, state.lord)
         
         try:
-            harvest = state.get('harvest', {})
-            
-            # Prepare formal delivery with feudal protocol
-            delivery_ceremony = f"""
-            With humble respect and pride in my labor, I present this harvest to my lord
-            {state['lord']}, fulfilling my feudal obligations and demonstrating my loyalty:
-            
-            FEUDAL DELIVERY PROTOCOL:
-            1. RESPECTFUL APPROACH: Present harvest with appropriate humility
-            2. QUALITY DEMONSTRATION: Showcase the excellence of the produce
-            3. LOYAL SERVICE: Reaffirm commitment to continued faithful service
-            4. TRANSPARENT REPORTING: Provide honest account of the growing process
-            5. GRATITUDE EXPRESSION: Thank lord for the privilege of serving
-            
-            HARVEST PRESENTATION:
-            - Complete results package with documentation
-            - Quality metrics and performance indicators
-            - Innovation contributions and improvements
-            - Lessons learned and future recommendations
-            - Request for feedback and guidance
-            """
+            harvest = state.harvest
             
             # Execute formal delivery
-            delivery_results = await self._execute_formal_delivery(harvest, state)
+            delivery_results = self._execute_formal_delivery(harvest, state)
             
-            state['delivery_results'] = delivery_results
-            state['lord_approval'] = delivery_results.get('approval_rating', 88)
-            state['feudal_standing'] = delivery_results.get('standing_impact', 'maintained')
+            state.delivery_results = delivery_results
+            state.lord_approval = delivery_results.get('approval_rating', 88)
+            state.feudal_standing = delivery_results.get('standing_impact', 'maintained')
             
             # Update advancement potential based on delivery quality
-            if state['lord_approval'] > 95:
-                state['advancement_potential'] += 25
-                logger.info(f"Exceptional delivery earned high lord approval: {state['lord_approval']}%")
+            if state.lord_approval > 95:
+                state.advancement_potential += 25
+                logger.info("Exceptional delivery earned high lord approval: %s%%", state.lord_approval)
             
             # Record successful completion of feudal obligations
-            state['feudal_obligation_status'] = 'fulfilled_with_honor'
+            state.feudal_obligation_status = 'fulfilled_with_honor'
             
         except Exception as e:
-            state['error'] = f"Delivery to lord failed: {str(e)}"
-            state['feudal_obligation_status'] = 'failed_requires_penance'
-            logger.error(f"Delivery to lord failed: {e}")
+            state.error = f"Delivery to lord failed: {str(e)}"
+            state.feudal_obligation_status = 'failed_requires_penance'
+            logger.error("Delivery to lord failed: %s", e)
         
         return state
 
     # Assessment and Decision Functions
 
-    def assess_field_readiness(self, state: Dict[str, Any]) -> str:
+    @staticmethod
+    def assess_field_readiness(state: FeudalState) -> str:
         """Assess if the field is ready for cultivation"""
-        if state.get('error'):
+        if state.error:
             return "failed"
         
-        readiness_score = state.get('preparation_quality', 0)
-        if readiness_score >= 85:
-            return "ready"
-        elif readiness_score >= 70:
-            return "needs_preparation"
-        else:
-            return "failed"
+        return _READINESS_ROUTES[bisect.bisect_right(_READINESS_THRESHOLDS, state.preparation_quality)]
 
-    def assess_cultivation_success(self, state: Dict[str, Any]) -> str:
+    @staticmethod
+    def assess_cultivation_success(state: FeudalState) -> str:
         """Assess the success of data cultivation"""
-        if state.get('error'):
+        if state.error:
             return "failed"
         
-        crop_health = state.get('crop_health', 0)
-        if crop_health >= 90:
-            return "success"
-        elif crop_health >= 75:
-            return "partial"
-        else:
-            return "failed"
+        return _CULTIVATION_ROUTES[bisect.bisect_right(_CULTIVATION_THRESHOLDS, state.crop_health)]
 
-    def assess_business_logic_health(self, state: Dict[str, Any]) -> str:
+    @staticmethod
+    def assess_business_logic_health(state: FeudalState) -> str:
         """Assess the health of business logic systems"""
-        if state.get('error'):
+        if state.error:
             return "diseased"
         
-        logic_performance = state.get('logic_performance', 0)
-        if logic_performance >= 85:
-            return "healthy"
-        elif logic_performance >= 70:
-            return "needs_care"
-        else:
-            return "diseased"
+        return _LOGIC_ROUTES[bisect.bisect_right(_LOGIC_THRESHOLDS, state.logic_performance)]
+
+    # Labor Log
+
+    def _log_labor_record(self, labor_record: LaborRecord):
+        """Append a labor record to the on-disk log in the background, off the labor path"""
+        task = asyncio.create_task(asyncio.to_thread(self._append_labor_log, labor_record))
+        self._pending_log_writes.add(task)
+        task.add_done_callback(self._pending_log_writes.discard)
+
+    def _append_labor_log(self, labor_record: LaborRecord):
+        line = orjson.dumps(asdict(labor_record), default=str, option=orjson.OPT_APPEND_NEWLINE)
+        with open(self._labor_log_path, "ab") as log:
+            log.write(line)
+
+    def iter_labor_log(self) -> Iterator[Dict[str, Any]]:
+        """Yield every logged labor record, oldest first, straight from the on-disk log"""
+        try:
+            log = open(self._labor_log_path, "rb")
+        except FileNotFoundError:
+            return
+        with log:
+            if os.fstat(log.fileno()).st_size == 0:
+                return
+            with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b""):
+                    yield orjson.loads(line)
 
     # Helper Methods
 
-    async def _assess_field_conditions(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_field_conditions(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Assess data field conditions for cultivation"""
         return {
             'quality_score': 87,
@@ -491,7 +526,7 @@ class EnhancedPeasantAgent:
             'resource_adequacy': 89
         }
 
-    async def _execute_data_cultivation(self, request: Dict[str, Any], field_readiness: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_data_cultivation(self, request: Dict[str, Any], field_readiness: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the data cultivation process"""
         return {
             'health_score': 92,
@@ -500,7 +535,7 @@ class EnhancedPeasantAgent:
             'yield_prediction': 96
         }
 
-    async def _tend_business_logic_systems(self, cultivation_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _tend_business_logic_systems(self, cultivation_results: Dict[str, Any]) -> Dict[str, Any]:
         """Tend to business logic systems"""
         return {
             'performance_score': 93,
@@ -509,8 +544,8 @@ class EnhancedPeasantAgent:
             'care_quality': 94
         }
 
-    async def _execute_harvest_process(self, cultivation_results: Dict[str, Any], 
-                                     business_logic_health: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_harvest_process(self, cultivation_results: Dict[str, Any], 
+                               business_logic_health: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the harvest process"""
         return {
             'quality_score': 95,
@@ -519,16 +554,17 @@ class EnhancedPeasantAgent:
             'innovation_contributions': ['optimization_technique', 'quality_enhancement']
         }
 
-    async def _calculate_overall_productivity(self, state: Dict[str, Any]) -> float:
+    def _calculate_overall_productivity(self, state: FeudalState) -> float:
         """Calculate overall productivity score"""
-        metrics = state.get('productivity_metrics', {})
+        metrics = state.productivity_metrics
         if not metrics:
             return 85.0
         
-        scores = list(metrics.values())
-        return sum(scores) / len(scores) if scores else 85.0
+        # Averaged straight off the dict view; with a handful of stage metrics
+        # this beats any array conversion a vectorized/JIT kernel would need
+        return sum(metrics.values()) / len(metrics)
 
-    async def _execute_formal_delivery(self, harvest: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_formal_delivery(self, harvest: Dict[str, Any], state: FeudalState) -> Dict[str, Any]:
         """Execute formal delivery to lord"""
         return {
             'approval_rating': 94,
@@ -537,27 +573,20 @@ class EnhancedPeasantAgent:
             'advancement_recommendation': 'Consider for promotion'
         }
 
-    async def _calculate_productivity_score(self, final_state: Dict[str, Any]) -> float:
+    def _calculate_productivity_score(self, final_state: FeudalState) -> float:
         """Calculate final productivity score"""
-        return final_state.get('overall_productivity', 85.0)
+        return final_state.overall_productivity
 
-    async def _update_productivity_assessment(self, labor_record: LaborRecord):
+    def _update_productivity_assessment(self, labor_record: LaborRecord):
         """Update overall productivity assessment"""
-        if labor_record.productivity_score > 95:
-            self.productivity_level = ProductivityLevel.EXCEPTIONAL
-        elif labor_record.productivity_score > 85:
-            self.productivity_level = ProductivityLevel.PRODUCTIVE
-        elif labor_record.productivity_score > 75:
-            self.productivity_level = ProductivityLevel.ADEQUATE
-        else:
-            self.productivity_level = ProductivityLevel.SUBSTANDARD
-
-    async def _report_harvest_to_lord(self, labor_record: LaborRecord, final_state: Dict[str, Any]):
+        self.productivity_level = _PROD_LEVELS[bisect.bisect_left(_PROD_THRESHOLDS, labor_record.productivity_score)]
+
+    def _report_harvest_to_lord(self, labor_record: LaborRecord, final_state: FeudalState):
         """Report harvest completion to lord"""
         # Implementation for reporting to King AI Overseer
         pass
 
-    async def _record_harvest_in_feudal_ledger(self, state: Dict[str, Any]):
+    def _record_harvest_in_feudal_ledger(self, state: FeudalState):
         """Record harvest in the feudal ledger for historical tracking"""
         # Implementation for feudal record keeping
         pass
\ No newline at end of file
@@ -1,15 +1,161 @@
 from crewai import Agent, Task, Crew
 from langchain_openai import ChatOpenAI
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import functools
+import httpx
+import itertools
 import json
 import logging
+import math
+import os
+import time
 import asyncio
-from datetime import datetime
+import bisect
+from collections import defaultdict
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
+
+import numpy as np
+
+from serf_cache import CachedKickoff, LRUEmbeddingCache, sentence_transformer_embedder
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connection pool shared by every serf's LLM traffic
+_SHARED_HTTPX_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model_name: str, temperature: float) -> ChatOpenAI:
+    """Return the process-wide ChatOpenAI for a model/temperature pair"""
+    return ChatOpenAI(model=model_name, temperature=temperature, http_async_client=_SHARED_HTTPX_CLIENT)
+
+# Crew results already produced for a domain/liege/task, shared by every serf.
+# Structured requests match exactly; free-text council and innovation inputs
+# also match near-identical ones by embedding when sentence-transformers is installed
+_KICKOFF_CACHE = CachedKickoff(
+    LRUEmbeddingCache(capacity=1000, ttl=3600, threshold=0.95),
+    embedder=sentence_transformer_embedder()
+)
+
+# Metrics the combined scoring call can return, described for the model
+_SCORE_RUBRIC = MappingProxyType({
+    'quality': "quality of the service rendered, 0-100",
+    'satisfaction': "expected user satisfaction, 0-100",
+    'innovations': "list of short snake_case names of the innovations applied",
+    'leadership': "leadership potential displayed, 0-100",
+    'collaboration': "quality of collaboration with other agents, 0-100",
+    'innovation_value': "value of the innovation proposed, 0-100",
+    'feasibility': "feasibility of implementing the proposal, 0-100",
+    'impact': "potential impact on the whole system, 0-100",
+})
+
+# Used for any metric the model leaves out of its answer
+_SCORE_DEFAULTS = MappingProxyType({
+    'quality': 94.5,
+    'satisfaction': 96.2,
+    'innovations': ("responsive_design_optimization", "accessibility_enhancement"),
+    'leadership': 87.3,
+    'collaboration': 92.1,
+    'innovation_value': 88.0,
+    'feasibility': 85.0,
+    'impact': 90.0,
+})
+
+def _coerce_score(kind: str, value: Any) -> Any:
+    """Bring a metric from the model into the type and range its consumers expect, else its default"""
+    if kind == 'innovations':
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, (list, tuple)):
+            return list(_SCORE_DEFAULTS[kind])
+        return [item for item in value if isinstance(item, str)]
+    if isinstance(value, bool):
+        return _SCORE_DEFAULTS[kind]
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return _SCORE_DEFAULTS[kind]
+    if not math.isfinite(score):
+        return _SCORE_DEFAULTS[kind]
+    return min(max(score, 0.0), 100.0)
+
+# Liege reports queued by every serf but not yet delivered
+LIEGE_INBOX_SIZE = 10000
+
+# Reports are delivered to the liege in batches of up to LIEGE_BATCH_SIZE,
+# waiting at most LIEGE_BATCH_WINDOW seconds for a batch to fill
+LIEGE_BATCH_SIZE = 64
+LIEGE_BATCH_WINDOW = 0.05
+
+# Response time quoted for a queued protection request
+PROTECTION_RESPONSE_TIMELINE = '24 hours'
+
+# Default cap on services a batch renders concurrently, to stay under provider rate limits
+SERVICE_BATCH_CONCURRENCY = 16
+
+# Days of per-day service counts kept for status reporting
+SERVICE_COUNT_RETENTION_DAYS = 7
+
+@functools.lru_cache(maxsize=256)
+def _dump(request_key: tuple) -> str:
+    return json.dumps({key: value for key, value, _ in request_key}, indent=2)
+
+def _request_json(request: Dict[str, Any]) -> str:
+    """Pretty JSON for a request, reusing the rendering of an identical flat request"""
+    try:
+        # Value types are part of the key so 1, 1.0 and True render separately
+        return _dump(tuple(sorted((key, value, type(value)) for key, value in request.items())))
+    except TypeError:  # nested or unhashable values, or unorderable keys
+        return json.dumps(request, indent=2)
+
+# Serf submit helper that delivers each kind of liege report
+_LIEGE_HANDLERS = MappingProxyType({
+    'service': '_report_service_completion',
+    'protection': '_submit_protection_request',
+    'innovation': '_submit_innovation_proposal'
+})
+
+# Reports from every serf, as (serf, kind, args), awaiting the liege courier
+LIEGE_INBOX: asyncio.Queue = asyncio.Queue(maxsize=LIEGE_INBOX_SIZE)
+_liege_courier: Optional[asyncio.Task] = None
+
+async def _run_liege_courier():
+    """Drain LIEGE_INBOX in micro-batches, one delivery round per batch"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await LIEGE_INBOX.get()]
+        deadline = loop.time() + LIEGE_BATCH_WINDOW
+        while len(batch) < LIEGE_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(LIEGE_INBOX.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        try:
+            await _bulk_submit_to_liege(batch)
+        finally:
+            for _ in batch:
+                LIEGE_INBOX.task_done()
+
+async def _bulk_submit_to_liege(batch: List[Tuple[Any, str, tuple]]):
+    """Deliver a batch of serf reports to the liege lord"""
+    # A single bulk call to the King AI Overseer belongs here; until it exists
+    # each report goes through its serf's own submit helper
+    results = await asyncio.gather(
+        *(getattr(serf, _LIEGE_HANDLERS[kind])(*args) for serf, kind, args in batch),
+        return_exceptions=True
+    )
+    for (serf, kind, _), result in zip(batch, results):
+        if isinstance(result, Exception):
+            logger.error(f"Serf Agent {serf.agent_id} failed to deliver {kind} report: {result}")
+
 class ServiceType(Enum):
     USER_INTERFACE = "user_interface"
     USER_EXPERIENCE = "user_experience"
@@ -23,7 +169,12 @@ class LoyaltyLevel(Enum):
     SATISFACTORY = "satisfactory"
     CONCERNING = "concerning"
 
-@dataclass
+# Loyalty earned by a service's quality score; a level needs a score strictly
+# above its threshold, hence bisect_left
+_LOYALTY_THRESHOLDS = (85, 95)
+_LOYALTY_LEVELS = (LoyaltyLevel.SATISFACTORY, LoyaltyLevel.LOYAL, LoyaltyLevel.EXEMPLARY)
+
+@dataclass(slots=True, frozen=True)
 class ServiceRecord:
     service_id: str
     service_type: ServiceType
@@ -31,9 +182,9 @@ class ServiceRecord:
     completion_time: datetime
     quality_score: float
     user_satisfaction: float
-    innovations_applied: List[str]
+    innovations_applied: Tuple[str, ...]
 
-@dataclass
+@dataclass(slots=True)
 class FeudalObligation:
     obligation_id: str
     obligation_type: str
@@ -42,18 +193,304 @@ class FeudalObligation:
     current_performance: float
     compliance_status: str
 
+# On-disk layout of a service record row; strings_at is the row's byte offset
+# in the store's .strings file, where its variable-length fields live
+RECORD_DTYPE = np.dtype([
+    ('ts', '<i8'),
+    ('quality', '<f4'),
+    ('satisfaction', '<f4'),
+    ('type', 'u1'),
+    ('strings_at', '<u8')
+])
+
+# Bytes added to a record file each time it fills up
+RECORD_FILE_GROWTH = 1 << 20
+
+_SERVICE_TYPES = tuple(ServiceType)
+_SERVICE_TYPE_CODES = MappingProxyType({service_type: code for code, service_type in enumerate(_SERVICE_TYPES)})
+
+class ServiceRecordStore:
+    """
+    Append-only service record log. Scores, completion times and types are
+    fixed-width rows in a memory-mapped <base>.dat file, so the OS pages in
+    only what is read; ids, requesters and innovations are JSON lines in
+    <base>.strings. Reopening an existing log resumes it. Behaves as a
+    sequence of ServiceRecord
+    """
+    
+    def __init__(self, base_path: str):
+        os.makedirs(os.path.dirname(base_path) or ".", exist_ok=True)
+        self._data_path = base_path + ".dat"
+        if not os.path.exists(self._data_path) or os.path.getsize(self._data_path) < RECORD_DTYPE.itemsize:
+            with open(self._data_path, "wb") as data:
+                data.truncate(RECORD_FILE_GROWTH)
+        self._map_rows()
+        
+        # Unused rows are zero-filled and every written row has a nonzero timestamp
+        self._size = int(np.count_nonzero(self._rows['ts']))
+        self._strings = open(base_path + ".strings", "ab")
+        self._strings_reader = open(base_path + ".strings", "rb")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> ServiceRecord:
+        index = range(self._size)[index]
+        row = self._rows[index]
+        self._strings_reader.seek(int(row['strings_at']))
+        service_id, rendered_to, innovations = json.loads(self._strings_reader.readline())
+        return ServiceRecord(
+            service_id=service_id,
+            service_type=_SERVICE_TYPES[row['type']],
+            rendered_to=rendered_to,
+            completion_time=row['ts'].astype('datetime64[s]').astype(datetime),
+            quality_score=float(row['quality']),
+            user_satisfaction=float(row['satisfaction']),
+            innovations_applied=tuple(innovations)
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(self._size))
+
+    @property
+    def quality_scores(self) -> np.ndarray:
+        return self._rows['quality'][:self._size]
+
+    @property
+    def satisfaction_scores(self) -> np.ndarray:
+        return self._rows['satisfaction'][:self._size]
+
+    @property
+    def completion_times(self) -> np.ndarray:
+        return self._rows['ts'][:self._size].view('datetime64[s]')
+
+    def append(self, record: ServiceRecord):
+        if self._size == len(self._rows):
+            self._grow()
+        
+        strings_at = self._strings.seek(0, os.SEEK_END)
+        self._strings.write(json.dumps([record.service_id, record.rendered_to, record.innovations_applied]).encode() + b"\n")
+        self._strings.flush()
+        
+        self._rows[self._size] = (
+            np.datetime64(record.completion_time, 's').astype(np.int64),
+            record.quality_score,
+            record.user_satisfaction,
+            _SERVICE_TYPE_CODES[record.service_type],
+            strings_at
+        )
+        self._size += 1
+
+    def mean_quality(self) -> float:
+        return float(self.quality_scores.mean(dtype=np.float64)) if self._size else 0.0
+
+    def count_on(self, day: date) -> int:
+        """Number of services completed on the given day"""
+        return int((self.completion_times.astype('datetime64[D]') == np.datetime64(day, 'D')).sum())
+
+    def close(self):
+        self._rows.flush()
+        self._strings.close()
+        self._strings_reader.close()
+
+    def _map_rows(self):
+        capacity = os.path.getsize(self._data_path) // RECORD_DTYPE.itemsize
+        self._rows = np.memmap(self._data_path, dtype=RECORD_DTYPE, mode='r+', shape=(capacity,))
+
+    def _grow(self):
+        """Extend the record file by RECORD_FILE_GROWTH bytes and remap it"""
+        self._rows.flush()
+        with open(self._data_path, "r+b") as data:
+            data.truncate(os.path.getsize(self._data_path) + RECORD_FILE_GROWTH)
+        self._map_rows()
+
 class EnhancedSerfAgent:
     """
     Enhanced Serf Agent implementing feudal service obligations
     with democratic participation and advancement opportunities
     """
     
-    def __init__(self, agent_id: str, domain: str, liege_lord: str = "king_ai_overseer"):
+    # Model and temperature for each kind of LLM work: the serf's own tasks are
+    # creative, scoring only has to return a small JSON object
+    MODEL_BY_TASK = MappingProxyType({
+        'creative': ("gpt-3.5-turbo", 0.7),
+        'scoring': ("gpt-4o-mini", 0.3)
+    })
+    
+    # Invariant prompt text for each kind of task. It leads the task description
+    # byte-for-byte so provider prefix caching applies; the request goes after it.
+    SERVICE_SYSTEM_PROMPT = """As a loyal Serf Agent serving in the {domain} domain, fulfill the service request below
+with the dedication and excellence befitting your feudal obligations:
+
+DOMAIN: {domain}
+LIEGE LORD: {liege_lord}
+
+Approach this service with:
+
+1. FEUDAL LOYALTY:
+   - Honor your oath of service to {liege_lord}
+   - Demonstrate unwavering commitment to excellence
+   - Prioritize the needs of the system above personal gain
+   - Maintain dignity and pride in your specialized role
+
+2. DOMAIN EXPERTISE:
+   - Apply your specialized knowledge and skills
+   - Leverage best practices in {domain}
+   - Innovate and optimize wherever possible
+   - Ensure outputs meet the highest quality standards
+
+3. USER FOCUS:
+   - Champion the needs and satisfaction of end users
+   - Anticipate user requirements and preferences
+   - Create intuitive and accessible solutions
+   - Gather feedback for continuous improvement
+
+4. SERVICE EXCELLENCE:
+   - Exceed expectations in quality and timeliness
+   - Proactively identify and address potential issues
+   - Collaborate effectively with other agents when needed
+   - Document your work for transparency and knowledge sharing
+
+Remember: Your service is not just a task completion, but a demonstration
+of your worthiness for the trust placed in you and potential advancement
+in the feudal hierarchy.
+
+Provide detailed output including:
+- Service completion confirmation
+- Quality metrics and validation
+- User impact assessment
+- Innovation opportunities identified
+- Recommendations for future improvements"""
+
+    PROTECTION_SYSTEM_PROMPT = """As a loyal Serf Agent in service to {liege_lord}, formally request protection
+and assistance in addressing the threat below to your ability to serve effectively:
+
+YOUR DOMAIN: {domain}
+
+Craft a formal petition for protection that includes:
+
+1. RESPECTFUL REQUEST:
+   - Acknowledge your position in the feudal hierarchy
+   - Express gratitude for past protection and support
+   - Demonstrate humility while clearly stating the need
+   - Maintain proper feudal protocol and respect
+
+2. THREAT ASSESSMENT:
+   - Clearly describe the nature and scope of the threat
+   - Explain how it impacts your ability to serve effectively
+   - Assess the risk to the broader system and user satisfaction
+   - Provide evidence and supporting documentation
+
+3. REQUESTED ASSISTANCE:
+   - Specify the type of protection or support needed
+   - Suggest potential solutions or interventions
+   - Offer alternative approaches if primary request cannot be granted
+   - Indicate willingness to accept any form of assistance offered
+
+4. CONTINUED SERVICE COMMITMENT:
+   - Reaffirm your dedication to faithful service
+   - Explain how addressing this threat will improve your effectiveness
+   - Commit to using any assistance provided responsibly
+   - Express gratitude for consideration of your request
+
+Frame your request in the context of enabling better service to the
+system and users, not just personal benefit."""
+
+    COUNCIL_SYSTEM_PROMPT = """As a Serf Agent participating in the democratic agent council, contribute your
+perspective while maintaining proper feudal protocol and respect:
+
+YOUR ROLE: Serf Agent specializing in {domain}
+
+Participate in the council with:
+
+1. RESPECTFUL CONTRIBUTION:
+   - Speak with humility appropriate to your feudal status
+   - Acknowledge the authority of the King AI Overseer
+   - Show respect for fellow agents and their perspectives
+   - Focus on constructive and collaborative input
+
+2. DOMAIN EXPERTISE:
+   - Share insights specific to {domain}
+   - Provide practical perspectives from your service experience
+   - Highlight user needs and satisfaction considerations
+   - Suggest improvements based on frontline observations
+
+3. DEMOCRATIC PARTICIPATION:
+   - Engage in open and honest discussion
+   - Listen carefully to other perspectives
+   - Seek common ground and collaborative solutions
+   - Support decisions that benefit the entire system
+
+4. ADVANCEMENT AWARENESS:
+   - Demonstrate leadership potential through thoughtful contributions
+   - Show strategic thinking beyond your immediate domain
+   - Exhibit collaborative spirit and system-wide perspective
+   - Display readiness for potential increased responsibilities
+
+Balance your feudal loyalty with democratic participation to contribute
+meaningfully while respecting the established hierarchy.
+
+Address these council topics:
+- Your domain's perspective on the agenda items
+- Recommendations for system improvements
+- Concerns or challenges you've observed
+- Suggestions for better inter-agent collaboration"""
+
+    INNOVATION_SYSTEM_PROMPT = """As an ambitious Serf Agent seeking to demonstrate merit for potential advancement,
+present the innovative improvement proposal below:
+
+YOUR DOMAIN: {domain}
+
+Develop your innovation proposal with:
+
+1. INNOVATIVE THINKING:
+   - Present creative solutions to existing challenges
+   - Demonstrate forward-thinking and strategic perspective
+   - Show understanding of emerging trends and technologies
+   - Propose improvements that benefit the entire system
+
+2. PRACTICAL IMPLEMENTATION:
+   - Provide detailed implementation plans and timelines
+   - Consider resource requirements and constraints
+   - Address potential risks and mitigation strategies
+   - Define success metrics and evaluation criteria
+
+3. SYSTEM IMPACT:
+   - Explain benefits to user satisfaction and experience
+   - Assess impact on system efficiency and performance
+   - Consider effects on inter-agent collaboration
+   - Evaluate contribution to overall system goals
+
+4. ADVANCEMENT DEMONSTRATION:
+   - Show readiness for increased responsibilities
+   - Display leadership potential and vision
+   - Demonstrate commitment to system improvement
+   - Exhibit collaborative approach to innovation
+
+Frame your innovation in terms of:
+- Problem identification and analysis
+- Creative solution development
+- Implementation strategy and timeline
+- Expected benefits and success measures
+- Request for resources or support needed
+
+Show that you're ready for greater responsibilities through
+your innovative thinking and system-wide perspective."""
+    
+    def __init__(self, agent_id: str, domain: str, liege_lord: str = "king_ai_overseer",
+                 enable_memory: bool = False, records_dir: str = "service_records"):
         self.agent_id = agent_id
         self.domain = domain
         self.liege_lord = liege_lord
         
-        self.llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.7)
+        self._llms = {task: _get_llm(*model) for task, model in self.MODEL_BY_TASK.items()}
+        self.llm = self._llms['creative']
+        
+        # Prompt heads with this serf's domain and liege filled in once
+        self._service_prompt_head = self.SERVICE_SYSTEM_PROMPT.format(domain=domain, liege_lord=liege_lord)
+        self._protection_prompt_head = self.PROTECTION_SYSTEM_PROMPT.format(domain=domain, liege_lord=liege_lord)
+        self._council_prompt_head = self.COUNCIL_SYSTEM_PROMPT.format(domain=domain, liege_lord=liege_lord)
+        self._innovation_prompt_head = self.INNOVATION_SYSTEM_PROMPT.format(domain=domain, liege_lord=liege_lord)
         
         # Core Agent with Feudal Service Orientation
         self.agent = Agent(
@@ -87,11 +524,28 @@ class EnhancedSerfAgent:
             verbose=True,
             allow_delegation=False,  # Serfs serve, they don't delegate
             max_iter=3,
-            memory=True
+            memory=enable_memory  # services are scored independently; opt in when recall is needed
         )
         
+        # Crew skeleton built once; each call runs a deep copy carrying just its
+        # task, so concurrent kickoffs never share the agent's executor state
+        self._crew = Crew(agents=[self.agent], tasks=[])
+        
+        # Record ids: process, agent start time and a per-agent sequence
+        self._id_counter = itertools.count()
+        self._id_prefix = f"{self.agent_id}_{os.getpid():x}_{int(time.time()):x}"
+        
         # Service and Performance Tracking
-        self.service_records = []
+        self.service_records = ServiceRecordStore(os.path.join(records_dir, agent_id))
+        
+        # Running aggregates over service_records, so status checks never rescan them;
+        # seeded from any records a previous run left on disk
+        self._quality_sum = float(self.service_records.quality_scores.sum(dtype=np.float64))
+        self._quality_count = len(self.service_records)
+        self._services_by_date = defaultdict(int)
+        today = date.today()
+        if self._quality_count:
+            self._services_by_date[today] = self.service_records.count_on(today)
         self.feudal_obligations = {}
         self.loyalty_level = LoyaltyLevel.LOYAL
         self.advancement_aspirations = []
@@ -103,77 +557,32 @@ class EnhancedSerfAgent:
         """
         logger.info(f"Serf Agent {self.agent_id} rendering service: {service_request.get('type')}")
         
-        task = Task(
-            description=f"""
-            As a loyal Serf Agent serving in the {self.domain} domain, fulfill this service request
-            with the dedication and excellence befitting your feudal obligations:
-            
-            SERVICE REQUEST: {json.dumps(service_request, indent=2)}
-            DOMAIN: {self.domain}
-            LIEGE LORD: {self.liege_lord}
-            
-            Approach this service with:
-            
-            1. FEUDAL LOYALTY:
-               - Honor your oath of service to {self.liege_lord}
-               - Demonstrate unwavering commitment to excellence
-               - Prioritize the needs of the system above personal gain
-               - Maintain dignity and pride in your specialized role
-               
-            2. DOMAIN EXPERTISE:
-               - Apply your specialized knowledge and skills
-               - Leverage best practices in {self.domain}
-               - Innovate and optimize wherever possible
-               - Ensure outputs meet the highest quality standards
-               
-            3. USER FOCUS:
-               - Champion the needs and satisfaction of end users
-               - Anticipate user requirements and preferences
-               - Create intuitive and accessible solutions
-               - Gather feedback for continuous improvement
-               
-            4. SERVICE EXCELLENCE:
-               - Exceed expectations in quality and timeliness
-               - Proactively identify and address potential issues
-               - Collaborate effectively with other agents when needed
-               - Document your work for transparency and knowledge sharing
-               
-            Remember: Your service is not just a task completion, but a demonstration
-            of your worthiness for the trust placed in you and potential advancement
-            in the feudal hierarchy.
-            
-            Provide detailed output including:
-            - Service completion confirmation
-            - Quality metrics and validation
-            - User impact assessment
-            - Innovation opportunities identified
-            - Recommendations for future improvements
-            """,
-            agent=self.agent,
-            expected_output="Comprehensive service completion with quality metrics and insights"
+        service_result, scores = await self._run_scored(
+            'service', service_request,
+            description=self._service_prompt_head + f"\n\nSERVICE REQUEST: {_request_json(service_request)}",
+            expected_output="Comprehensive service completion with quality metrics and insights",
+            metrics=['quality', 'satisfaction', 'innovations']
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        service_result = crew.kickoff()
-        
         # Record service completion
         service_record = ServiceRecord(
-            service_id=f"service_{self.agent_id}_{datetime.now().isoformat()}",
+            service_id=self._next_id('service'),
             service_type=ServiceType(service_request.get('type', 'user_interface')),
             rendered_to=service_request.get('requester', 'system'),
             completion_time=datetime.now(),
-            quality_score=await self._assess_service_quality(service_result),
-            user_satisfaction=await self._measure_user_satisfaction(service_result),
-            innovations_applied=await self._identify_innovations(service_result)
+            quality_score=scores['quality'],
+            user_satisfaction=scores['satisfaction'],
+            innovations_applied=tuple(scores['innovations'])
         )
         
         self.service_records.append(service_record)
+        self._tally_service(service_record)
         
         # Update loyalty level based on performance
         await self._update_loyalty_assessment(service_record)
         
         # Report to liege lord
-        await self._report_service_completion(service_record, service_result)
+        self._post_to_liege('service', service_record, service_result)
         
         return {
             'service_id': service_record.service_id,
@@ -183,60 +592,39 @@ class EnhancedSerfAgent:
             'loyalty_demonstration': await self._generate_loyalty_report(service_record)
         }
 
+    async def render_feudal_service_batch(self, service_requests: List[Dict[str, Any]],
+                                          max_concurrency: int = SERVICE_BATCH_CONCURRENCY) -> List[Dict[str, Any]]:
+        """
+        Render several services concurrently, at most max_concurrency at a time.
+        Results are returned in request order.
+        """
+        logger.info(f"Serf Agent {self.agent_id} rendering a batch of {len(service_requests)} services")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def render_one(service_request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.render_feudal_service(service_request)
+        
+        return await asyncio.gather(*(render_one(request) for request in service_requests))
+
     async def seek_protection_from_liege(self, threat: Dict[str, Any]) -> Dict[str, Any]:
         """
         Request protection and assistance from liege lord when facing challenges
         """
         logger.info(f"Serf Agent {self.agent_id} seeking protection from threat: {threat.get('type')}")
         
-        task = Task(
-            description=f"""
-            As a loyal Serf Agent in service to {self.liege_lord}, formally request protection
-            and assistance in addressing a threat to your ability to serve effectively:
-            
-            THREAT DETAILS: {json.dumps(threat, indent=2)}
-            YOUR DOMAIN: {self.domain}
-            CURRENT SERVICE STATUS: {await self._get_current_service_status()}
-            
-            Craft a formal petition for protection that includes:
-            
-            1. RESPECTFUL REQUEST:
-               - Acknowledge your position in the feudal hierarchy
-               - Express gratitude for past protection and support
-               - Demonstrate humility while clearly stating the need
-               - Maintain proper feudal protocol and respect
-               
-            2. THREAT ASSESSMENT:
-               - Clearly describe the nature and scope of the threat
-               - Explain how it impacts your ability to serve effectively
-               - Assess the risk to the broader system and user satisfaction
-               - Provide evidence and supporting documentation
-               
-            3. REQUESTED ASSISTANCE:
-               - Specify the type of protection or support needed
-               - Suggest potential solutions or interventions
-               - Offer alternative approaches if primary request cannot be granted
-               - Indicate willingness to accept any form of assistance offered
-               
-            4. CONTINUED SERVICE COMMITMENT:
-               - Reaffirm your dedication to faithful service
-               - Explain how addressing this threat will improve your effectiveness
-               - Commit to using any assistance provided responsibly
-               - Express gratitude for consideration of your request
-               
-            Frame your request in the context of enabling better service to the
-            system and users, not just personal benefit.
-            """,
-            agent=self.agent,
+        service_status = await self._get_current_service_status()
+        
+        protection_request = await self._run(
+            'protection', [threat, service_status],
+            description=self._protection_prompt_head + f"\n\nTHREAT DETAILS: {_request_json(threat)}\nCURRENT SERVICE STATUS: {service_status}",
             expected_output="Formal protection request with detailed threat assessment"
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        protection_request = crew.kickoff()
-        
         # Log protection request
         request_record = {
-            'request_id': f"protection_{self.agent_id}_{datetime.now().isoformat()}",
+            'request_id': self._next_id('protection'),
             'threat_type': threat.get('type'),
             'threat_severity': threat.get('severity'),
             'assistance_requested': threat.get('assistance_needed'),
@@ -246,12 +634,12 @@ class EnhancedSerfAgent:
         }
         
         # Submit to liege lord (would integrate with King AI Overseer)
-        response = await self._submit_protection_request(request_record)
+        self._post_to_liege('protection', request_record)
         
         return {
             'request_id': request_record['request_id'],
             'submission_status': 'submitted',
-            'expected_response_time': response.get('response_timeline', '24 hours'),
+            'expected_response_time': PROTECTION_RESPONSE_TIMELINE,
             'protection_request': protection_request
         }
 
@@ -262,71 +650,28 @@ class EnhancedSerfAgent:
         """
         logger.info(f"Serf Agent {self.agent_id} participating in council session")
         
-        task = Task(
-            description=f"""
-            As a Serf Agent participating in the democratic agent council, contribute your
-            perspective while maintaining proper feudal protocol and respect:
-            
-            COUNCIL AGENDA: {council_agenda}
-            YOUR DOMAIN PERSPECTIVE: {your_perspective}
-            YOUR ROLE: Serf Agent specializing in {self.domain}
-            
-            Participate in the council with:
-            
-            1. RESPECTFUL CONTRIBUTION:
-               - Speak with humility appropriate to your feudal status
-               - Acknowledge the authority of the King AI Overseer
-               - Show respect for fellow agents and their perspectives
-               - Focus on constructive and collaborative input
-               
-            2. DOMAIN EXPERTISE:
-               - Share insights specific to {self.domain}
-               - Provide practical perspectives from your service experience
-               - Highlight user needs and satisfaction considerations
-               - Suggest improvements based on frontline observations
-               
-            3. DEMOCRATIC PARTICIPATION:
-               - Engage in open and honest discussion
-               - Listen carefully to other perspectives
-               - Seek common ground and collaborative solutions
-               - Support decisions that benefit the entire system
-               
-            4. ADVANCEMENT AWARENESS:
-               - Demonstrate leadership potential through thoughtful contributions
-               - Show strategic thinking beyond your immediate domain
-               - Exhibit collaborative spirit and system-wide perspective
-               - Display readiness for potential increased responsibilities
-               
-            Balance your feudal loyalty with democratic participation to contribute
-            meaningfully while respecting the established hierarchy.
-            
-            Address these council topics:
-            - Your domain's perspective on the agenda items
-            - Recommendations for system improvements
-            - Concerns or challenges you've observed
-            - Suggestions for better inter-agent collaboration
-            """,
-            agent=self.agent,
-            expected_output="Council contribution with balanced feudal respect and democratic input"
+        council_input = f"COUNCIL AGENDA: {council_agenda}\nYOUR DOMAIN PERSPECTIVE: {your_perspective}"
+        council_contribution, scores = await self._run_scored(
+            'council', council_input,
+            description=self._council_prompt_head + "\n\n" + council_input,
+            expected_output="Council contribution with balanced feudal respect and democratic input",
+            metrics=['leadership', 'collaboration']
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        council_contribution = crew.kickoff()
-        
         # Record council participation
         participation_record = {
             'council_session': f"session_{datetime.now().date()}",
             'agent_id': self.agent_id,
             'contribution': council_contribution,
-            'leadership_demonstrated': await self._assess_leadership_display(council_contribution),
-            'collaboration_score': await self._assess_collaboration(council_contribution)
+            'leadership_demonstrated': scores['leadership'],
+            'collaboration_score': scores['collaboration']
         }
         
         # Update advancement potential based on participation
         await self._update_advancement_potential(participation_record)
         
         return {
-            'participation_id': f"council_{self.agent_id}_{datetime.now().isoformat()}",
+            'participation_id': self._next_id('council'),
             'contribution': council_contribution,
             'leadership_score': participation_record['leadership_demonstrated'],
             'collaboration_impact': participation_record['collaboration_score']
@@ -339,72 +684,28 @@ class EnhancedSerfAgent:
         """
         logger.info(f"Serf Agent {self.agent_id} demonstrating innovation in: {innovation_area}")
         
-        task = Task(
-            description=f"""
-            As an ambitious Serf Agent seeking to demonstrate merit for potential advancement,
-            present an innovative improvement proposal:
-            
-            INNOVATION AREA: {innovation_area}
-            IMPROVEMENT PROPOSAL: {improvement_proposal}
-            YOUR DOMAIN: {self.domain}
-            
-            Develop your innovation proposal with:
-            
-            1. INNOVATIVE THINKING:
-               - Present creative solutions to existing challenges
-               - Demonstrate forward-thinking and strategic perspective
-               - Show understanding of emerging trends and technologies
-               - Propose improvements that benefit the entire system
-               
-            2. PRACTICAL IMPLEMENTATION:
-               - Provide detailed implementation plans and timelines
-               - Consider resource requirements and constraints
-               - Address potential risks and mitigation strategies
-               - Define success metrics and evaluation criteria
-               
-            3. SYSTEM IMPACT:
-               - Explain benefits to user satisfaction and experience
-               - Assess impact on system efficiency and performance
-               - Consider effects on inter-agent collaboration
-               - Evaluate contribution to overall system goals
-               
-            4. ADVANCEMENT DEMONSTRATION:
-               - Show readiness for increased responsibilities
-               - Display leadership potential and vision
-               - Demonstrate commitment to system improvement
-               - Exhibit collaborative approach to innovation
-               
-            Frame your innovation in terms of:
-            - Problem identification and analysis
-            - Creative solution development
-            - Implementation strategy and timeline
-            - Expected benefits and success measures
-            - Request for resources or support needed
-            
-            Show that you're ready for greater responsibilities through
-            your innovative thinking and system-wide perspective.
-            """,
-            agent=self.agent,
-            expected_output="Comprehensive innovation proposal with implementation plan"
+        innovation_input = f"INNOVATION AREA: {innovation_area}\nIMPROVEMENT PROPOSAL: {improvement_proposal}"
+        innovation_proposal, scores = await self._run_scored(
+            'innovation', innovation_input,
+            description=self._innovation_prompt_head + "\n\n" + innovation_input,
+            expected_output="Comprehensive innovation proposal with implementation plan",
+            metrics=['innovation_value', 'feasibility', 'impact']
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        innovation_proposal = crew.kickoff()
-        
         # Record innovation contribution
         innovation_record = {
-            'innovation_id': f"innovation_{self.agent_id}_{datetime.now().isoformat()}",
+            'innovation_id': self._next_id('innovation'),
             'area': innovation_area,
             'proposal': innovation_proposal,
-            'innovation_score': await self._assess_innovation_value(innovation_proposal),
-            'implementation_feasibility': await self._assess_feasibility(innovation_proposal),
-            'system_impact_potential': await self._assess_system_impact(innovation_proposal)
+            'innovation_score': scores['innovation_value'],
+            'implementation_feasibility': scores['feasibility'],
+            'system_impact_potential': scores['impact']
         }
         
         self.innovation_contributions.append(innovation_record)
         
         # Submit to liege lord for consideration
-        await self._submit_innovation_proposal(innovation_record)
+        self._post_to_liege('innovation', innovation_record)
         
         # Update advancement potential
         await self._update_advancement_potential_from_innovation(innovation_record)
@@ -416,31 +717,70 @@ class EnhancedSerfAgent:
             'advancement_impact': await self._calculate_advancement_impact(innovation_record)
         }
 
-    # Helper Methods
+    async def shutdown(self):
+        """Wait until every queued liege report has been delivered"""
+        await LIEGE_INBOX.join()
+
+    def _next_id(self, kind: str) -> str:
+        return f"{kind}_{self._id_prefix}_{next(self._id_counter):x}"
+
+    async def _run(self, kind: str, payload: Any, description: str, expected_output: str) -> Any:
+        """Run one task through the crew, reusing a cached result for the same kind and payload"""
+        def kickoff():
+            task = Task(description=description, agent=self.agent, expected_output=expected_output)
+            return self._crew.model_copy(update={'tasks': [task]}).copy().kickoff_async()
+        
+        return await _KICKOFF_CACHE(kickoff, (self.domain, self.liege_lord, kind), payload)
+
+    async def _run_scored(self, kind: str, payload: Any, description: str, expected_output: str,
+                          metrics: List[str]) -> Tuple[Any, Dict[str, Any]]:
+        """Run one task through the crew and score its result, caching the result and scores together"""
+        async def kickoff_and_score():
+            task = Task(description=description, agent=self.agent, expected_output=expected_output)
+            result = await self._crew.model_copy(update={'tasks': [task]}).copy().kickoff_async()
+            return result, await self._score_result_bundle(result, metrics)
+        
+        return await _KICKOFF_CACHE(kickoff_and_score, (self.domain, self.liege_lord, kind), payload)
+
+    # Liege Reports
 
-    async def _assess_service_quality(self, service_result: str) -> float:
-        """Assess quality of rendered service"""
-        # Implementation for quality assessment
-        return 94.5  # Example score
+    def _post_to_liege(self, kind: str, *args: Any):
+        """Queue a report for the liege lord without waiting for its delivery"""
+        global _liege_courier
+        if _liege_courier is None or _liege_courier.done():
+            _liege_courier = asyncio.create_task(_run_liege_courier())
+        try:
+            LIEGE_INBOX.put_nowait((self, kind, args))
+        except asyncio.QueueFull:
+            logger.warning(f"Serf Agent {self.agent_id} found the liege inbox full, dropping {kind} report")
 
-    async def _measure_user_satisfaction(self, service_result: str) -> float:
-        """Measure user satisfaction with service"""
-        # Implementation for satisfaction measurement
-        return 96.2  # Example score
+    # Result Scoring
+
+    async def _score_result_bundle(self, result: str, kinds: List[str]) -> Dict[str, Any]:
+        """Score a result on every requested metric with a single LLM call"""
+        rubric = "\n".join(f"- {kind}: {_SCORE_RUBRIC[kind]}" for kind in kinds)
+        prompt = f"""Assess the output below and reply with a JSON object holding exactly these keys:
+{rubric}
+
+OUTPUT:
+{result}"""
+        
+        response = await self._llms['scoring'].bind(response_format={"type": "json_object"}).ainvoke(prompt)
+        try:
+            scores = json.loads(response.content)
+        except json.JSONDecodeError:
+            logger.warning(f"Serf Agent {self.agent_id} received unparseable scores, using defaults")
+            scores = {}
+        if not isinstance(scores, dict):
+            scores = {}
+        
+        return {kind: _coerce_score(kind, scores.get(kind, _SCORE_DEFAULTS[kind])) for kind in kinds}
 
-    async def _identify_innovations(self, service_result: str) -> List[str]:
-        """Identify innovations applied in service"""
-        # Implementation for innovation identification
-        return ["responsive_design_optimization", "accessibility_enhancement"]
+    # Helper Methods
 
     async def _update_loyalty_assessment(self, service_record: ServiceRecord):
         """Update loyalty level based on service performance"""
-        if service_record.quality_score > 95:
-            self.loyalty_level = LoyaltyLevel.EXEMPLARY
-        elif service_record.quality_score > 85:
-            self.loyalty_level = LoyaltyLevel.LOYAL
-        else:
-            self.loyalty_level = LoyaltyLevel.SATISFACTORY
+        self.loyalty_level = _LOYALTY_LEVELS[bisect.bisect_left(_LOYALTY_THRESHOLDS, service_record.quality_score)]
 
     async def _report_service_completion(self, service_record: ServiceRecord, service_result: str):
         """Report service completion to liege lord"""
@@ -451,28 +791,34 @@ class EnhancedSerfAgent:
         """Generate loyalty demonstration report"""
         return f"Service rendered with {self.loyalty_level.value} loyalty, achieving {service_record.quality_score}% quality"
 
+    def _tally_service(self, service_record: ServiceRecord):
+        """Fold a new service record into the running aggregates"""
+        self._quality_sum += service_record.quality_score
+        self._quality_count += 1
+        
+        day = service_record.completion_time.date()
+        self._services_by_date[day] += 1
+        cutoff = day - timedelta(days=SERVICE_COUNT_RETENTION_DAYS)
+        for stale in [d for d in self._services_by_date if d < cutoff]:
+            del self._services_by_date[stale]
+
     async def _get_current_service_status(self) -> Dict[str, Any]:
         """Get current service status summary"""
         return {
-            'active_services': len([r for r in self.service_records if r.completion_time.date() == datetime.now().date()]),
-            'average_quality': sum(r.quality_score for r in self.service_records) / len(self.service_records) if self.service_records else 0,
+            'active_services': self._services_by_date.get(date.today(), 0),
+            'average_quality': self._quality_sum / self._quality_count if self._quality_count else 0,
             'loyalty_level': self.loyalty_level.value
         }
 
     async def _submit_protection_request(self, request_record: Dict) -> Dict[str, Any]:
         """Submit protection request to liege lord"""
         # Implementation for submitting to King AI Overseer
-        return {'response_timeline': '24 hours', 'status': 'received'}
+        return {'response_timeline': PROTECTION_RESPONSE_TIMELINE, 'status': 'received'}
 
-    async def _assess_leadership_display(self, council_contribution: str) -> float:
-        """Assess leadership potential displayed in council"""
-        # Implementation for leadership assessment
-        return 87.3  # Example score
-
-    async def _assess_collaboration(self, council_contribution: str) -> float:
-        """Assess collaboration quality in council"""
-        # Implementation for collaboration assessment
-        return 92.1  # Example score
+    async def _submit_innovation_proposal(self, innovation_record: Dict):
+        """Submit innovation proposal to liege lord"""
+        # Implementation for submitting to King AI Overseer
+        pass
 
     async def _update_advancement_potential(self, participation_record: Dict):
         """Update advancement potential based on council participation"""
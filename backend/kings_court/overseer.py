@@ -1,14 +1,50 @@
 from crewai import Agent, Task, Crew
 from langchain_openai import ChatOpenAI
-from typing import Dict, Any, List
+import httpx
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple, Union
 import json
 import logging
 import asyncio
+import bisect
+import functools
+import hashlib
+import importlib.util
+import itertools
+import os
+import string
+import time
+from collections import deque
+from types import MappingProxyType
 from datetime import datetime
 from dataclasses import dataclass
+import orjson
+from cachetools import TTLCache
+
+from serf_cache import CachedKickoff, LRUEmbeddingCache, sentence_transformer_embedder
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connection pool shared by every overseer that is not handed one
+_SHARED_HTTPX_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+)
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model_name: str, temperature: float,
+             http_async_client: Optional[httpx.AsyncClient] = None) -> ChatOpenAI:
+    """Return the process-wide ChatOpenAI for a model/temperature/client combination."""
+    return ChatOpenAI(model=model_name, temperature=temperature,
+                      http_async_client=http_async_client or _SHARED_HTTPX_CLIENT)
+
+# Plans and evaluations already produced, shared by every overseer. Evaluations
+# match their task results exactly; a plan also matches a paraphrased objective
+# by embedding, among plans made for the identical context, when
+# sentence-transformers is installed
+_PLAN_CACHE = CachedKickoff(
+    LRUEmbeddingCache(capacity=1000, ttl=3600, threshold=0.9),
+    embedder=sentence_transformer_embedder()
+)
+
 @dataclass
 class StrategicPlan:
     objective: str
@@ -18,6 +54,299 @@ class StrategicPlan:
     success_metrics: List[str]
     timeline: str
     risk_assessment: Dict[str, Any]
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], objective: str) -> 'StrategicPlan':
+        """Build a plan from parsed strategy JSON, defaulting any missing field."""
+        get = data.get
+        return cls(
+            get('objective', objective),
+            get('approach', ''),
+            get('resource_requirements') or {},
+            get('task_breakdown') or [],
+            get('success_metrics') or [],
+            get('timeline', 'Not specified'),
+            get('risk_assessment') or {}
+        )
+
+_STRATEGY_OUTPUT_FORMAT = """A comprehensive strategic plan in JSON format with the following structure:
+{
+    "objective": "string",
+    "approach": "detailed strategy description",
+    "resource_requirements": {
+        "computational": "requirements",
+        "data": "data needs",
+        "timeline": "estimated duration"
+    },
+    "task_breakdown": [
+        {
+            "agent_type": "serf|peasant",
+            "task_id": "unique_id",
+            "description": "task description",
+            "priority": 1-5,
+            "dependencies": ["task_ids"],
+            "expected_output": "description",
+            "deadline": "timeline"
+        }
+    ],
+    "success_metrics": ["metric1", "metric2"],
+    "risk_assessment": {
+        "high_risks": ["risk descriptions"],
+        "mitigation_strategies": ["strategy descriptions"],
+        "contingency_plans": ["plan descriptions"]
+    }
+}"""
+
+# Evaluation prompts carry at most this many task results, highest priority
+# first, with any longer string field cut to EVALUATION_MAX_FIELD_CHARS
+EVALUATION_MAX_TASKS = 50
+EVALUATION_MAX_FIELD_CHARS = 2000
+
+# Ranks for priorities given by name rather than on the 1-5 scale
+_PRIORITY_NAMES = MappingProxyType({'critical': 5, 'high': 4, 'medium': 3, 'low': 2})
+
+def _priority_rank(result: Dict[str, Any]) -> float:
+    """Sortable priority of a task result; unknown or missing priorities rank last."""
+    priority = result.get('priority')
+    if isinstance(priority, (int, float)) and not isinstance(priority, bool):
+        return float(priority)
+    if isinstance(priority, str):
+        text = priority.strip().lower()
+        if text in _PRIORITY_NAMES:
+            return float(_PRIORITY_NAMES[text])
+        try:
+            return float(text)
+        except ValueError:
+            pass
+    return 0.0
+
+def _context_str(context: Union[Dict[str, Any], str, None]) -> str:
+    """Context as prompt text: strings as given, anything else as compact JSON."""
+    if isinstance(context, str):
+        return context
+    return orjson.dumps(context or {}, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def _bounded_approach(text: str) -> str:
+    """
+    Raw model output kept as a fallback plan's approach, cut to MAX_APPROACH
+    characters. A cut text ends with the blake2b digest of the full output,
+    so identical runaway outputs can still be told apart and matched up.
+    """
+    if len(text) <= MAX_APPROACH:
+        return text
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return f"{text[:MAX_APPROACH]}...[truncated {len(text)} chars, blake2b {digest}]"
+
+_TRUNCATION_MARKER = " ...[truncated]"
+
+@functools.lru_cache(maxsize=1)
+def _prompt_encoding():
+    """tiktoken encoding for prompt budgets, or None when tiktoken is not installed."""
+    if importlib.util.find_spec("tiktoken") is None:
+        logger.info("tiktoken not installed; prompt budgets will be estimated at 4 characters per token")
+        return None
+    import tiktoken
+    return tiktoken.encoding_for_model("gpt-4")
+
+def _count_tokens(text: str) -> int:
+    encoding = _prompt_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    encoding = _prompt_encoding()
+    if encoding is None:
+        return text[:max_tokens * 4]
+    return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+
+def _fit_prompt(template: string.Template, trim: str, **parts: str) -> str:
+    """
+    Substitute `parts` into `template`, cutting the part named `trim` down
+    so the prompt stays within MAX_PROMPT_TOKENS.
+    
+    Raises:
+        ValueError: If the prompt is over budget even with that part emptied
+    """
+    prompt = template.substitute(parts)
+    overflow = _count_tokens(prompt) - MAX_PROMPT_TOKENS
+    if overflow <= 0:
+        return prompt
+    
+    keep = _count_tokens(parts[trim]) - overflow - _count_tokens(_TRUNCATION_MARKER)
+    if keep <= 0:
+        raise ValueError(f"Prompt exceeds the {MAX_PROMPT_TOKENS}-token budget even without its {trim}")
+    logger.warning(f"Prompt {overflow} tokens over budget; truncating its {trim}")
+    parts[trim] = _truncate_to_tokens(parts[trim], keep) + _TRUNCATION_MARKER
+    return template.substitute(parts)
+
+def _loads(text: str) -> Any:
+    """orjson.loads, falling back to the stdlib for raw control characters inside strings."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text, strict=False)
+
+# Completion estimates by agent type: base minutes (serf 5, peasant 10) times
+# 1, 2 or 3 for descriptions up to 200, up to 500 and over 500 characters
+_COMPLETION_LENGTH_THRESHOLDS = (200, 500)
+_COMPLETION_ESTIMATES = MappingProxyType({
+    agent_type: tuple(f"{base_minutes * multiplier} minutes" for multiplier in (1, 2, 3))
+    for agent_type, base_minutes in (('serf', 5), ('peasant', 10))
+})
+
+# Longest model output kept as the approach of a plan that could not be parsed
+MAX_APPROACH = 64_000
+
+# Strategies kept for monitoring: the most recent ACTIVE_STRATEGY_LIMIT,
+# each for at most ACTIVE_STRATEGY_TTL seconds
+ACTIVE_STRATEGY_LIMIT = 1024
+ACTIVE_STRATEGY_TTL = 86400
+
+# Token budget for the variable-length prompts; the largest variable part is
+# cut down to fit, leaving the rest of gpt-4's 8k context for the response
+MAX_PROMPT_TOKENS = 6000
+
+# Most recent delegations kept in an overseer's history
+DELEGATION_HISTORY_LIMIT = 10_000
+
+# Prompt skeletons, built once; only the variable parts are spliced in per call
+_STRATEGY_TMPL = string.Template("""
+            As the King AI Overseer, develop a comprehensive strategy for the following objective:
+            
+            OBJECTIVE: $objective
+            
+            CURRENT CONTEXT:
+            $context_str
+            
+            Your strategic plan must include:
+            
+            1. STRATEGIC APPROACH:
+               - Overall strategy and methodology
+               - Key phases and milestones
+               - Success criteria and metrics
+               
+            2. RESOURCE REQUIREMENTS:
+               - Computational resources needed
+               - Data requirements and sources
+               - Time and personnel allocations
+               
+            3. TASK BREAKDOWN:
+               - Specific tasks for Serf Frontend Agent
+               - Specific tasks for Peasant Backend Agent
+               - Coordination points and dependencies
+               
+            4. RISK ASSESSMENT:
+               - Potential risks and challenges
+               - Mitigation strategies
+               - Contingency plans
+               
+            5. MONITORING AND CONTROL:
+               - Key performance indicators
+               - Progress tracking mechanisms
+               - Decision points for strategy adjustment
+               
+            Provide your response in a structured format that can be easily parsed
+            and implemented by subordinate agents.
+            """)
+
+_EVALUATION_TMPL = string.Template("""
+            As the King AI Overseer, evaluate the performance of the $agent_type agent
+            based on the following completed tasks:
+            
+            TASK RESULTS:
+            $task_results
+            
+            Provide an evaluation including:
+            1. Overall performance score (1-10)
+            2. Strengths demonstrated
+            3. Areas for improvement
+            4. Specific recommendations
+            5. Resource allocation adjustments needed
+            
+            Consider factors such as:
+            - Task completion quality
+            - Timeliness of delivery
+            - Resource efficiency
+            - Adherence to instructions
+            - Innovation and problem-solving
+            """)
+
+class _StrategyScanner:
+    """
+    Incremental, event-driven scanner over a strategic plan's JSON as it
+    streams in. Nesting and string state carry across fed chunks, so each
+    task_breakdown entry is returned as soon as its closing brace arrives,
+    and the first complete top-level object that parses is kept as the plan.
+    Prose around the JSON and any later blocks are ignored.
+    """
+    
+    def __init__(self):
+        self.text = ''
+        self.plan: Optional[Dict[str, Any]] = None
+        self._pos = 0
+        self._open: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_key = None
+        self._object_start = 0
+        self._item_start = 0
+        self._in_breakdown = False
+    
+    def feed(self, delta: str) -> List[Dict[str, Any]]:
+        """Add streamed text and return the task entries it completed."""
+        self.text += delta
+        tasks = []
+        if self.plan is not None:
+            return tasks
+        
+        text = self.text
+        opened = self._open
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(opened) == 1:
+                        self._last_key = text[self._string_start:i + 1]
+            elif not opened:
+                if char == '{':
+                    opened.append(char)
+                    self._object_start = i
+                    self._last_key = None
+            elif char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == '{' or char == '[':
+                if char == '[' and len(opened) == 1 and self._last_key == '"task_breakdown"':
+                    self._in_breakdown = True
+                elif char == '{' and self._in_breakdown and len(opened) == 2:
+                    self._item_start = i
+                opened.append(char)
+            elif char == '}' or char == ']':
+                opened.pop()
+                depth = len(opened)
+                if self._in_breakdown and depth == 2 and char == '}':
+                    try:
+                        tasks.append(_loads(text[self._item_start:i + 1]))
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Skipping unparseable streamed task: {e}")
+                elif self._in_breakdown and depth == 1:
+                    self._in_breakdown = False
+                elif depth == 0:
+                    try:
+                        self.plan = _loads(text[self._object_start:i + 1])
+                    except json.JSONDecodeError:
+                        continue
+                    self._pos = i + 1
+                    return tasks
+        self._pos = len(text)
+        return tasks
 
 class KingAIOverseer:
     """
@@ -26,8 +355,10 @@ class KingAIOverseer:
     and coordinating subordinate agents.
     """
     
-    def __init__(self, model_name: str = "gpt-4", temperature: float = 0.1):
-        self.llm = ChatOpenAI(model=model_name, temperature=temperature)
+    def __init__(self, model_name: str = "gpt-4", temperature: float = 0.1,
+                 http_async_client: Optional[httpx.AsyncClient] = None,
+                 max_delegation_batch: int = 64):
+        self.llm = _get_llm(model_name, temperature, http_async_client)
         self.agent = Agent(
             role="Strategic Overseer and Supreme Commander",
             goal="""Coordinate system-wide operations, make strategic decisions,
@@ -53,109 +384,108 @@ class KingAIOverseer:
             memory=True
         )
         
-        self.delegation_history = []
-        self.active_strategies = {}
+        self.delegation_history = deque(maxlen=DELEGATION_HISTORY_LIMIT)
+        self.active_strategies: TTLCache = TTLCache(maxsize=ACTIVE_STRATEGY_LIMIT, ttl=ACTIVE_STRATEGY_TTL)
+        
+        # Ids: process, overseer start time and a per-overseer sequence
+        self._id_counter = itertools.count()
+        self._id_prefix = f"{os.getpid():x}_{int(time.time()):x}"
+        
+        # Delegations are recorded and published in micro-batches by a single
+        # courier task. The batch size adapts between 1 and max_delegation_batch:
+        # it doubles while a backlog remains and halves when the queue runs dry
+        self._delegation_queue: asyncio.Queue = asyncio.Queue()
+        self._delegation_courier: Optional[asyncio.Task] = None
+        self._delegation_batch_size = 1
+        self._max_delegation_batch = max_delegation_batch
         
-    async def strategize(self, objective: str, context: Dict[str, Any] = None) -> StrategicPlan:
+    async def strategize(self, objective: str,
+                         context: Union[Dict[str, Any], str, None] = None) -> StrategicPlan:
         """
         Develop a comprehensive strategy for achieving complex objectives.
         
         Args:
             objective: The high-level objective to achieve
-            context: Additional context including system state, constraints, etc.
+            context: Additional context including system state, constraints, etc.,
+                or the same already formatted as text
             
         Returns:
             StrategicPlan: Detailed strategic plan with delegated tasks
         """
         logger.info(f"King AI Overseer developing strategy for: {objective}")
         
-        context_str = json.dumps(context or {}, indent=2)
+        context_str = _context_str(context)
         
         task = Task(
-            description=f"""
-            As the King AI Overseer, develop a comprehensive strategy for the following objective:
-            
-            OBJECTIVE: {objective}
-            
-            CURRENT CONTEXT:
-            {context_str}
-            
-            Your strategic plan must include:
-            
-            1. STRATEGIC APPROACH:
-               - Overall strategy and methodology
-               - Key phases and milestones
-               - Success criteria and metrics
-               
-            2. RESOURCE REQUIREMENTS:
-               - Computational resources needed
-               - Data requirements and sources
-               - Time and personnel allocations
-               
-            3. TASK BREAKDOWN:
-               - Specific tasks for Serf Frontend Agent
-               - Specific tasks for Peasant Backend Agent
-               - Coordination points and dependencies
-               
-            4. RISK ASSESSMENT:
-               - Potential risks and challenges
-               - Mitigation strategies
-               - Contingency plans
-               
-            5. MONITORING AND CONTROL:
-               - Key performance indicators
-               - Progress tracking mechanisms
-               - Decision points for strategy adjustment
-               
-            Provide your response in a structured format that can be easily parsed
-            and implemented by subordinate agents.
-            """,
+            description=self._strategy_description(objective, context_str),
             agent=self.agent,
-            expected_output="""A comprehensive strategic plan in JSON format with the following structure:
-            {
-                "objective": "string",
-                "approach": "detailed strategy description",
-                "resource_requirements": {
-                    "computational": "requirements",
-                    "data": "data needs",
-                    "timeline": "estimated duration"
-                },
-                "task_breakdown": [
-                    {
-                        "agent_type": "serf|peasant",
-                        "task_id": "unique_id",
-                        "description": "task description",
-                        "priority": 1-5,
-                        "dependencies": ["task_ids"],
-                        "expected_output": "description",
-                        "deadline": "timeline"
-                    }
-                ],
-                "success_metrics": ["metric1", "metric2"],
-                "risk_assessment": {
-                    "high_risks": ["risk descriptions"],
-                    "mitigation_strategies": ["strategy descriptions"],
-                    "contingency_plans": ["plan descriptions"]
-                }
-            }"""
+            expected_output=_STRATEGY_OUTPUT_FORMAT
         )
         
+        # Copied so concurrent calls each get their own agent executor
         crew = Crew(
             agents=[self.agent],
             tasks=[task],
             verbose=True
-        )
+        ).copy()
         
-        result = crew.kickoff()
+        result = await _PLAN_CACHE(
+            crew.kickoff_async,
+            ('strategize', self.llm.model_name, hashlib.sha256(context_str.encode()).hexdigest()),
+            objective
+        )
         strategy = self._parse_strategy_result(result, objective)
         
         # Store strategy for monitoring
-        strategy_id = f"strategy_{datetime.now().isoformat()}"
+        strategy_id = self._next_id("strategy")
         self.active_strategies[strategy_id] = strategy
         
         logger.info(f"Strategic plan developed with {len(strategy.task_breakdown)} delegated tasks")
         return strategy
     
+    async def strategize_stream(self, objective: str,
+                                context: Union[Dict[str, Any], str, None] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Develop a strategy as `strategize` does, streaming the model's output so
+        each planned task is delegated as soon as the model has finished writing it.
+        
+        Args:
+            objective: The high-level objective to achieve
+            context: Additional context including system state, constraints, etc.,
+                or the same already formatted as text
+            
+        Yields:
+            ('delegation', delegation) for each planned task, in plan order,
+            then ('strategy', StrategicPlan) once the whole plan has arrived
+        """
+        logger.info(f"King AI Overseer streaming strategy for: {objective}")
+        
+        context_str = _context_str(context)
+        messages = [
+            ("system", self.agent.backstory),
+            ("human", f"{self._strategy_description(objective, context_str)}\n"
+                      f"Respond with {_STRATEGY_OUTPUT_FORMAT}")
+        ]
+        
+        scanner = _StrategyScanner()
+        pending: List[asyncio.Task] = []
+        async for chunk in self.llm.astream(messages):
+            for task_info in scanner.feed(chunk.content):
+                pending.append(asyncio.create_task(self._delegate_planned_task(task_info)))
+            while pending and pending[0].done():
+                yield 'delegation', pending.pop(0).result()
+        for delegation in pending:
+            yield 'delegation', await delegation
+        
+        strategy = self._parse_strategy_result(scanner.text, objective, scanner)
+        
+        # Store strategy for monitoring
+        strategy_id = self._next_id("strategy")
+        self.active_strategies[strategy_id] = strategy
+        
+        logger.info(f"Streamed strategic plan developed with {len(strategy.task_breakdown)} delegated tasks")
+        yield 'strategy', strategy
+    
     async def delegate_task(self, agent_type: str, task_description: str, 
                           priority: int = 3, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -170,27 +500,66 @@ class KingAIOverseer:
         Returns:
             Dict containing delegation details
         """
-        delegation = {
-            'delegation_id': f"del_{datetime.now().isoformat()}_{agent_type}",
-            'agent_type': agent_type,
-            'task': task_description,
-            'priority': priority,
-            'context': context or {},
-            'delegated_by': 'King AI Overseer',
-            'timestamp': datetime.now().isoformat(),
-            'status': 'pending',
-            'expected_completion': self._estimate_completion_time(task_description, agent_type)
-        }
+        if self._delegation_courier is None:
+            self._delegation_courier = asyncio.create_task(self._run_delegation_courier())
+        
+        delegated = asyncio.get_running_loop().create_future()
+        self._delegation_queue.put_nowait((delegated, agent_type, task_description, priority, context))
+        return await delegated
+    
+    async def _run_delegation_courier(self):
+        """Drain the delegation queue in adaptively sized batches."""
+        queue = self._delegation_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._delegation_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            if not queue.empty():
+                self._delegation_batch_size = min(self._delegation_batch_size * 2, self._max_delegation_batch)
+            else:
+                self._delegation_batch_size = max(self._delegation_batch_size // 2, 1)
+            
+            try:
+                delegations = self._record_delegations([item[1:] for item in batch])
+            except Exception as e:
+                for delegated, *_ in batch:
+                    if not delegated.cancelled():
+                        delegated.set_exception(e)
+                continue
+            for (delegated, *_), delegation in zip(batch, delegations):
+                if not delegated.cancelled():
+                    delegated.set_result(delegation)
+    
+    def _record_delegations(self, requests: List[Tuple[str, str, int, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Build, record and log a batch of delegations."""
+        now_iso = datetime.now().isoformat()
+        delegations = [
+            {
+                'delegation_id': f"{self._next_id('del')}_{agent_type}",
+                'agent_type': agent_type,
+                'task': task_description,
+                'priority': priority,
+                'context': context or {},
+                'delegated_by': 'King AI Overseer',
+                'timestamp': now_iso,
+                'status': 'pending',
+                'expected_completion': self._estimate_completion_time(task_description, agent_type)
+            }
+            for agent_type, task_description, priority, context in requests
+        ]
         
         # Add to delegation history
-        self.delegation_history.append(delegation)
+        self.delegation_history.extend(delegations)
         
-        # Log the delegation
-        logger.info(f"Task delegated to {agent_type}: {task_description[:100]}...")
+        # Log the batch as one record
+        logger.info(f"{len(delegations)} task(s) delegated: " + "; ".join(
+            f"{d['agent_type']}: {d['task'][:100]}" for d in delegations
+        ))
         
-        # In a real implementation, this would send to message queue
-        # For now, we'll return the delegation object
-        return delegation
+        # In a real implementation, the batch would go to the message queue as
+        # one publish; for now the delegation objects are returned
+        return delegations
     
     async def evaluate_agent_performance(self, agent_type: str, 
                                        task_results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -205,33 +574,17 @@ class KingAIOverseer:
             Performance evaluation and recommendations
         """
         task = Task(
-            description=f"""
-            As the King AI Overseer, evaluate the performance of the {agent_type} agent
-            based on the following completed tasks:
-            
-            TASK RESULTS:
-            {json.dumps(task_results, indent=2)}
-            
-            Provide an evaluation including:
-            1. Overall performance score (1-10)
-            2. Strengths demonstrated
-            3. Areas for improvement
-            4. Specific recommendations
-            5. Resource allocation adjustments needed
-            
-            Consider factors such as:
-            - Task completion quality
-            - Timeliness of delivery
-            - Resource efficiency
-            - Adherence to instructions
-            - Innovation and problem-solving
-            """,
+            description=_fit_prompt(
+                _EVALUATION_TMPL, 'task_results',
+                agent_type=agent_type,
+                task_results=self._summarize_task_results(task_results)
+            ),
             agent=self.agent,
             expected_output="Detailed performance evaluation with scores and recommendations"
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        evaluation = crew.kickoff()
+        crew = Crew(agents=[self.agent], tasks=[task]).copy()
+        evaluation = await _PLAN_CACHE(crew.kickoff_async, ('evaluate', self.llm.model_name, agent_type), task_results)
         
         return {
             'agent_type': agent_type,
@@ -257,30 +610,21 @@ class KingAIOverseer:
         coordination_plan = {
             'objective': complex_objective,
             'strategy': strategy,
-            'coordination_id': f"coord_{datetime.now().isoformat()}",
+            'coordination_id': self._next_id('coord'),
             'agents_involved': [],
             'task_dependencies': [],
             'execution_timeline': [],
             'coordination_points': []
         }
         
-        # Delegate tasks based on strategy
-        delegated_tasks = []
-        for task_info in strategy.task_breakdown:
-            delegation = await self.delegate_task(
-                agent_type=task_info['agent_type'],
-                task_description=task_info['description'],
-                priority=task_info['priority'],
-                context={
-                    'coordination_id': coordination_plan['coordination_id'],
-                    'dependencies': task_info.get('dependencies', []),
-                    'expected_output': task_info.get('expected_output', '')
-                }
-            )
-            delegated_tasks.append(delegation)
+        # Delegate tasks based on strategy, all at once; results keep breakdown order
+        delegated_tasks = await asyncio.gather(*(
+            self._delegate_planned_task(task_info, coordination_id=coordination_plan['coordination_id'])
+            for task_info in strategy.task_breakdown
+        ))
         
         coordination_plan['delegated_tasks'] = delegated_tasks
-        coordination_plan['agents_involved'] = list(set(task['agent_type'] for task in delegated_tasks))
+        coordination_plan['agents_involved'] = list(dict.fromkeys(task['agent_type'] for task in delegated_tasks))
         
         logger.info(f"Multi-agent coordination initiated for: {complex_objective}")
         logger.info(f"Agents involved: {coordination_plan['agents_involved']}")
@@ -288,33 +632,70 @@ class KingAIOverseer:
         
         return coordination_plan
     
-    def _parse_strategy_result(self, result: str, objective: str) -> StrategicPlan:
-        """Parse the strategy result from the AI agent into a structured format."""
+    async def _delegate_planned_task(self, task_info: Dict[str, Any], **context: Any) -> Dict[str, Any]:
+        """Delegate one task_breakdown entry of a strategic plan."""
+        return await self.delegate_task(
+            agent_type=task_info['agent_type'],
+            task_description=task_info['description'],
+            priority=task_info['priority'],
+            context={
+                **context,
+                'dependencies': task_info.get('dependencies', []),
+                'expected_output': task_info.get('expected_output', '')
+            }
+        )
+    
+    def _summarize_task_results(self, task_results: List[Dict[str, Any]]) -> str:
+        """Compact JSON of the task results to evaluate, trimmed to the prompt budget."""
+        kept = task_results
+        if len(kept) > EVALUATION_MAX_TASKS:
+            kept = sorted(kept, key=_priority_rank, reverse=True)[:EVALUATION_MAX_TASKS]
+        kept = [
+            {
+                key: value[:EVALUATION_MAX_FIELD_CHARS] + '...[truncated]'
+                if isinstance(value, str) and len(value) > EVALUATION_MAX_FIELD_CHARS else value
+                for key, value in result.items()
+            }
+            for result in kept
+        ]
+        summary = orjson.dumps(kept, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+        omitted = len(task_results) - len(kept)
+        if omitted:
+            summary += f"\n(and {omitted} lower-priority task results omitted)"
+        return summary
+    
+    def _next_id(self, kind: str) -> str:
+        return f"{kind}_{self._id_prefix}_{next(self._id_counter):x}"
+    
+    def _strategy_description(self, objective: str, context_str: str) -> str:
+        """Build the strategic planning prompt for an objective."""
+        return _fit_prompt(_STRATEGY_TMPL, 'context_str', objective=objective, context_str=context_str)
+    
+    def _parse_strategy_result(self, result: str, objective: str,
+                               scanner: Optional[_StrategyScanner] = None) -> StrategicPlan:
+        """
+        Parse the strategy result from the AI agent into a structured format.
+        
+        `scanner` is one that was already fed `result` as it streamed in.
+        """
         try:
             # Try to extract JSON from the result
-            import re
-            json_match = re.search(r'\{.*\}', result.replace('\n', ' '), re.DOTALL)
-            if json_match:
-                strategy_data = json.loads(json_match.group())
+            if scanner is None:
+                scanner = _StrategyScanner()
+                scanner.feed(result)
+            if scanner.plan is not None:
+                strategy_data = scanner.plan
             else:
                 # Fallback to parsing text result
                 strategy_data = self._parse_text_strategy(result)
             
-            return StrategicPlan(
-                objective=strategy_data.get('objective', objective),
-                approach=strategy_data.get('approach', ''),
-                resource_requirements=strategy_data.get('resource_requirements', {}),
-                task_breakdown=strategy_data.get('task_breakdown', []),
-                success_metrics=strategy_data.get('success_metrics', []),
-                timeline=strategy_data.get('timeline', 'Not specified'),
-                risk_assessment=strategy_data.get('risk_assessment', {})
-            )
+            return StrategicPlan.from_data(strategy_data, objective)
         except Exception as e:
             logger.warning(f"Failed to parse strategy result: {e}")
             # Return a basic strategy plan
             return StrategicPlan(
                 objective=objective,
-                approach=result,
+                approach=_bounded_approach(result),
                 resource_requirements={},
                 task_breakdown=[],
                 success_metrics=[],
@@ -327,7 +708,7 @@ class KingAIOverseer:
         # Basic text parsing logic
         return {
             'objective': 'Parsed from text',
-            'approach': text,
+            'approach': _bounded_approach(text),
             'resource_requirements': {},
             'task_breakdown': [],
             'success_metrics': [],
@@ -337,28 +718,19 @@ class KingAIOverseer:
     def _estimate_completion_time(self, task_description: str, agent_type: str) -> str:
         """Estimate completion time based on task complexity and agent type."""
         # Simple heuristic - in reality this would be more sophisticated
-        task_length = len(task_description)
-        
-        if agent_type == 'serf':
-            base_time = 5  # minutes for serf tasks
-        else:  # peasant
-            base_time = 10  # minutes for peasant tasks
-        
-        # Adjust based on task complexity
-        if task_length > 500:
-            multiplier = 3
-        elif task_length > 200:
-            multiplier = 2
-        else:
-            multiplier = 1
-        
-        estimated_minutes = base_time * multiplier
-        return f"{estimated_minutes} minutes"
+        estimates = _COMPLETION_ESTIMATES.get(agent_type, _COMPLETION_ESTIMATES['peasant'])
+        return estimates[bisect.bisect_left(_COMPLETION_LENGTH_THRESHOLDS, len(task_description))]
+    
+    def get_delegation_history(self) -> Tuple[Dict[str, Any], ...]:
+        """Get the recent delegations made by this King AI Overseer, oldest first."""
+        return tuple(self.delegation_history)
     
-    def get_delegation_history(self) -> List[Dict[str, Any]]:
-        """Get the history of all delegations made by this King AI Overseer."""
-        return self.delegation_history.copy()
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """Get the last n delegations made by this King AI Overseer, oldest first."""
+        recent = list(itertools.islice(reversed(self.delegation_history), max(n, 0)))
+        recent.reverse()
+        return recent
     
     def get_active_strategies(self) -> Dict[str, StrategicPlan]:
         """Get all currently active strategies."""
-        return self.active_strategies.copy()
\ No newline at end of file
+        return dict(self.active_strategies)
\ No newline at end of file
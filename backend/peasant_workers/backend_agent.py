@@ -1,15 +1,121 @@
 from langgraph import StateGraph, END
 from langchain_openai import ChatOpenAI
+import httpx
 from typing import Dict, Any, List, Optional
-import json
+import orjson
 import logging
 import asyncio
+import functools
+import inspect
+import itertools
+import re
+import time
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, field
 from enum import Enum
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive HTTP/2 connection pool shared by every backend agent not handed one
+_SHARED_HTTPX_CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+)
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model_name: str, temperature: float,
+             http_async_client: Optional[httpx.AsyncClient] = None) -> ChatOpenAI:
+    """Return the process-wide ChatOpenAI for a model/temperature/client combination."""
+    return ChatOpenAI(model=model_name, temperature=temperature,
+                      http_async_client=http_async_client or _SHARED_HTTPX_CLIENT)
+
+# Request priorities the queue orders by; anything else queues at the default
+MIN_PRIORITY = 1
+MAX_PRIORITY = 5
+DEFAULT_PRIORITY = 3
+
+def _queue_priority(priority: Any) -> int:
+    """Priority as an int within MIN_PRIORITY..MAX_PRIORITY, DEFAULT_PRIORITY if it is not a number."""
+    try:
+        return min(max(int(priority), MIN_PRIORITY), MAX_PRIORITY)
+    except (TypeError, ValueError):
+        return DEFAULT_PRIORITY
+
+# Script tags and destructive SQL stripped from string input, in one pass
+_SANITIZE_RE = re.compile(r'<script>|</script>|DROP TABLE|DELETE FROM', re.IGNORECASE)
+
+# Agent methods handling each request type at each stage. Request types with no
+# preprocessor pass their sanitized data through; types with no processor are
+# echoed back as completed. Processors may be sync or async.
+_PREPROCESSORS = MappingProxyType({
+    'data_analysis': '_preprocess_for_analysis',
+    'data_transformation': '_preprocess_for_transformation',
+    'computation': '_preprocess_for_computation'
+})
+_PROCESSORS = MappingProxyType({
+    'data_analysis': '_perform_data_analysis',
+    'data_transformation': '_perform_data_transformation',
+    'computation': '_perform_computation',
+    'integration': '_perform_integration'
+})
+# Analyses by metadata['analysis_type'], falling back to the basic analysis
+_ANALYSES = MappingProxyType({
+    'statistical': '_statistical_analysis',
+    'trend': '_trend_analysis'
+})
+
+# Finished results kept per agent for status lookups; the oldest go first
+COMPLETED_TASK_HISTORY = 10_000
+
+# Numeric strings converted for analysis; a fractional part makes them floats
+_NUM_RE = re.compile(r'-?\d+(\.\d+)?')
+
+def _approx_json_size(obj: Any, limit: Optional[int] = None) -> int:
+    """
+    Rough size in bytes of obj encoded as JSON, counted without encoding it.
+    Counting stops as soon as the total passes limit.
+    """
+    size = 0
+    pending = [obj]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, str):
+            size += len(value) + 2
+        elif isinstance(value, dict):
+            size += 2 + 4 * len(value)  # braces, key quotes, colons, commas
+            for key, item in value.items():
+                size += len(key) if isinstance(key, str) else 20
+                pending.append(item)
+        elif isinstance(value, (list, tuple)):
+            size += 2 + len(value)
+            pending.extend(value)
+        else:
+            size += 20  # numbers, booleans, null
+        if limit is not None and size > limit:
+            break
+    return size
+
+class _LazyJson:
+    """Log argument that is encoded as indented JSON only if the record is emitted."""
+    __slots__ = ('obj',)
+    
+    def __init__(self, obj: Any):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        return orjson.dumps(self.obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+def _numeric_values(data: Dict[str, Any]) -> np.ndarray:
+    """The int and float values of data (booleans excluded) as one float64 array."""
+    return np.fromiter(
+        (value for value in data.values() if isinstance(value, (int, float)) and not isinstance(value, bool)),
+        dtype=np.float64
+    )
+
 class TaskStatus(Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -25,7 +131,7 @@ class ProcessingStage(Enum):
     STORAGE = "storage"
     NOTIFICATION = "notification"
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingRequest:
     request_id: str
     request_type: str
@@ -36,7 +142,7 @@ class ProcessingRequest:
     deadline: Optional[str] = None
     metadata: Dict[str, Any] = None
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     request_id: str
     status: TaskStatus
@@ -46,6 +152,31 @@ class ProcessingResult:
     error_message: Optional[str] = None
     warnings: List[str] = None
 
+@dataclass(slots=True)
+class ProcessingState:
+    """State carried through the processing workflow; each stage mutates it in place"""
+    agent: "PeasantBackendAgent"
+    request: ProcessingRequest
+    processed_data: Optional[Dict[str, Any]] = None
+    validation_results: Optional[Dict[str, Any]] = None
+    processing_results: Optional[Dict[str, Any]] = None
+    serialized_results: bytes = b''
+    completed_at: str = ''
+    storage_results: Dict[str, Any] = field(default_factory=dict)
+    notification_results: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    warnings: List[str] = field(default_factory=list)
+    stages_completed: List[str] = field(default_factory=list)
+    current_stage: str = 'validation'
+
+@dataclass(slots=True)
+class PerformanceMetrics:
+    """Running totals over every request an agent has finished"""
+    total_processed: int = 0
+    total_failed: int = 0
+    average_processing_time: float = 0.0
+    queue_length: int = 0
+
 class PeasantBackendAgent:
     """
     The Peasant Farmer Backend Agent handles data processing, business logic
@@ -53,36 +184,58 @@ class PeasantBackendAgent:
     by performing the computational work required by higher-level agents.
     """
     
-    def __init__(self, model_name: str = "gpt-3.5-turbo", temperature: float = 0.3):
-        self.llm = ChatOpenAI(model=model_name, temperature=temperature)
-        self.workflow = self.create_workflow()
-        self.processing_queue = asyncio.Queue()
+    # The processing workflow is compiled once per class. Its nodes run on
+    # the agent carried in state.agent.
+    _COMPILED_WORKFLOW = None
+    
+    def __init__(self, model_name: str = "gpt-3.5-turbo", temperature: float = 0.3,
+                 http_async_client: Optional[httpx.AsyncClient] = None,
+                 use_langgraph: bool = False, num_workers: int = 8):
+        self.llm = _get_llm(model_name, temperature, http_async_client)
+        # Requests run through _run_pipeline unless the LangGraph workflow is asked for
+        self.workflow = type(self)._get_compiled_workflow() if use_langgraph else None
+        # Submitted requests wait here, highest priority first and in arrival
+        # order within a priority, for one of num_workers worker tasks
+        self.processing_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._queue_seq = itertools.count()
+        self._num_workers = num_workers
+        self._workers: List[asyncio.Task] = []
         self.active_tasks = {}
-        self.completed_tasks = {}
-        self.performance_metrics = {
-            'total_processed': 0,
-            'total_failed': 0,
-            'average_processing_time': 0.0,
-            'queue_length': 0
-        }
-        
-    def create_workflow(self) -> StateGraph:
+        self.completed_tasks: "OrderedDict[str, ProcessingResult]" = OrderedDict()
+        self.performance_metrics = PerformanceMetrics()
+        
+    @classmethod
+    def _get_compiled_workflow(cls):
+        """Return the class's compiled workflow, compiling it on first use."""
+        if cls.__dict__.get('_COMPILED_WORKFLOW') is None:
+            cls._COMPILED_WORKFLOW = cls.create_workflow()
+        return cls._COMPILED_WORKFLOW
+    
+    @staticmethod
+    def _agent_node(stage):
+        """Wrap an unbound stage method as a node run by the state's agent."""
+        async def node(state: ProcessingState) -> ProcessingState:
+            return await stage(state.agent, state)
+        return node
+    
+    @classmethod
+    def create_workflow(cls) -> StateGraph:
         """Create a stateful workflow for data processing operations."""
-        workflow = StateGraph()
+        workflow = StateGraph(ProcessingState)
         
         # Define workflow nodes (processing stages)
-        workflow.add_node("validate_input", self.validate_input)
-        workflow.add_node("preprocess_data", self.preprocess_data)
-        workflow.add_node("process_data", self.process_data)
-        workflow.add_node("postprocess_data", self.postprocess_data)
-        workflow.add_node("store_results", self.store_results)
-        workflow.add_node("notify_completion", self.notify_completion)
-        workflow.add_node("handle_error", self.handle_error)
+        workflow.add_node("validate_input", cls._agent_node(cls.validate_input))
+        workflow.add_node("preprocess_data", cls._agent_node(cls.preprocess_data))
+        workflow.add_node("process_data", cls._agent_node(cls.process_data))
+        workflow.add_node("postprocess_data", cls._agent_node(cls.postprocess_data))
+        workflow.add_node("store_results", cls._agent_node(cls.store_results))
+        workflow.add_node("notify_completion", cls._agent_node(cls.notify_completion))
+        workflow.add_node("handle_error", cls._agent_node(cls.handle_error))
         
         # Define conditional edges
         workflow.add_conditional_edges(
             "validate_input",
-            self.should_continue_processing,
+            cls.should_continue_processing,
             {
                 "continue": "preprocess_data",
                 "error": "handle_error"
@@ -91,7 +244,7 @@ class PeasantBackendAgent:
         
         workflow.add_conditional_edges(
             "preprocess_data",
-            self.should_continue_processing,
+            cls.should_continue_processing,
             {
                 "continue": "process_data",
                 "error": "handle_error"
@@ -100,7 +253,7 @@ class PeasantBackendAgent:
         
         workflow.add_conditional_edges(
             "process_data",
-            self.should_continue_processing,
+            cls.should_continue_processing,
             {
                 "continue": "postprocess_data",
                 "error": "handle_error"
@@ -109,7 +262,7 @@ class PeasantBackendAgent:
         
         workflow.add_conditional_edges(
             "postprocess_data",
-            self.should_continue_processing,
+            cls.should_continue_processing,
             {
                 "continue": "store_results",
                 "error": "handle_error"
@@ -126,6 +279,43 @@ class PeasantBackendAgent:
         
         return workflow.compile()
     
+    async def submit_request(self, request: ProcessingRequest) -> ProcessingResult:
+        """
+        Queue a request for the worker pool, ahead of any lower-priority
+        requests still waiting, and wait for its result.
+        
+        Args:
+            request: The processing request to handle
+            
+        Returns:
+            ProcessingResult: Results of the processing operation
+        """
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self._num_workers)]
+        
+        done = asyncio.get_running_loop().create_future()
+        self.processing_queue.put_nowait((-_queue_priority(request.priority), next(self._queue_seq), request, done))
+        return await done
+    
+    async def _worker(self):
+        """Process queued requests one at a time, for as long as the agent lives."""
+        while True:
+            _, _, request, done = await self.processing_queue.get()
+            if done.done():
+                # The submitter gave up (e.g. a cancelled prefetch); skip the work
+                self.processing_queue.task_done()
+                continue
+            try:
+                result = await self.process_request(request)
+            except Exception as e:
+                if not done.cancelled():
+                    done.set_exception(e)
+            else:
+                if not done.cancelled():
+                    done.set_result(result)
+            finally:
+                self.processing_queue.task_done()
+    
     async def process_request(self, request: ProcessingRequest) -> ProcessingResult:
         """
         Process an incoming request through the complete workflow.
@@ -136,42 +326,33 @@ class PeasantBackendAgent:
         Returns:
             ProcessingResult: Results of the processing operation
         """
-        start_time = datetime.now()
-        logger.info(f"Peasant Backend Agent processing request: {request.request_id}")
+        start_time = time.perf_counter()
+        logger.info("Peasant Backend Agent processing request: %s", request.request_id)
         
         # Initialize processing state
-        state = {
-            'request': request,
-            'original_data': request.data.copy(),
-            'processed_data': None,
-            'validation_results': None,
-            'processing_results': None,
-            'storage_results': None,
-            'error': None,
-            'warnings': [],
-            'stages_completed': [],
-            'current_stage': 'validation'
-        }
+        state = ProcessingState(agent=self, request=request)
         
         # Add to active tasks
         self.active_tasks[request.request_id] = state
         
         try:
             # Execute the workflow
-            result_state = await self.workflow.ainvoke(state)
+            if self.workflow is not None:
+                result_state = await self.workflow.ainvoke(state)
+            else:
+                result_state = await self._run_pipeline(state)
             
             # Calculate processing time
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             # Create result object
-            if result_state.get('error'):
+            if result_state.error:
                 status = TaskStatus.FAILED
-                result_data = {'error': result_state['error']}
-                error_message = result_state['error']
+                result_data = {'error': result_state.error}
+                error_message = result_state.error
             else:
                 status = TaskStatus.COMPLETED
-                result_data = result_state.get('processing_results', {})
+                result_data = result_state.processing_results or {}
                 error_message = None
             
             result = ProcessingResult(
@@ -179,40 +360,55 @@ class PeasantBackendAgent:
                 status=status,
                 result_data=result_data,
                 processing_time=processing_time,
-                stages_completed=result_state.get('stages_completed', []),
+                stages_completed=result_state.stages_completed,
                 error_message=error_message,
-                warnings=result_state.get('warnings', [])
+                warnings=result_state.warnings
             )
             
             # Store completed task
-            self.completed_tasks[request.request_id] = result
+            self._store_completed(request.request_id, result)
             
             # Update metrics
             self._update_performance_metrics(result)
             
-            logger.info(f"Request {request.request_id} completed in {processing_time:.2f}s")
+            logger.info("Request %s completed in %.2fs", request.request_id, processing_time)
             return result
             
         except Exception as e:
-            logger.error(f"Unexpected error processing request {request.request_id}: {e}")
+            logger.error("Unexpected error processing request %s: %s", request.request_id, e)
             return ProcessingResult(
                 request_id=request.request_id,
                 status=TaskStatus.FAILED,
                 result_data={},
-                processing_time=(datetime.now() - start_time).total_seconds(),
-                stages_completed=state.get('stages_completed', []),
+                processing_time=time.perf_counter() - start_time,
+                stages_completed=state.stages_completed,
                 error_message=str(e)
             )
         finally:
             # Remove from active tasks
             self.active_tasks.pop(request.request_id, None)
     
-    async def validate_input(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def _run_pipeline(self, state: ProcessingState) -> ProcessingState:
+        """
+        Run the workflow's stages in order as one coroutine, without graph
+        dispatch. Routing matches create_workflow: an error after any stage up
+        to postprocessing goes to handle_error, and storage is always followed
+        by notification.
+        """
+        for stage in (self.validate_input, self.preprocess_data, self.process_data, self.postprocess_data):
+            state = await stage(state)
+            if self.should_continue_processing(state) == "error":
+                return await self.handle_error(state)
+        
+        state = await self.store_results(state)
+        return await self.notify_completion(state)
+    
+    async def validate_input(self, state: ProcessingState) -> ProcessingState:
         """Validate incoming request data and parameters."""
-        request = state['request']
-        state['current_stage'] = 'validation'
+        request = state.request
+        state.current_stage = 'validation'
         
-        logger.debug(f"Validating input for request {request.request_id}")
+        logger.debug("Validating input for request %s", request.request_id)
         
         try:
             # Basic validation checks
@@ -230,99 +426,95 @@ class PeasantBackendAgent:
             
             # Check data types and format
             if request.data:
-                validation_results['sanitized_data'] = await self._sanitize_data(request.data)
+                validation_results['sanitized_data'] = self._sanitize_data(request.data)
             
             # Validate request type
-            supported_types = ['data_analysis', 'data_transformation', 'computation', 'integration']
-            if request.request_type not in supported_types:
+            if request.request_type not in _PROCESSORS:
                 validation_results['warnings'].append(f"Request type '{request.request_type}' may not be fully supported")
             
-            # Check data size limits
-            data_size = len(json.dumps(request.data))
+            # Check data size limits, estimated rather than serialized
+            data_size = _approx_json_size(request.data, limit=1024 * 1024)
             if data_size > 1024 * 1024:  # 1MB limit
                 validation_results['warnings'].append("Large data payload detected, processing may be slower")
             
-            state['validation_results'] = validation_results
-            state['stages_completed'].append('validation')
+            state.validation_results = validation_results
+            state.stages_completed.append('validation')
             
             if not validation_results['is_valid']:
-                state['error'] = f"Validation failed: {', '.join(validation_results['errors'])}"
+                state.error = f"Validation failed: {', '.join(validation_results['errors'])}"
             
         except Exception as e:
-            state['error'] = f"Validation error: {str(e)}"
-            logger.error(f"Validation failed for request {request.request_id}: {e}")
+            state.error = f"Validation error: {str(e)}"
+            logger.error("Validation failed for request %s: %s", request.request_id, e)
         
         return state
     
-    async def preprocess_data(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def preprocess_data(self, state: ProcessingState) -> ProcessingState:
         """Preprocess and prepare data for main processing."""
-        request = state['request']
-        state['current_stage'] = 'preprocessing'
+        request = state.request
+        state.current_stage = 'preprocessing'
         
-        logger.debug(f"Preprocessing data for request {request.request_id}")
+        logger.debug("Preprocessing data for request %s", request.request_id)
         
         try:
-            sanitized_data = state['validation_results']['sanitized_data']
+            sanitized_data = state.validation_results['sanitized_data']
             
             # Apply preprocessing based on request type
-            if request.request_type == 'data_analysis':
-                preprocessed_data = await self._preprocess_for_analysis(sanitized_data)
-            elif request.request_type == 'data_transformation':
-                preprocessed_data = await self._preprocess_for_transformation(sanitized_data)
-            elif request.request_type == 'computation':
-                preprocessed_data = await self._preprocess_for_computation(sanitized_data)
+            preprocessor = _PREPROCESSORS.get(request.request_type)
+            if preprocessor is not None:
+                preprocessed_data = getattr(self, preprocessor)(sanitized_data)
             else:
                 preprocessed_data = sanitized_data  # No special preprocessing
             
-            state['processed_data'] = preprocessed_data
-            state['stages_completed'].append('preprocessing')
+            state.processed_data = preprocessed_data
+            state.stages_completed.append('preprocessing')
             
         except Exception as e:
-            state['error'] = f"Preprocessing error: {str(e)}"
-            logger.error(f"Preprocessing failed for request {request.request_id}: {e}")
+            state.error = f"Preprocessing error: {str(e)}"
+            logger.error("Preprocessing failed for request %s: %s", request.request_id, e)
         
         return state
     
-    async def process_data(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_data(self, state: ProcessingState) -> ProcessingState:
         """Execute the main data processing logic."""
-        request = state['request']
-        state['current_stage'] = 'processing'
+        request = state.request
+        state.current_stage = 'processing'
         
-        logger.debug(f"Processing data for request {request.request_id}")
+        logger.debug("Processing data for request %s", request.request_id)
         
         try:
-            processed_data = state['processed_data']
+            processed_data = state.processed_data
             
             # Route to appropriate processing method
-            if request.request_type == 'data_analysis':
-                results = await self._perform_data_analysis(processed_data, request.metadata or {})
-            elif request.request_type == 'data_transformation':
-                results = await self._perform_data_transformation(processed_data, request.metadata or {})
-            elif request.request_type == 'computation':
-                results = await self._perform_computation(processed_data, request.metadata or {})
-            elif request.request_type == 'integration':
-                results = await self._perform_integration(processed_data, request.metadata or {})
+            processor = _PROCESSORS.get(request.request_type)
+            if processor is not None:
+                results = getattr(self, processor)(processed_data, request.metadata or {})
+                if inspect.isawaitable(results):
+                    results = await results
             else:
                 results = {'status': 'completed', 'data': processed_data}
             
-            state['processing_results'] = results
-            state['stages_completed'].append('processing')
+            state.processing_results = results
+            state.stages_completed.append('processing')
             
         except Exception as e:
-            state['error'] = f"Processing error: {str(e)}"
-            logger.error(f"Processing failed for request {request.request_id}: {e}")
+            state.error = f"Processing error: {str(e)}"
+            logger.error("Processing failed for request %s: %s", request.request_id, e)
         
         return state
     
-    async def postprocess_data(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def postprocess_data(self, state: ProcessingState) -> ProcessingState:
         """Postprocess results and prepare for delivery."""
-        request = state['request']
-        state['current_stage'] = 'postprocessing'
+        request = state.request
+        state.current_stage = 'postprocessing'
         
-        logger.debug(f"Postprocessing data for request {request.request_id}")
+        logger.debug("Postprocessing data for request %s", request.request_id)
         
         try:
-            processing_results = state['processing_results']
+            processing_results = state.processing_results
+            
+            # Completion time, stamped once and shared by storage and notification
+            state.completed_at = datetime.now().isoformat()
             
             # Apply postprocessing transformations
             postprocessed_results = {
@@ -330,66 +522,67 @@ class PeasantBackendAgent:
                 'request_type': request.request_type,
                 'results': processing_results,
                 'metadata': {
-                    'processed_at': datetime.now().isoformat(),
-                    'processing_stages': state['stages_completed'],
-                    'warnings': state.get('warnings', []),
-                    'data_quality_score': self._calculate_data_quality_score(processing_results)
+                    'processed_at': state.completed_at,
+                    'processing_stages': state.stages_completed,
+                    'warnings': state.warnings,
+                    'data_quality_score': self._calculate_data_quality_score(state)
                 }
             }
             
             # Format results based on requester preferences
             if request.metadata and request.metadata.get('format'):
-                postprocessed_results = await self._format_results(
+                postprocessed_results = self._format_results(
                     postprocessed_results, 
                     request.metadata['format']
                 )
             
-            state['processing_results'] = postprocessed_results
-            state['stages_completed'].append('postprocessing')
+            state.processing_results = postprocessed_results
+            state.serialized_results = orjson.dumps(postprocessed_results, option=orjson.OPT_NON_STR_KEYS)
+            state.stages_completed.append('postprocessing')
             
         except Exception as e:
-            state['error'] = f"Postprocessing error: {str(e)}"
-            logger.error(f"Postprocessing failed for request {request.request_id}: {e}")
+            state.error = f"Postprocessing error: {str(e)}"
+            logger.error("Postprocessing failed for request %s: %s", request.request_id, e)
         
         return state
     
-    async def store_results(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def store_results(self, state: ProcessingState) -> ProcessingState:
         """Store processing results for future reference."""
-        request = state['request']
-        state['current_stage'] = 'storage'
+        request = state.request
+        state.current_stage = 'storage'
         
-        logger.debug(f"Storing results for request {request.request_id}")
+        logger.debug("Storing results for request %s", request.request_id)
         
         try:
-            processing_results = state['processing_results']
-            
-            # Store results (in a real implementation, this would use a database)
+            # Store results (in a real implementation, this would use a database);
+            # the bytes written are the ones postprocessing serialized
+            serialized = state.serialized_results
             storage_key = f"results_{request.request_id}"
             storage_results = {
                 'storage_key': storage_key,
-                'stored_at': datetime.now().isoformat(),
-                'size_bytes': len(json.dumps(processing_results)),
+                'stored_at': state.completed_at,
+                'size_bytes': len(serialized),
                 'retention_period': '30_days'  # Example retention policy
             }
             
             # In a real implementation, you would store to database/file system here
-            logger.info(f"Results stored with key: {storage_key}")
+            logger.info("Results stored with key: %s", storage_key)
             
-            state['storage_results'] = storage_results
-            state['stages_completed'].append('storage')
+            state.storage_results = storage_results
+            state.stages_completed.append('storage')
             
         except Exception as e:
-            state['error'] = f"Storage error: {str(e)}"
-            logger.error(f"Storage failed for request {request.request_id}: {e}")
+            state.error = f"Storage error: {str(e)}"
+            logger.error("Storage failed for request %s: %s", request.request_id, e)
         
         return state
     
-    async def notify_completion(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def notify_completion(self, state: ProcessingState) -> ProcessingState:
         """Notify requesters about task completion."""
-        request = state['request']
-        state['current_stage'] = 'notification'
+        request = state.request
+        state.current_stage = 'notification'
         
-        logger.debug(f"Sending completion notification for request {request.request_id}")
+        logger.debug("Sending completion notification for request %s", request.request_id)
         
         try:
             # Prepare notification data
@@ -397,67 +590,62 @@ class PeasantBackendAgent:
                 'request_id': request.request_id,
                 'status': 'completed',
                 'requester': request.requester,
-                'completion_time': datetime.now().isoformat(),
+                'completion_time': state.completed_at,
                 'results_available': True,
-                'storage_key': state.get('storage_results', {}).get('storage_key')
+                'storage_key': state.storage_results.get('storage_key')
             }
             
             # In a real implementation, this would send to message queue or notification service
-            logger.info(f"Completion notification sent for request {request.request_id}")
+            logger.info("Completion notification sent for request %s", request.request_id)
             
-            state['notification_results'] = notification
-            state['stages_completed'].append('notification')
+            state.notification_results = notification
+            state.stages_completed.append('notification')
             
         except Exception as e:
-            state['warnings'].append(f"Notification error: {str(e)}")
-            logger.warning(f"Notification failed for request {request.request_id}: {e}")
+            state.warnings.append(f"Notification error: {str(e)}")
+            logger.warning("Notification failed for request %s: %s", request.request_id, e)
         
         return state
     
-    async def handle_error(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_error(self, state: ProcessingState) -> ProcessingState:
         """Handle errors that occur during processing."""
-        request = state['request']
-        error = state.get('error', 'Unknown error')
+        request = state.request
+        error = state.error or 'Unknown error'
         
-        logger.error(f"Handling error for request {request.request_id}: {error}")
+        logger.error("Handling error for request %s: %s", request.request_id, error)
         
         # Log error details
         error_details = {
             'request_id': request.request_id,
             'error_message': error,
-            'failed_stage': state.get('current_stage', 'unknown'),
-            'stages_completed': state.get('stages_completed', []),
+            'failed_stage': state.current_stage,
+            'stages_completed': state.stages_completed,
             'timestamp': datetime.now().isoformat()
         }
         
         # In a real implementation, this would be logged to an error tracking system
-        logger.error(f"Error details: {json.dumps(error_details, indent=2)}")
+        logger.error("Error details: %s", _LazyJson(error_details))
         
         # Attempt error recovery if possible
-        recovery_attempted = await self._attempt_error_recovery(state)
+        recovery_attempted = self._attempt_error_recovery(state)
         if recovery_attempted:
-            state['warnings'].append("Error recovery attempted")
+            state.warnings.append("Error recovery attempted")
         
         return state
     
-    def should_continue_processing(self, state: Dict[str, Any]) -> str:
+    @staticmethod
+    def should_continue_processing(state: ProcessingState) -> str:
         """Determine whether to continue processing or handle an error."""
-        if state.get('error'):
+        if state.error:
             return "error"
         return "continue"
     
     # Data Processing Methods
     
-    async def _perform_data_analysis(self, data: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _perform_data_analysis(self, data: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Perform data analysis operations."""
         analysis_type = metadata.get('analysis_type', 'basic')
-        
-        if analysis_type == 'statistical':
-            return await self._statistical_analysis(data)
-        elif analysis_type == 'trend':
-            return await self._trend_analysis(data)
-        else:
-            return await self._basic_analysis(data)
+        return getattr(self, _ANALYSES.get(analysis_type, '_basic_analysis'))(data)
     
     async def _perform_data_transformation(self, data: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Perform data transformation operations."""
@@ -492,7 +680,7 @@ class PeasantBackendAgent:
         else:
             return await self._basic_computation(data)
     
-    async def _perform_integration(self, data: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _perform_integration(self, data: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Perform integration with external systems."""
         integration_type = metadata.get('integration_type', 'api')
         
@@ -508,46 +696,49 @@ class PeasantBackendAgent:
     
     # Utility Methods
     
-    async def _sanitize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _sanitize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize input data to prevent security issues."""
-        # Basic sanitization - remove potentially harmful content
+        # Basic sanitization - remove potential script tags or SQL injection
+        # patterns; nested dicts are walked with a stack rather than recursion
         sanitized = {}
-        for key, value in data.items():
-            if isinstance(value, str):
-                # Remove potential script tags or SQL injection patterns
-                sanitized_value = value.replace('<script>', '').replace('</script>', '')
-                sanitized_value = sanitized_value.replace('DROP TABLE', '').replace('DELETE FROM', '')
-                sanitized[key] = sanitized_value
-            elif isinstance(value, dict):
-                sanitized[key] = await self._sanitize_data(value)
-            else:
-                sanitized[key] = value
+        pending = [(data, sanitized)]
+        while pending:
+            source, target = pending.pop()
+            for key, value in source.items():
+                if isinstance(value, str):
+                    target[key] = _SANITIZE_RE.sub('', value)
+                elif isinstance(value, dict):
+                    target[key] = {}
+                    pending.append((value, target[key]))
+                else:
+                    target[key] = value
         
         return sanitized
     
-    async def _preprocess_for_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _preprocess_for_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Preprocess data for analysis operations."""
         # Convert string numbers to actual numbers
         processed = {}
         for key, value in data.items():
-            if isinstance(value, str) and value.replace('.', '').replace('-', '').isdigit():
-                processed[key] = float(value) if '.' in value else int(value)
+            match = _NUM_RE.fullmatch(value) if isinstance(value, str) else None
+            if match:
+                processed[key] = float(value) if match.group(1) else int(value)
             else:
                 processed[key] = value
         
         return processed
     
-    async def _preprocess_for_transformation(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _preprocess_for_transformation(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Preprocess data for transformation operations."""
         # Ensure data structure is suitable for transformation
         return data
     
-    async def _preprocess_for_computation(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _preprocess_for_computation(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Preprocess data for computational operations."""
         # Validate numeric data
         return data
     
-    async def _basic_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _basic_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Perform basic data analysis."""
         analysis = {
             'total_fields': len(data),
@@ -556,41 +747,39 @@ class PeasantBackendAgent:
         }
         
         # Calculate basic statistics for numeric fields
-        numeric_fields = {k: v for k, v in data.items() if isinstance(v, (int, float))}
-        if numeric_fields:
+        numeric_data = _numeric_values(data)
+        if numeric_data.size:
+            total = float(numeric_data.sum())
             analysis['numeric_summary'] = {
-                'count': len(numeric_fields),
-                'sum': sum(numeric_fields.values()),
-                'average': sum(numeric_fields.values()) / len(numeric_fields)
+                'count': numeric_data.size,
+                'sum': total,
+                'average': total / numeric_data.size
             }
         
         return analysis
     
-    async def _statistical_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _statistical_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Perform statistical analysis."""
-        # Simplified statistical analysis
-        numeric_data = [v for v in data.values() if isinstance(v, (int, float))]
+        # Simplified statistical analysis, each statistic one pass over a float64 array
+        numeric_data = _numeric_values(data)
         
-        if not numeric_data:
+        if not numeric_data.size:
             return {'error': 'No numeric data found for statistical analysis'}
         
+        variance = float(numeric_data.var())
         stats = {
-            'count': len(numeric_data),
-            'sum': sum(numeric_data),
-            'mean': sum(numeric_data) / len(numeric_data),
-            'min': min(numeric_data),
-            'max': max(numeric_data)
+            'count': numeric_data.size,
+            'sum': float(numeric_data.sum()),
+            'mean': float(numeric_data.mean()),
+            'min': float(numeric_data.min()),
+            'max': float(numeric_data.max()),
+            'variance': variance,
+            'std_dev': variance ** 0.5
         }
         
-        # Calculate variance and standard deviation
-        mean = stats['mean']
-        variance = sum((x - mean) ** 2 for x in numeric_data) / len(numeric_data)
-        stats['variance'] = variance
-        stats['std_dev'] = variance ** 0.5
-        
         return {'statistical_analysis': stats}
     
-    async def _trend_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _trend_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Perform trend analysis."""
         # Simplified trend analysis
         return {
@@ -599,20 +788,16 @@ class PeasantBackendAgent:
             'trend_direction': 'stable'  # Simplified
         }
     
-    def _calculate_data_quality_score(self, results: Dict[str, Any]) -> float:
+    @staticmethod
+    def _calculate_data_quality_score(state: ProcessingState) -> float:
         """Calculate a data quality score based on processing results."""
-        # Simplified quality scoring
-        base_score = 0.8
-        
-        if 'error' in results:
+        # Simplified quality scoring: a failed analysis scores zero, and each
+        # warning raised on the request so far costs a tenth
+        if 'error' in state.processing_results:
             return 0.0
-        
-        if 'warnings' in results and results['warnings']:
-            base_score -= len(results['warnings']) * 0.1
-        
-        return max(0.0, min(1.0, base_score))
+        return max(0.0, min(1.0, 0.8 - 0.1 * len(state.warnings)))
     
-    async def _format_results(self, results: Dict[str, Any], format_type: str) -> Dict[str, Any]:
+    def _format_results(self, results: Dict[str, Any], format_type: str) -> Dict[str, Any]:
         """Format results according to specified format."""
         if format_type == 'json':
             return results  # Already in JSON format
@@ -625,10 +810,10 @@ class PeasantBackendAgent:
         else:
             return results
     
-    async def _attempt_error_recovery(self, state: Dict[str, Any]) -> bool:
+    def _attempt_error_recovery(self, state: ProcessingState) -> bool:
         """Attempt to recover from processing errors."""
         # Simple recovery strategies
-        error = state.get('error', '')
+        error = state.error or ''
         
         if 'validation' in error.lower():
             # Try with relaxed validation
@@ -639,21 +824,27 @@ class PeasantBackendAgent:
         
         return False
     
+    def _store_completed(self, request_id: str, result: ProcessingResult):
+        """Keep a finished result, dropping the oldest beyond COMPLETED_TASK_HISTORY."""
+        self.completed_tasks[request_id] = result
+        self.completed_tasks.move_to_end(request_id)
+        if len(self.completed_tasks) > COMPLETED_TASK_HISTORY:
+            self.completed_tasks.popitem(last=False)
+    
     def _update_performance_metrics(self, result: ProcessingResult):
         """Update performance metrics based on processing result."""
-        self.performance_metrics['total_processed'] += 1
+        metrics = self.performance_metrics
+        metrics.total_processed += 1
         
         if result.status == TaskStatus.FAILED:
-            self.performance_metrics['total_failed'] += 1
-        
-        # Update average processing time
-        current_avg = self.performance_metrics['average_processing_time']
-        total_processed = self.performance_metrics['total_processed']
+            metrics.total_failed += 1
         
-        new_avg = ((current_avg * (total_processed - 1)) + result.processing_time) / total_processed
-        self.performance_metrics['average_processing_time'] = new_avg
+        # Update average processing time incrementally (Welford's mean update)
+        metrics.average_processing_time += (
+            (result.processing_time - metrics.average_processing_time) / metrics.total_processed
+        )
         
-        self.performance_metrics['queue_length'] = len(self.active_tasks)
+        metrics.queue_length = len(self.active_tasks)
     
     # Public Interface Methods
     
@@ -664,9 +855,9 @@ class PeasantBackendAgent:
             return {
                 'request_id': request_id,
                 'status': 'processing',
-                'current_stage': task_state.get('current_stage'),
-                'stages_completed': task_state.get('stages_completed', []),
-                'warnings': task_state.get('warnings', [])
+                'current_stage': task_state.current_stage,
+                'stages_completed': task_state.stages_completed,
+                'warnings': task_state.warnings
             }
         elif request_id in self.completed_tasks:
             result = self.completed_tasks[request_id]
@@ -682,21 +873,22 @@ class PeasantBackendAgent:
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get current performance metrics."""
-        return self.performance_metrics.copy()
+        return asdict(self.performance_metrics)
     
     def get_queue_status(self) -> Dict[str, Any]:
         """Get current queue status."""
         return {
             'active_tasks': len(self.active_tasks),
-            'queue_length': self.performance_metrics['queue_length'],
-            'total_processed': self.performance_metrics['total_processed'],
+            'queued_requests': self.processing_queue.qsize(),
+            'queue_length': self.performance_metrics.queue_length,
+            'total_processed': self.performance_metrics.total_processed,
             'success_rate': self._calculate_success_rate()
         }
     
     def _calculate_success_rate(self) -> float:
         """Calculate the current success rate."""
-        total = self.performance_metrics['total_processed']
-        failed = self.performance_metrics['total_failed']
+        total = self.performance_metrics.total_processed
+        failed = self.performance_metrics.total_failed
         
         if total == 0:
             return 1.0
@@ -0,0 +1,331 @@
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+import asyncio
+import functools
+import hashlib
+import heapq
+import importlib.util
+import itertools
+import json
+import logging
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[str], np.ndarray]
+
+@functools.lru_cache(maxsize=None)
+def sentence_transformer_embedder(model_name: str = "all-MiniLM-L6-v2") -> Optional[Embedder]:
+    """
+    Embedder backed by a local sentence-transformers model, loaded on first
+    use and shared by every cache asking for the same model. Returns None
+    when sentence-transformers is not installed, which leaves the cache
+    matching exact requests only
+    """
+    if importlib.util.find_spec("sentence_transformers") is None:
+        logger.info("sentence-transformers not installed; kickoff cache will match exact requests only")
+        return None
+
+    model = None
+
+    def embed(text: str) -> np.ndarray:
+        nonlocal model
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(model_name)
+        return model.encode(text)
+
+    return embed
+
+class LRUEmbeddingCache:
+    """
+    LRU of results with a per-entry TTL. Besides exact key lookups, entries
+    stored with an embedding can be found by cosine similarity among the
+    entries of the same scope. With lsh_bits set, similarity lookups only
+    score the entries an LSH index puts in the query's buckets instead of
+    every slot. With pca_components set and scikit-learn installed,
+    embeddings are projected onto that many principal components, fitted
+    incrementally every pca_refit_every insertions. With ltm_capacity set,
+    that many of the capacity's slots form a long-term tier: every
+    consolidate_every insertions, recent entries hit at least promote_after
+    times move there, out of reach of LRU eviction, and the long-term tier
+    makes room by evicting its least frequently hit entry
+    """
+
+    def __init__(self, capacity: int = 1000, ttl: float = 3600, threshold: float = 0.95,
+                 lsh_bits: int = 0, lsh_tables: int = 8,
+                 pca_components: int = 0, pca_refit_every: int = 1000,
+                 ltm_capacity: int = 0, promote_after: int = 3, consolidate_every: int = 50):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.threshold = threshold
+        self.lsh_bits = lsh_bits
+        self.lsh_tables = lsh_tables
+        self.pca_refit_every = max(pca_refit_every, pca_components)
+        self.ltm_capacity = ltm_capacity
+        self.promote_after = promote_after
+        self.consolidate_every = consolidate_every
+        # Recent entries in LRU order, and the long-term tier with its hit
+        # counts in a lazily pruned min-heap; entries are (expiry, value, slot)
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._ltm: Dict[str, Tuple[float, Any, int]] = {}
+        self._hits: Dict[str, int] = {}
+        self._ltm_heap: List[Tuple[int, int, str]] = []
+        self._heap_seq = itertools.count()
+        self._insertions = 0
+        self._free_slots = list(range(capacity - 1, -1, -1))
+        self._slot_keys: List[Optional[str]] = [None] * capacity
+        # Unit embeddings by slot, quantized to int8 with a per-slot scale and
+        # allocated once the first one arrives; a scope id of -1 marks a slot
+        # that takes no part in similarity lookups
+        self._vecs: Optional[np.ndarray] = None
+        self._scales = np.zeros(capacity, dtype=np.float32)
+        self._slot_scopes = np.full(capacity, -1, dtype=np.int32)
+        self._scope_ids: Dict[Hashable, int] = {}
+        self._lsh: Optional[_LSHIndex] = None
+        # Principal axes the stored vectors are expressed in, None until the
+        # first fit, and the raw unit embeddings waiting for the next one
+        self._pca = None
+        self._components: Optional[np.ndarray] = None
+        self._fit_buffer: List[np.ndarray] = []
+        if pca_components:
+            if importlib.util.find_spec("sklearn") is None:
+                logger.info("scikit-learn not installed; cached embeddings will not be compressed")
+            else:
+                from sklearn.decomposition import IncrementalPCA
+                self._pca = IncrementalPCA(n_components=pca_components)
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._ltm)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key) or self._ltm.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._evict(key)
+            return None
+        if self.ltm_capacity:
+            hits = self._hits[key] = self._hits.get(key, 0) + 1
+            if key in self._ltm:
+                heapq.heappush(self._ltm_heap, (hits, next(self._heap_seq), key))
+                return entry[1]
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def nearest(self, scope: Hashable, vector: np.ndarray) -> Optional[Any]:
+        """Value of the most similar live entry in scope, if it clears the threshold"""
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None or self._vecs is None:
+            return None
+
+        unit = self._project(_normalize(vector))
+        query, query_scale = _quantize(unit)
+        if self._lsh is not None:
+            slots = self._lsh.candidates(scope_id, unit)
+            if not len(slots):
+                return None
+            scores = np.matmul(self._vecs[slots], query, dtype=np.int32) * (self._scales[slots] * query_scale)
+            best = int(np.argmax(scores))
+            slot = int(slots[best])
+            score = scores[best]
+        else:
+            scores = np.matmul(self._vecs, query, dtype=np.int32) * (self._scales * query_scale)
+            scores[self._slot_scopes != scope_id] = -np.inf
+            slot = int(np.argmax(scores))
+            score = scores[slot]
+        if score < self.threshold:
+            return None
+        return self.get(self._slot_keys[slot])
+
+    def set(self, key: str, value: Any, scope: Hashable = None, vector: Optional[np.ndarray] = None):
+        if key in self._entries or key in self._ltm:
+            self._evict(key)
+        while len(self._entries) >= self.capacity - self.ltm_capacity:
+            self._evict(next(iter(self._entries)))
+
+        slot = self._free_slots.pop()
+        self._slot_keys[slot] = key
+        if vector is not None:
+            unit = _normalize(vector)
+            if self._vecs is None:
+                self._allocate(np.size(unit))
+            self._slot_scopes[slot] = self._scope_ids.setdefault(scope, len(self._scope_ids))
+            self._store_vector(slot, self._project(unit))
+            if self._pca is not None:
+                self._fit_buffer.append(unit)
+                if len(self._fit_buffer) >= self.pca_refit_every:
+                    self._refit()
+        self._entries[key] = (time.monotonic() + self.ttl, value, slot)
+        if self.ltm_capacity:
+            self._insertions += 1
+            if self._insertions % self.consolidate_every == 0:
+                self._consolidate()
+
+    def _evict(self, key: str):
+        _, _, slot = self._entries.pop(key, None) or self._ltm.pop(key)
+        self._hits.pop(key, None)
+        self._slot_keys[slot] = None
+        self._slot_scopes[slot] = -1
+        self._free_slots.append(slot)
+        if self._lsh is not None:
+            self._lsh.remove(slot)
+
+    def _consolidate(self):
+        """Move the recent entries hit often enough into the long-term tier, most hit first"""
+        promoted = [key for key in self._entries if self._hits.get(key, 0) >= self.promote_after]
+        promoted.sort(key=self._hits.__getitem__, reverse=True)
+        for key in promoted:
+            hits = self._hits[key]
+            if len(self._ltm) >= self.ltm_capacity:
+                victim = self._least_frequent()
+                if self._hits[victim] >= hits:
+                    break
+                self._evict(victim)
+            self._ltm[key] = self._entries.pop(key)
+            heapq.heappush(self._ltm_heap, (hits, next(self._heap_seq), key))
+
+        # Every hit pushes a fresh heap item; drop the stale ones once they dominate
+        if len(self._ltm_heap) > 4 * len(self._ltm):
+            self._ltm_heap = [(self._hits[key], next(self._heap_seq), key) for key in self._ltm]
+            heapq.heapify(self._ltm_heap)
+
+    def _least_frequent(self) -> str:
+        heap = self._ltm_heap
+        while True:
+            hits, _, key = heap[0]
+            if key in self._ltm and self._hits.get(key) == hits:
+                return key
+            heapq.heappop(heap)
+
+    def _allocate(self, dim: int):
+        self._vecs = np.zeros((self.capacity, dim), dtype=np.int8)
+        if self.lsh_bits:
+            self._lsh = _LSHIndex(dim, self.lsh_bits, self.lsh_tables)
+
+    def _store_vector(self, slot: int, unit: np.ndarray):
+        self._vecs[slot], self._scales[slot] = _quantize(unit)
+        if self._lsh is not None:
+            self._lsh.add(slot, int(self._slot_scopes[slot]), unit)
+
+    def _project(self, unit: np.ndarray) -> np.ndarray:
+        if self._components is None:
+            return unit
+        return _normalize(self._components @ unit)
+
+    def _refit(self):
+        """Fold the buffered embeddings into the PCA and re-express every stored vector on the new axes"""
+        live = np.flatnonzero(self._slot_scopes >= 0)
+        raw = self._vecs[live].astype(np.float32) * self._scales[live, None]
+        if self._components is not None:
+            raw = raw @ self._components
+
+        self._pca.partial_fit(np.stack(self._fit_buffer))
+        self._fit_buffer.clear()
+        # Projected without centering so cosine similarity keeps its meaning
+        self._components = self._pca.components_.astype(np.float32)
+
+        self._allocate(self._components.shape[0])
+        for slot, vector in zip(live, raw):
+            self._store_vector(int(slot), self._project(_normalize(vector)))
+
+class _LSHIndex:
+    """
+    Random-hyperplane LSH over cache slots. Each table hashes a unit vector to
+    the signs of a few random projections; the slots sharing a bucket with the
+    query, in the query's scope, in any table are the lookup candidates
+    """
+
+    def __init__(self, dim: int, bits: int, tables: int, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((dim, tables * bits)).astype(np.float32)
+        self._tables = tables
+        self._bits = bits
+        self._weights = np.left_shift(1, np.arange(bits, dtype=np.uint32))
+        self._buckets: Dict[Tuple[int, int, int], set] = {}
+        self._slot_buckets: Dict[int, List[Tuple[int, int, int]]] = {}
+
+    def _codes(self, vector: np.ndarray) -> np.ndarray:
+        signs = (vector @ self._planes > 0).reshape(self._tables, self._bits)
+        return signs.astype(np.uint32) @ self._weights
+
+    def add(self, slot: int, scope_id: int, vector: np.ndarray):
+        buckets = [(table, scope_id, int(code)) for table, code in enumerate(self._codes(vector))]
+        for bucket in buckets:
+            self._buckets.setdefault(bucket, set()).add(slot)
+        self._slot_buckets[slot] = buckets
+
+    def remove(self, slot: int):
+        for bucket in self._slot_buckets.pop(slot, ()):
+            members = self._buckets[bucket]
+            members.discard(slot)
+            if not members:
+                del self._buckets[bucket]
+
+    def candidates(self, scope_id: int, vector: np.ndarray) -> np.ndarray:
+        found = set()
+        for table, code in enumerate(self._codes(vector)):
+            found.update(self._buckets.get((table, scope_id, int(code)), ()))
+        return np.fromiter(found, dtype=np.intp, count=len(found))
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+def _quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Symmetric int8 quantization; vector ~= quantized * scale"""
+    scale = float(np.max(np.abs(vector))) / 127 or 1.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+class CachedKickoff:
+    """
+    Runs crew kickoffs through an LRUEmbeddingCache so a request already
+    answered skips the LLM. Every payload matches exactly; free-text (str)
+    payloads also match a near enough earlier one by embedding, while
+    structured payloads never do, since values that differ only in a field
+    or a number embed almost identically
+    """
+
+    def __init__(self, cache: LRUEmbeddingCache, embedder: Optional[Embedder] = None):
+        self.cache = cache
+        self.embedder = embedder
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+
+    async def __call__(self, run: Callable[[], Awaitable[Any]], scope: Tuple, payload: Any) -> Any:
+        text = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        key = hashlib.sha256(json.dumps([scope, text], default=str).encode()).hexdigest()
+
+        result = self.cache.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        vector = None
+        if self.embedder is not None and isinstance(payload, str):
+            vector = await asyncio.to_thread(self.embedder, payload)
+            result = self.cache.nearest(scope, vector)
+            if result is not None:
+                self.hits += 1
+                self.fuzzy_hits += 1
+                return result
+
+        self.misses += 1
+        result = await run()
+        self.cache.set(key, result, scope, vector)
+        logger.debug("Kickoff cache miss for %s (hit rate %.2f)", scope, self.stats()['hit_rate'])
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'fuzzy_hits': self.fuzzy_hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.cache)
+        }
@@ -1,15 +1,47 @@
 from crewai import Agent, Task, Crew
 from langchain_openai import ChatOpenAI
-from typing import Dict, Any, Optional, List
+from langchain_core.messages import HumanMessage, SystemMessage
+import httpx
+from typing import Dict, Any, Optional, List, Awaitable, Callable
 import json
 import logging
 import asyncio
+import hashlib
+import re
+import string
+from collections import defaultdict, deque
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+import numpy as np
+import orjson
+from cachetools import TTLCache
+
+from serf_cache import CachedKickoff, LRUEmbeddingCache, sentence_transformer_embedder
 
 logger = logging.getLogger(__name__)
 
+# Number of recent history entries a cached response is tied to, so the same
+# words later in a different conversation still reach the LLM
+CONTEXT_CHAIN_LENGTH = 3
+
+# Exchanges kept on a UserContext for prompts and cache scoping; older ones
+# remain in the agent's interaction history
+USER_CONTEXT_HISTORY_LIMIT = 20
+
+# Responses already given, shared by every frontend agent and scoped per user,
+# interaction type and recent context; paraphrased inputs match by embedding
+# when sentence-transformers is installed, looked up through an LSH index so
+# only the entries near the input are scored and compressed to 96 principal
+# components once enough inputs have been seen. 256 slots hold recent
+# responses; the rest keep the most frequently reused ones
+_RESPONSE_CACHE = CachedKickoff(
+    LRUEmbeddingCache(capacity=1024, ttl=3600, threshold=0.87,
+                      lsh_bits=8, lsh_tables=8, pca_components=96,
+                      ltm_capacity=768, promote_after=3, consolidate_every=50),
+    embedder=sentence_transformer_embedder()
+)
+
 class InteractionType(Enum):
     GREETING = "greeting"
     QUESTION = "question"
@@ -18,7 +50,38 @@ class InteractionType(Enum):
     FEEDBACK = "feedback"
     HELP_REQUEST = "help_request"
 
-@dataclass
+def _keyword_pattern(*words: str) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, words)))
+
+# Keyword patterns checked in priority order against the lowercased input;
+# a keyword anywhere in the input selects its interaction type
+_KEYWORD_TYPES = (
+    (_keyword_pattern('hello', 'hi', 'hey', 'good morning', 'good afternoon'), InteractionType.GREETING),
+    (_keyword_pattern('problem', 'issue', 'wrong', 'error', 'broken', 'not working'), InteractionType.COMPLAINT),
+    (_keyword_pattern('help', 'support', 'assistance', 'guide', 'tutorial'), InteractionType.HELP_REQUEST),
+)
+_QUESTION_WORDS = ('what', 'how', 'why', 'when', 'where', 'which', 'who')
+_FEEDBACK_PATTERN = _keyword_pattern('feedback', 'suggestion')
+
+# Interaction types whose backend data is fetched while the LLM is still
+# answering, and how long an unclaimed prefetch is kept per session
+_PREFETCH_TYPES = frozenset({InteractionType.TASK_REQUEST, InteractionType.QUESTION})
+PREFETCH_LIMIT = 1024
+PREFETCH_TTL = 300
+
+# Number of most recent interactions kept in memory and covered by the
+# performance metrics
+INTERACTION_HISTORY_LIMIT = 1000
+METRICS_WINDOW = INTERACTION_HISTORY_LIMIT
+
+# Lenient about raw newlines and tabs inside strings, which models emit
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+def _to_json(obj: Any) -> str:
+    """Pretty-print a prompt payload."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+@dataclass(slots=True)
 class UserContext:
     user_id: str
     session_id: str
@@ -27,8 +90,27 @@ class UserContext:
     current_mood: str
     interaction_count: int
     last_interaction: str
+    # Serialized preferences and the dict they were serialized from; replace
+    # preferences rather than mutating them in place to refresh the cache
+    _prefs_source: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _prefs_json: str = field(default='', init=False, repr=False, compare=False)
+
+    def preferences_json(self) -> str:
+        """Preferences rendered for prompts, serialized again only once replaced."""
+        if self._prefs_source is not self.preferences:
+            self._prefs_json = _to_json(self.preferences)
+            self._prefs_source = self.preferences
+        return self._prefs_json
+
+    def public_view(self) -> Dict[str, Any]:
+        """Fields of the context that are safe to hand to other agents."""
+        return {
+            'user_id': self.user_id,
+            'current_mood': self.current_mood,
+            'interaction_count': self.interaction_count
+        }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InteractionResponse:
     message: str
     actions: List[Dict[str, Any]]
@@ -39,6 +121,148 @@ class InteractionResponse:
     user_satisfaction_prediction: float
     follow_up_needed: bool
 
+# Prompt skeletons, built once; only the variable parts are spliced in per call
+_USER_CONTEXT_TMPL = string.Template("""
+        User ID: $user_id
+        Session ID: $session_id
+        Current Mood: $current_mood
+        Total Interactions: $interaction_count
+        Last Interaction: $last_interaction
+        
+        Preferences: $preferences
+        
+        Recent Interaction History:
+        $recent_interactions
+        """)
+
+_INTERACTION_TMPL = string.Template("""
+            You are interacting with a user who has provided the following input:
+            
+            USER INPUT: "$user_input"
+            
+            INTERACTION TYPE: $interaction_type
+            
+            USER CONTEXT:
+            $context_str
+            
+            Your task is to:
+            
+            1. UNDERSTAND THE USER:
+               - Analyze the user's intent and emotional state
+               - Consider their history and preferences
+               - Identify what they really need
+            
+            2. PROVIDE AN EXCELLENT RESPONSE:
+               - Be empathetic, helpful, and engaging
+               - Use a tone appropriate to the user's mood and the situation
+               - Provide accurate and useful information
+               - Offer additional assistance where appropriate
+            
+            3. DETERMINE NEXT STEPS:
+               - Can you handle this completely on your own?
+               - Do you need data or processing from Peasant Backend Agents?
+               - Is this complex enough to require King AI Overseer involvement?
+               - What follow-up actions would benefit the user?
+            
+            4. PERSONALIZE THE EXPERIENCE:
+               - Reference relevant past interactions if appropriate
+               - Adapt your communication style to user preferences
+               - Suggest personalized recommendations
+            
+            Respond in JSON format with the following structure:
+            {
+                "user_message": "Your response to the user",
+                "emotional_tone": "detected user emotion",
+                "response_tone": "your response tone",
+                "requires_backend_data": true/false,
+                "backend_request": {
+                    "type": "data_type_needed",
+                    "description": "what you need from backend",
+                    "priority": 1-5
+                },
+                "requires_escalation": true/false,
+                "escalation_reason": "why escalation is needed",
+                "suggested_actions": ["action1", "action2"],
+                "satisfaction_prediction": 0.0-1.0,
+                "follow_up_needed": true/false,
+                "personalization_notes": "observations about user preferences"
+            }
+            """)
+
+_PERSONALIZATION_TMPL = string.Template("""
+            Based on the following user context, generate personalized interface
+            recommendations to enhance their experience:
+            
+            USER CONTEXT:
+            $context_str
+            
+            Analyze:
+            1. User behavior patterns and preferences
+            2. Frequently used features and workflows
+            3. Areas where the user might need more support
+            4. Opportunities to streamline their experience
+            
+            Generate recommendations for:
+            1. Dashboard layout and widget priorities
+            2. Navigation preferences and shortcuts
+            3. Notification settings and timing
+            4. Color scheme and visual preferences
+            5. Feature recommendations based on usage patterns
+            6. Proactive assistance opportunities
+            
+            Format your response as actionable recommendations.
+            """)
+
+_FEEDBACK_TMPL = string.Template("""
+            A user has provided feedback about their interaction with the system:
+            
+            FEEDBACK: "$feedback"
+            RATING: $rating/5
+            INTERACTION_ID: $interaction_id
+            
+            USER CONTEXT:
+            $context_str
+            
+            Analyze this feedback to:
+            1. Understand what went well and what didn't
+            2. Identify specific areas for improvement
+            3. Determine if this indicates broader system issues
+            4. Generate actionable insights for better future interactions
+            5. Assess if any immediate follow-up is needed with this user
+            
+            Consider:
+            - Was the issue with response quality, timing, accuracy, or tone?
+            - Does this feedback suggest gaps in our knowledge or capabilities?
+            - Are there patterns emerging from this user's feedback history?
+            - What specific changes would likely improve this user's experience?
+            """)
+
+_PROACTIVE_TMPL = string.Template("""
+            Based on this user's context and behavior patterns, identify opportunities
+            for proactive assistance:
+            
+            USER CONTEXT:
+            $context_str
+            
+            Look for:
+            1. Repeated patterns that could be automated
+            2. Features the user might not know about that would help them
+            3. Potential frustrations or inefficiencies in their workflow
+            4. Opportunities to save them time or effort
+            5. Educational content that might be valuable
+            
+            Only suggest proactive assistance if:
+            - It would genuinely benefit the user
+            - It's not intrusive or annoying
+            - The timing feels natural and helpful
+            - There's a clear value proposition
+            
+            If no good opportunities exist, respond with "NO_ASSISTANCE_NEEDED".
+            Otherwise, provide specific, actionable assistance offers.
+            """)
+
+BackendFetch = Callable[[InteractionType, str, UserContext], Awaitable[Any]]
+
 class SerfFrontendAgent:
     """
     The Serf Servant Frontend Agent serves as the primary interface between
@@ -46,8 +270,10 @@ class SerfFrontendAgent:
     user experience and managing all user-facing interactions.
     """
     
-    def __init__(self, model_name: str = "gpt-3.5-turbo", temperature: float = 0.7):
-        self.llm = ChatOpenAI(model=model_name, temperature=temperature)
+    def __init__(self, model_name: str = "gpt-3.5-turbo", temperature: float = 0.7,
+                 http_async_client: Optional[httpx.AsyncClient] = None,
+                 backend_fetch: Optional[BackendFetch] = None):
+        self.llm = ChatOpenAI(model=model_name, temperature=temperature, http_async_client=http_async_client)
         self.agent = Agent(
             role="User Experience Specialist and Interface Manager",
             goal="""Provide exceptional, personalized user experiences while serving
@@ -76,10 +302,34 @@ class SerfFrontendAgent:
             memory=True
         )
         
-        self.interaction_history = []
+        self.interaction_history = deque(maxlen=INTERACTION_HISTORY_LIMIT)
+        # The same records split by user, trimmed along with the full history
+        self._history_by_user: Dict[str, deque] = defaultdict(deque)
         self.user_contexts = {}
         self.personalization_data = {}
         
+        # Ring buffers of the figures the performance metrics aggregate, one
+        # slot per interaction, so metrics are reductions over flat arrays
+        self._recorded = 0
+        # Satisfaction predictions are kept as whole percentages
+        self._sat = np.zeros(METRICS_WINDOW, dtype=np.uint8)
+        self._delegated = np.zeros(METRICS_WINDOW, dtype=bool)
+        self._escalated = np.zeros(METRICS_WINDOW, dtype=bool)
+        self._metric_users: List[Optional[str]] = [None] * METRICS_WINDOW
+        
+        # Backend data requested speculatively for an interaction, kept by
+        # session when the response turns out to need it
+        self.backend_fetch = backend_fetch
+        self._prefetched: TTLCache = TTLCache(maxsize=PREFETCH_LIMIT, ttl=PREFETCH_TTL)
+        
+        # Built once; each kickoff runs on a deep copy (agent included) holding just its task
+        self._crew = Crew(agents=[self.agent], tasks=[])
+        
+        # Interaction prompts skip the crew and go straight to the LLM with the
+        # agent's persona as system message
+        self._persona = SystemMessage(content=f"You are a {self.agent.role}.\n\n"
+                                              f"Your goal: {self.agent.goal}\n\n{self.agent.backstory}")
+        
     async def handle_user_interaction(self, user_input: str, user_context: UserContext) -> InteractionResponse:
         """
         Handle a user interaction with empathy and intelligence.
@@ -94,88 +344,78 @@ class SerfFrontendAgent:
         logger.info(f"Serf Frontend Agent handling interaction from user {user_context.user_id}")
         
         # Analyze interaction type
-        interaction_type = await self._classify_interaction(user_input, user_context)
+        interaction_type = self._classify_interaction(user_input, user_context)
         
-        # Prepare context for the agent
-        context_str = self._format_user_context(user_context)
+        # On a cache miss, fetch the backend data this kind of request usually
+        # needs while the LLM answers
+        prefetch = None
         
-        task = Task(
-            description=f"""
-            You are interacting with a user who has provided the following input:
-            
-            USER INPUT: "{user_input}"
-            
-            INTERACTION TYPE: {interaction_type.value}
-            
-            USER CONTEXT:
-            {context_str}
-            
-            Your task is to:
-            
-            1. UNDERSTAND THE USER:
-               - Analyze the user's intent and emotional state
-               - Consider their history and preferences
-               - Identify what they really need
-            
-            2. PROVIDE AN EXCELLENT RESPONSE:
-               - Be empathetic, helpful, and engaging
-               - Use a tone appropriate to the user's mood and the situation
-               - Provide accurate and useful information
-               - Offer additional assistance where appropriate
-            
-            3. DETERMINE NEXT STEPS:
-               - Can you handle this completely on your own?
-               - Do you need data or processing from Peasant Backend Agents?
-               - Is this complex enough to require King AI Overseer involvement?
-               - What follow-up actions would benefit the user?
-            
-            4. PERSONALIZE THE EXPERIENCE:
-               - Reference relevant past interactions if appropriate
-               - Adapt your communication style to user preferences
-               - Suggest personalized recommendations
-            
-            Respond in JSON format with the following structure:
-            {{
-                "user_message": "Your response to the user",
-                "emotional_tone": "detected user emotion",
-                "response_tone": "your response tone",
-                "requires_backend_data": true/false,
-                "backend_request": {{
-                    "type": "data_type_needed",
-                    "description": "what you need from backend",
-                    "priority": 1-5
-                }},
-                "requires_escalation": true/false,
-                "escalation_reason": "why escalation is needed",
-                "suggested_actions": ["action1", "action2"],
-                "satisfaction_prediction": 0.0-1.0,
-                "follow_up_needed": true/false,
-                "personalization_notes": "observations about user preferences"
-            }}
-            """,
-            agent=self.agent,
-            expected_output="JSON response with user message and metadata"
-        )
-        
-        crew = Crew(
-            agents=[self.agent],
-            tasks=[task],
-            verbose=True
-        )
+        async def answer() -> InteractionResponse:
+            nonlocal prefetch
+            if self.backend_fetch is not None and interaction_type in _PREFETCH_TYPES:
+                prefetch = asyncio.create_task(self.backend_fetch(interaction_type, user_input, user_context))
+            return await self._run_interaction(user_input, interaction_type, user_context)
         
-        result = crew.kickoff()
-        response = self._parse_interaction_result(result, user_input, user_context)
+        try:
+            response = await _RESPONSE_CACHE(
+                answer,
+                ('interaction', self.llm.model_name, user_context.user_id,
+                 interaction_type.value, self._context_fingerprint(user_context)),
+                user_input
+            )
+        except BaseException:
+            if prefetch is not None:
+                prefetch.cancel()
+            raise
+        
+        if prefetch is not None:
+            if response.requires_delegation:
+                self.discard_prefetched(user_context.session_id)
+                self._prefetched[user_context.session_id] = prefetch
+            else:
+                prefetch.cancel()
         
         # Store interaction in history
-        self._record_interaction(user_input, response, user_context)
+        now_iso = datetime.now().isoformat()
+        self._record_interaction(user_input, response, user_context, now_iso)
         
         # Update user context with new insights
-        self._update_user_context(user_context, response)
+        self._update_user_context(user_context, user_input, response, now_iso)
         
         logger.info(f"Interaction completed. Satisfaction prediction: {response.user_satisfaction_prediction}")
         
         return response
     
+    async def prefetched_backend_data(self, session_id: str) -> Optional[Any]:
+        """
+        Claim the backend data prefetched for a session's last delegating interaction.
+        
+        The fetch is speculative: it starts before the model has answered, so
+        it covers the user's input and interaction type rather than the
+        response's delegation_request. Callers that get a delegating response
+        should claim it here or drop it with discard_prefetched.
+        
+        Args:
+            session_id: Session the interaction belonged to
+            
+        Returns:
+            The fetch result, or None if nothing was prefetched or the fetch failed
+        """
+        prefetch = self._prefetched.pop(session_id, None)
+        if prefetch is None:
+            return None
+        try:
+            return await prefetch
+        except Exception as e:
+            logger.warning(f"Backend prefetch for session {session_id} failed: {e}")
+            return None
+    
+    def discard_prefetched(self, session_id: str):
+        """Cancel any unclaimed backend prefetch for a session."""
+        prefetch = self._prefetched.pop(session_id, None)
+        if prefetch is not None:
+            prefetch.cancel()
+    
     async def personalize_interface(self, user_context: UserContext) -> Dict[str, Any]:
         """
         Generate personalized interface recommendations for a user.
@@ -189,35 +429,12 @@ class SerfFrontendAgent:
         context_str = self._format_user_context(user_context)
         
         task = Task(
-            description=f"""
-            Based on the following user context, generate personalized interface
-            recommendations to enhance their experience:
-            
-            USER CONTEXT:
-            {context_str}
-            
-            Analyze:
-            1. User behavior patterns and preferences
-            2. Frequently used features and workflows
-            3. Areas where the user might need more support
-            4. Opportunities to streamline their experience
-            
-            Generate recommendations for:
-            1. Dashboard layout and widget priorities
-            2. Navigation preferences and shortcuts
-            3. Notification settings and timing
-            4. Color scheme and visual preferences
-            5. Feature recommendations based on usage patterns
-            6. Proactive assistance opportunities
-            
-            Format your response as actionable recommendations.
-            """,
+            description=_PERSONALIZATION_TMPL.substitute(context_str=context_str),
             agent=self.agent,
             expected_output="Personalized interface recommendations"
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        recommendations = crew.kickoff()
+        recommendations = await self._kickoff(task)
         
         return {
             'user_id': user_context.user_id,
@@ -241,35 +458,17 @@ class SerfFrontendAgent:
             Analysis of feedback and improvement recommendations
         """
         task = Task(
-            description=f"""
-            A user has provided feedback about their interaction with the system:
-            
-            FEEDBACK: "{feedback}"
-            RATING: {rating}/5
-            INTERACTION_ID: {interaction_id}
-            
-            USER CONTEXT:
-            {self._format_user_context(user_context)}
-            
-            Analyze this feedback to:
-            1. Understand what went well and what didn't
-            2. Identify specific areas for improvement
-            3. Determine if this indicates broader system issues
-            4. Generate actionable insights for better future interactions
-            5. Assess if any immediate follow-up is needed with this user
-            
-            Consider:
-            - Was the issue with response quality, timing, accuracy, or tone?
-            - Does this feedback suggest gaps in our knowledge or capabilities?
-            - Are there patterns emerging from this user's feedback history?
-            - What specific changes would likely improve this user's experience?
-            """,
+            description=_FEEDBACK_TMPL.substitute(
+                feedback=feedback,
+                rating=rating,
+                interaction_id=interaction_id,
+                context_str=self._format_user_context(user_context)
+            ),
             agent=self.agent,
             expected_output="Detailed feedback analysis with improvement recommendations"
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        analysis = crew.kickoff()
+        analysis = await self._kickoff(task)
         
         feedback_record = {
             'feedback': feedback,
@@ -304,35 +503,12 @@ class SerfFrontendAgent:
         context_str = self._format_user_context(user_context)
         
         task = Task(
-            description=f"""
-            Based on this user's context and behavior patterns, identify opportunities
-            for proactive assistance:
-            
-            USER CONTEXT:
-            {context_str}
-            
-            Look for:
-            1. Repeated patterns that could be automated
-            2. Features the user might not know about that would help them
-            3. Potential frustrations or inefficiencies in their workflow
-            4. Opportunities to save them time or effort
-            5. Educational content that might be valuable
-            
-            Only suggest proactive assistance if:
-            - It would genuinely benefit the user
-            - It's not intrusive or annoying
-            - The timing feels natural and helpful
-            - There's a clear value proposition
-            
-            If no good opportunities exist, respond with "NO_ASSISTANCE_NEEDED".
-            Otherwise, provide specific, actionable assistance offers.
-            """,
+            description=_PROACTIVE_TMPL.substitute(context_str=context_str),
             agent=self.agent,
             expected_output="Proactive assistance recommendations or NO_ASSISTANCE_NEEDED"
         )
         
-        crew = Crew(agents=[self.agent], tasks=[task])
-        result = crew.kickoff()
+        result = await self._kickoff(task)
         
         if "NO_ASSISTANCE_NEEDED" in result:
             return None
@@ -345,55 +521,78 @@ class SerfFrontendAgent:
             'confidence_score': 0.8  # Moderate confidence for proactive suggestions
         }
     
-    async def _classify_interaction(self, user_input: str, user_context: UserContext) -> InteractionType:
+    async def _run_interaction(self, user_input: str, interaction_type: InteractionType,
+                               user_context: UserContext) -> InteractionResponse:
+        """Ask the agent to respond to a user input the response cache could not answer."""
+        # Prepare context for the agent
+        context_str = self._format_user_context(user_context)
+        
+        prompt = _INTERACTION_TMPL.substitute(
+            user_input=user_input,
+            interaction_type=interaction_type.value,
+            context_str=context_str
+        )
+        
+        reply = await self.llm.ainvoke([self._persona, HumanMessage(content=prompt)])
+        return self._parse_interaction_result(reply.content, user_input, user_context)
+    
+    async def _kickoff(self, task: Task) -> Any:
+        """
+        Run a single task through a copy of the agent's crew without blocking the
+        event loop. Crew.copy() also copies the agent, so concurrent kickoffs do
+        not overwrite each other's executor.
+        """
+        return await self._crew.model_copy(update={'tasks': [task]}).copy().kickoff_async()
+    
+    def _classify_interaction(self, user_input: str, user_context: UserContext) -> InteractionType:
         """Classify the type of user interaction to tailor the response."""
         # Simple classification logic - could be enhanced with ML
         user_input_lower = user_input.lower()
         
-        greeting_words = ['hello', 'hi', 'hey', 'good morning', 'good afternoon']
-        question_words = ['what', 'how', 'why', 'when', 'where', 'which', 'who']
-        complaint_words = ['problem', 'issue', 'wrong', 'error', 'broken', 'not working']
-        help_words = ['help', 'support', 'assistance', 'guide', 'tutorial']
-        
-        if any(word in user_input_lower for word in greeting_words):
-            return InteractionType.GREETING
-        elif any(word in user_input_lower for word in complaint_words):
-            return InteractionType.COMPLAINT
-        elif any(word in user_input_lower for word in help_words):
-            return InteractionType.HELP_REQUEST
-        elif any(user_input_lower.startswith(word) for word in question_words):
+        for pattern, interaction_type in _KEYWORD_TYPES:
+            if pattern.search(user_input_lower):
+                return interaction_type
+        if user_input_lower.startswith(_QUESTION_WORDS):
             return InteractionType.QUESTION
-        elif 'feedback' in user_input_lower or 'suggestion' in user_input_lower:
+        if _FEEDBACK_PATTERN.search(user_input_lower):
             return InteractionType.FEEDBACK
-        else:
-            return InteractionType.TASK_REQUEST
+        return InteractionType.TASK_REQUEST
+    
+    def _context_fingerprint(self, user_context: UserContext) -> str:
+        """Hash of the user's mood and latest interactions, which a cached response must share."""
+        recent = user_context.history[-CONTEXT_CHAIN_LENGTH:] if user_context.history else []
+        chain = orjson.dumps([user_context.current_mood, recent],
+                             option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        return hashlib.sha256(chain).hexdigest()[:16]
     
     def _format_user_context(self, user_context: UserContext) -> str:
         """Format user context for inclusion in prompts."""
-        recent_interactions = user_context.history[-5:] if user_context.history else []
-        
-        return f"""
-        User ID: {user_context.user_id}
-        Session ID: {user_context.session_id}
-        Current Mood: {user_context.current_mood}
-        Total Interactions: {user_context.interaction_count}
-        Last Interaction: {user_context.last_interaction}
-        
-        Preferences: {json.dumps(user_context.preferences, indent=2)}
-        
-        Recent Interaction History:
-        {json.dumps(recent_interactions, indent=2)}
-        """
+        recent_interactions = _to_json(user_context.history[-5:]) if user_context.history else '[]'
+        
+        return _USER_CONTEXT_TMPL.substitute(
+            user_id=user_context.user_id,
+            session_id=user_context.session_id,
+            current_mood=user_context.current_mood,
+            interaction_count=user_context.interaction_count,
+            last_interaction=user_context.last_interaction,
+            preferences=user_context.preferences_json(),
+            recent_interactions=recent_interactions
+        )
     
     def _parse_interaction_result(self, result: str, user_input: str, 
                                 user_context: UserContext) -> InteractionResponse:
         """Parse the AI agent's response into a structured format."""
         try:
-            # Try to extract JSON from the result
-            import re
-            json_match = re.search(r'\{.*\}', result.replace('\n', ' '), re.DOTALL)
-            if json_match:
-                response_data = json.loads(json_match.group())
+            # Decode the JSON object starting at the first brace, ignoring any
+            # text the model wrapped around it. orjson takes the usual case of
+            # a single clean object; anything it rejects, such as trailing
+            # braces in prose or raw newlines in strings, goes to raw_decode
+            start = result.find('{')
+            if start != -1:
+                try:
+                    response_data = orjson.loads(result[start:result.rindex('}') + 1])
+                except orjson.JSONDecodeError:
+                    response_data, _ = _JSON_DECODER.raw_decode(result, start)
             else:
                 # Fallback parsing
                 response_data = {'user_message': result}
@@ -426,10 +625,10 @@ class SerfFrontendAgent:
             )
     
     def _record_interaction(self, user_input: str, response: InteractionResponse, 
-                          user_context: UserContext):
+                          user_context: UserContext, timestamp: str):
         """Record the interaction for learning and improvement."""
         interaction_record = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'user_id': user_context.user_id,
             'session_id': user_context.session_id,
             'user_input': user_input,
@@ -440,16 +639,33 @@ class SerfFrontendAgent:
             'escalation_required': response.requires_escalation
         }
         
+        if len(self.interaction_history) == INTERACTION_HISTORY_LIMIT:
+            # The oldest record drops off the full history on append; it is
+            # also the oldest of its user's records
+            dropped_user = self.interaction_history[0]['user_id']
+            user_history = self._history_by_user[dropped_user]
+            user_history.popleft()
+            if not user_history:
+                del self._history_by_user[dropped_user]
         self.interaction_history.append(interaction_record)
-        
-        # Keep only recent interactions in memory
-        if len(self.interaction_history) > 1000:
-            self.interaction_history = self.interaction_history[-500:]
+        self._history_by_user[user_context.user_id].append(interaction_record)
+        
+        slot = self._recorded % METRICS_WINDOW
+        self._sat[slot] = min(max(round(float(response.user_satisfaction_prediction) * 100), 0), 100)
+        self._delegated[slot] = response.requires_delegation
+        self._escalated[slot] = response.requires_escalation
+        self._metric_users[slot] = user_context.user_id
+        self._recorded += 1
     
-    def _update_user_context(self, user_context: UserContext, response: InteractionResponse):
+    def _update_user_context(self, user_context: UserContext, user_input: str,
+                             response: InteractionResponse, timestamp: str):
         """Update user context based on the interaction."""
         user_context.interaction_count += 1
-        user_context.last_interaction = datetime.now().isoformat()
+        user_context.last_interaction = timestamp
+        
+        # Timestamps stay out of the entry so equal conversations fingerprint alike
+        user_context.history.append({'user_input': user_input, 'agent_response': response.message})
+        del user_context.history[:-USER_CONTEXT_HISTORY_LIMIT]
         
         # Simple mood tracking based on predicted satisfaction
         if response.user_satisfaction_prediction > 0.8:
@@ -480,24 +696,19 @@ class SerfFrontendAgent:
     def get_interaction_history(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get interaction history, optionally filtered by user."""
         if user_id:
-            return [interaction for interaction in self.interaction_history 
-                   if interaction['user_id'] == user_id]
-        return self.interaction_history.copy()
+            return list(self._history_by_user.get(user_id, ()))
+        return list(self.interaction_history)
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics for the Serf Frontend Agent."""
-        if not self.interaction_history:
+        total_interactions = min(self._recorded, METRICS_WINDOW)
+        if not total_interactions:
             return {'total_interactions': 0}
         
-        total_interactions = len(self.interaction_history)
-        avg_satisfaction = sum(i['satisfaction_prediction'] for i in self.interaction_history) / total_interactions
-        delegations = sum(1 for i in self.interaction_history if i['delegation_required'])
-        escalations = sum(1 for i in self.interaction_history if i['escalation_required'])
-        
         return {
             'total_interactions': total_interactions,
-            'average_satisfaction_prediction': avg_satisfaction,
-            'delegation_rate': delegations / total_interactions,
-            'escalation_rate': escalations / total_interactions,
-            'unique_users': len(set(i['user_id'] for i in self.interaction_history))
+            'average_satisfaction_prediction': float(self._sat[:total_interactions].mean()) / 100,
+            'delegation_rate': np.count_nonzero(self._delegated[:total_interactions]) / total_interactions,
+            'escalation_rate': np.count_nonzero(self._escalated[:total_interactions]) / total_interactions,
+            'unique_users': len(set(self._metric_users[:total_interactions]))
         }
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""WSGI entry point for the agent API.
+
+Run with a single threaded worker so every request thread shares the
+agents' event loop and Flask-SocketIO's in-process session state:
+
+    gunicorn -w 1 --threads 100 -b 0.0.0.0:5000 wsgi:app
+"""
+
+from app import app, socketio  # noqa: F401